@@ -29,6 +29,14 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
+    # Callers that manage their own transaction (the query plan tests) pass a connection in.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
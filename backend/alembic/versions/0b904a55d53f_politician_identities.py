@@ -0,0 +1,25 @@
+"""Politician identity map."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0b904a55d53f"
+down_revision = "7d4036f698fc"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "politician_identities",
+        sa.Column("slug", sa.String(), nullable=False),
+        sa.Column("mp_id", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("party", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["mp_id"], ["mps.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("slug"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("politician_identities")
@@ -0,0 +1,23 @@
+"""Indexes backing keyset pagination of MPs and motions."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "3f8a2c6d9e1b"
+down_revision = "5c1e7b9d2f40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_mps_name_id", "mps", ["name", "id"])
+    op.create_index(
+        "ix_motions_date_sort_id",
+        "motions",
+        [sa.text("COALESCE(date, DATE '0001-01-01') DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_motions_date_sort_id", table_name="motions")
+    op.drop_index("ix_mps_name_id", table_name="mps")
@@ -0,0 +1,24 @@
+"""Dataset version used to invalidate API response caches."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "5c1e7b9d2f40"
+down_revision = "acd9282687c8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "dataset_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(table, [{"id": 1, "version": 1}])
+
+
+def downgrade() -> None:
+    op.drop_table("dataset_version")
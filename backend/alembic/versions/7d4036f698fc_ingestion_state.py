@@ -0,0 +1,24 @@
+"""Ingestion checkpoints."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "7d4036f698fc"
+down_revision = "91fa3f12de3c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_state",
+        sa.Column("resource", sa.String(), nullable=False),
+        sa.Column("high_water_date", sa.Date(), nullable=True),
+        sa.Column("cursor", sa.JSON(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("resource"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ingestion_state")
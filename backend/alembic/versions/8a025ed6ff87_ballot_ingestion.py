@@ -0,0 +1,30 @@
+"""Per-MP ballot ingestion."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "8a025ed6ff87"
+down_revision = "0b904a55d53f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("motions", sa.Column("division_url", sa.String(), nullable=True))
+
+    # Keep the earliest record for any (motion, MP) pair before enforcing uniqueness.
+    op.execute(
+        """
+        DELETE FROM vote_records AS duplicate
+        USING vote_records AS kept
+        WHERE duplicate.motion_id = kept.motion_id
+          AND duplicate.mp_id = kept.mp_id
+          AND duplicate.id > kept.id
+        """
+    )
+    op.create_unique_constraint("uq_vote_records_motion_mp", "vote_records", ["motion_id", "mp_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_vote_records_motion_mp", "vote_records", type_="unique")
+    op.drop_column("motions", "division_url")
@@ -0,0 +1,19 @@
+"""Current-term columns on MPs."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "9d2e6f4a8b13"
+down_revision = "e5b9a0c3d71f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("mps", sa.Column("term_start", sa.Date(), nullable=True))
+    op.add_column("mps", sa.Column("is_current", sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("mps", "is_current")
+    op.drop_column("mps", "term_start")
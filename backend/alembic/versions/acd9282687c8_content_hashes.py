@@ -0,0 +1,21 @@
+"""Content hashes for change detection."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "acd9282687c8"
+down_revision = "8a025ed6ff87"
+branch_labels = None
+depends_on = None
+
+TABLES = ("mps", "motions", "spending_entries", "transparency_entries")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("content_hash", sa.String(length=40), nullable=True))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, "content_hash")
@@ -0,0 +1,43 @@
+"""Full-text search columns and trigram indexes."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "c47d1e8b2a95"
+down_revision = "3f8a2c6d9e1b"
+branch_labels = None
+depends_on = None
+
+# (table, weight-A column, weight-B column)
+DOCUMENTS = (("motions", "title", "description"), ("speeches", "title", "content"))
+LANGUAGES = (("en", "english"), ("fr", "french"))
+TRIGRAM_COLUMNS = ("name", "riding")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, title, body in DOCUMENTS:
+        for suffix, config in LANGUAGES:
+            expression = (
+                f"setweight(to_tsvector('{config}', coalesce({title}, '')), 'A') || "
+                f"setweight(to_tsvector('{config}', coalesce({body}, '')), 'B')"
+            )
+            op.add_column(
+                table,
+                sa.Column(f"search_{suffix}", postgresql.TSVECTOR(), sa.Computed(expression, persisted=True)),
+            )
+            op.create_index(f"ix_{table}_search_{suffix}", table, [f"search_{suffix}"], postgresql_using="gin")
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f"ix_mps_{column}_trgm", "mps", [column], postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f"ix_mps_{column}_trgm", table_name="mps")
+    for table, _, _ in reversed(DOCUMENTS):
+        for suffix, _ in reversed(LANGUAGES):
+            op.drop_index(f"ix_{table}_search_{suffix}", table_name=table)
+            op.drop_column(table, f"search_{suffix}")
@@ -0,0 +1,32 @@
+"""Indexes matched to the MP and motion service queries."""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e5b9a0c3d71f"
+down_revision = "c47d1e8b2a95"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # vote_records(motion_id, ...) is already served by uq_vote_records_motion_mp.
+    op.create_index("ix_vote_records_mp_id_motion_id", "vote_records", ["mp_id", "motion_id"])
+    op.create_index("ix_speeches_mp_id_date", "speeches", ["mp_id", sa.text("date DESC NULLS LAST")])
+    op.create_index("ix_spending_entries_mp_id_fiscal_year", "spending_entries", ["mp_id", "fiscal_year"])
+    op.create_index(
+        "ix_transparency_entries_mp_id_filed_date",
+        "transparency_entries",
+        ["mp_id", sa.text("filed_date DESC NULLS LAST")],
+    )
+    op.create_index("ix_motions_introduced_by_mp_id", "motions", ["introduced_by_mp_id"])
+    op.create_index("ix_motions_categories", "motions", ["categories"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_motions_categories", table_name="motions")
+    op.drop_index("ix_motions_introduced_by_mp_id", table_name="motions")
+    op.drop_index("ix_transparency_entries_mp_id_filed_date", table_name="transparency_entries")
+    op.drop_index("ix_spending_entries_mp_id_fiscal_year", table_name="spending_entries")
+    op.drop_index("ix_speeches_mp_id_date", table_name="speeches")
+    op.drop_index("ix_vote_records_mp_id_motion_id", table_name="vote_records")
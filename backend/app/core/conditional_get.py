@@ -0,0 +1,110 @@
+"""HTTP conditional GET for the read API.
+
+Database-backed responses under the API prefix are a function of the route,
+its query parameters and the dataset version, so the strong ETag is derived
+from exactly those and ``Last-Modified`` is the time the version was bumped.
+That lets ``If-None-Match``/``If-Modified-Since`` be answered with a ``304``
+before the request reaches a router, i.e. without a single ORM query.
+
+Routes that also read other state (the lookup endpoints answer from the
+postal code index and the riding boundary file) must be listed in
+``exclude``; they get no validators at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+def make_etag(version: int, path: str, query_string: str) -> str:
+    query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+    digest = hashlib.sha1(f"{path}?{query}".encode("utf-8")).hexdigest()[:16]
+    return f'"v{version}-{digest}"'
+
+
+def _http_date(moment: datetime) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return format_datetime(moment.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalGetMiddleware:
+    def __init__(
+        self,
+        app,
+        prefix: str,
+        current_version: Callable[[], int],
+        last_modified: Callable[[], Optional[datetime]],
+        exclude: Sequence[str] = (),
+    ):
+        self.app = app
+        self.prefix = prefix
+        self.exclude = tuple(exclude)
+        self.current_version = current_version
+        self.last_modified = last_modified
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not path.startswith(self.prefix)
+            or path.startswith(self.exclude)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        etag = make_etag(self.current_version(), scope["path"], scope["query_string"].decode("latin-1"))
+        modified_at = self.last_modified()
+        validators: Headers = [(b"etag", etag.encode("ascii"))]
+        if modified_at is not None:
+            validators.append((b"last-modified", _http_date(modified_at).encode("ascii")))
+
+        headers = {name.lower(): value.decode("latin-1") for name, value in scope["headers"]}
+        if_none_match = headers.get(b"if-none-match")
+        if_modified_since = headers.get(b"if-modified-since")
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, etag)
+        else:
+            not_modified = bool(if_modified_since and modified_at and _not_modified_since(if_modified_since, modified_at))
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": [*validators, (b"cache-control", b"no-cache")]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def add_validators(message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                response_headers: Headers = list(message.get("headers", []))
+                names = {name.lower() for name, _ in response_headers}
+                if b"etag" not in names:
+                    response_headers.extend(validators)
+                if b"cache-control" not in names:
+                    # Browsers must revalidate rather than guess a freshness lifetime from Last-Modified.
+                    response_headers.append((b"cache-control", b"no-cache"))
+                message = {**message, "headers": response_headers}
+            await send(message)
+
+        await self.app(scope, receive, add_validators)
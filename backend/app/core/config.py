@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -18,17 +18,128 @@ class Settings(BaseSettings):
     )
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    DB_ASYNC: bool = Field(
+        default=False,
+        description="Serve the MP and motion routers from an asyncpg-backed AsyncEngine instead of threadpool handlers.",
+    )
+    ASYNC_DATABASE_URL: Optional[str] = Field(
+        default=None,
+        description="Connection string for the async engine; defaults to DATABASE_URL with the asyncpg driver.",
+    )
 
     ALEMBIC_CONFIG: str = "alembic.ini"
 
     CORS_ALLOWED_ORIGINS: List[str] = Field(default_factory=lambda: ["*"])
 
+    API_CACHE_MAX_AGE: int = Field(
+        default=60,
+        description="max-age (seconds) advertised in Cache-Control on cacheable API responses.",
+    )
+    API_PAGE_SIZE: int = Field(default=50, description="Page size of list routes called without a limit.")
+    API_MAX_PAGE_SIZE: int = 500
+    PROFILE_RECENT_VOTES: int = Field(
+        default=20,
+        description="Most recent votes embedded in an MP profile; the rest are paged from /mps/{id}/voting-record.",
+    )
+    API_ETAGS_ENABLED: bool = Field(
+        default=True,
+        description="Send dataset-version ETag/Last-Modified on API GETs and answer revalidations with 304.",
+    )
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache GET API responses in process, invalidated whenever the dataset version changes.",
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+    DATASET_VERSION_POLL_SECONDS: float = Field(
+        default=5.0,
+        description="How often each API worker checks the dataset version bumped by ingestion and writes.",
+    )
+    MP_SUGGEST_MAX_RESULTS: int = Field(
+        default=20,
+        description="Largest limit accepted by /mps/suggest; also the number of ids kept per typeahead trie node.",
+    )
+
     LOG_LEVEL: str = "INFO"
     LOAD_DEMO_DATA: bool = Field(
         default=True,
         description="Seed a small set of demo records when the database is empty.",
     )
 
+    INGEST_USER_AGENT: str = "RateMyMP-Ingest/0.1 (+https://github.com/emilyqqian/RateMyMP)"
+    INGEST_HTTP_TIMEOUT: float = 30.0
+    INGEST_HTTP_CONNECT_TIMEOUT: float = 10.0
+    INGEST_HTTP_MAX_CONNECTIONS: int = 20
+    INGEST_HTTP_MAX_KEEPALIVE: int = 10
+    INGEST_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    INGEST_HTTP2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 for ingestion fetches (requires the optional h2 package).",
+    )
+    INGEST_CONCURRENCY: int = Field(
+        default=8,
+        description="Maximum concurrent ingestion fetches; 1 restores fully sequential downloads.",
+    )
+    INGEST_RATE_PER_HOST: float = Field(
+        default=10.0,
+        description="Sustained requests per second allowed to each upstream host; 0 disables the limit.",
+    )
+    INGEST_RATE_BURST: float = 20.0
+    INGEST_RETRY_ATTEMPTS: int = Field(default=6, description="Attempts per request before a transient failure is raised.")
+    INGEST_RETRY_BACKOFF_BASE: float = 0.5
+    INGEST_RETRY_BACKOFF_MAX: float = 60.0
+    INGEST_BREAKER_THRESHOLD: int = Field(
+        default=5,
+        description="Consecutive failures that open a host's circuit breaker.",
+    )
+    INGEST_BREAKER_COOLDOWN: float = 30.0
+    INGEST_BATCH_SIZE: int = Field(default=1000, description="Rows per bulk upsert statement and commit.")
+    INGEST_CACHE_ENABLED: bool = True
+    INGEST_CACHE_DIR: str = Field(
+        default=".ingest_cache",
+        description="Directory holding the on-disk OpenParliament response cache.",
+    )
+    INGEST_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    INGEST_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    INGEST_ARCHIVE_ENABLED: bool = Field(
+        default=True,
+        description="Append every raw fetched document to the local archive used by ingest.py --replay.",
+    )
+    INGEST_ARCHIVE_DIR: str = ".ingest_archive"
+    INGEST_ARCHIVE_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    INGEST_ARCHIVE_RETENTION_DAYS: int = Field(
+        default=90,
+        description="Delete archive segments older than this many days when a run opens the archive; 0 keeps all.",
+    )
+    INGEST_STAGE_TIMEOUT: float = Field(
+        default=4 * 3600,
+        description="Seconds an ingestion stage may run before it is abandoned; 0 disables the limit.",
+    )
+    INGEST_ABANDONED_STAGE_GRACE: float = Field(
+        default=60,
+        description="Seconds to wait at exit for abandoned stages to finish before shared clients are closed.",
+    )
+    INGEST_SPENDING_FIRST_YEAR: int = Field(
+        default=2021,
+        description="Earliest fiscal year requested by a spending backfill.",
+    )
+    POSTAL_INDEX_PATH: str = Field(
+        default="data/postal_ridings.idx",
+        description="Compiled postal code -> riding index built by `python -m app.services.postal_index build`.",
+    )
+    RIDING_MP_CACHE_SECONDS: int = Field(
+        default=300,
+        description="How long the riding -> current MP mapping used by postal code lookups is kept.",
+    )
+    LOOKUP_BATCH_MAX: int = 10000
+    RIDING_BOUNDARIES_PATH: str = Field(
+        default="data/riding_boundaries.geojson",
+        description="GeoJSON (WGS84) export of the riding boundary polygons used by coordinate lookups.",
+    )
+    RIDING_BOUNDARIES_NAME_PROPERTY: Optional[str] = None
+    RIDING_BOUNDARIES_CELL_DEGREES: float = 0.25
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,213 @@
+"""In-process LRU/TTL cache for GET API responses.
+
+Entries are keyed by path and normalized query string and tagged with the
+dataset version current when the request started. An entry from an older
+version is never served; when the worker's ``DatasetVersionTracker`` sees a
+new version the whole cache is dropped at once. Memory is bounded by both an
+entry count and a byte budget, evicting least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Headers
+    body: bytes
+    version: int
+    stored_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers)
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # A single response may use at most this share of the byte budget.
+        self.max_entry_bytes = max_bytes // 8
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_drops = 0
+        self.invalidations = 0
+        self.version = 0
+
+    @staticmethod
+    def key(path: str, query_string: str) -> str:
+        query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+        return f"{path}?{query}" if query else path
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key: str, version: int) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version != version:
+                self._drop(key)
+                self.stale_drops += 1
+                entry = None
+            elif entry is not None and time.monotonic() - entry.stored_at > self.ttl:
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_entry_bytes:
+            return
+        with self._lock:
+            if entry.version < self.version:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, version: int) -> None:
+        """Drop every entry; registered as the dataset version listener."""
+
+        with self._lock:
+            self.version = max(self.version, version)
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "stale_drops": self.stale_drops,
+                "invalidations": self.invalidations,
+            }
+
+
+def _header(headers: Headers, name: bytes) -> bytes:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.lower()
+    return b""
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cached ``200`` GET responses under ``prefix``.
+
+    Requests carrying credentials or ``Cache-Control: no-store`` bypass the
+    cache, and so do responses that set cookies or are marked private/no-store.
+    Paths under any of ``exclude`` are never cached, for routes whose answer
+    depends on more than the dataset version.
+    """
+
+    def __init__(
+        self,
+        app,
+        cache: ResponseCache,
+        prefix: str,
+        current_version: Callable[[], int],
+        exclude: Sequence[str] = (),
+    ):
+        self.app = app
+        self.cache = cache
+        self.prefix = prefix
+        self.exclude = tuple(exclude)
+        self.current_version = current_version
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not path.startswith(self.prefix)
+            or path.startswith(self.exclude)
+        ):
+            await self.app(scope, receive, send)
+            return
+        request_headers: Headers = scope["headers"]
+        request_cache_control = _header(request_headers, b"cache-control")
+        if _header(request_headers, b"authorization") or b"no-store" in request_cache_control:
+            await self.app(scope, receive, send)
+            return
+
+        version = self.current_version()
+        key = self.cache.key(scope["path"], scope["query_string"].decode("latin-1"))
+        cached = None if b"no-cache" in request_cache_control else self.cache.get(key, version)
+        if cached is not None:
+            age = str(int(time.monotonic() - cached.stored_at)).encode("ascii")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": cached.status,
+                    "headers": [*cached.headers, (b"x-cache", b"HIT"), (b"age", age)],
+                }
+            )
+            await send({"type": "http.response.body", "body": cached.body})
+            return
+
+        start: Dict[str, Any] = {}
+        chunks: Optional[List[bytes]] = []
+        size = 0
+
+        async def capture(message) -> None:
+            nonlocal chunks, size
+            if message["type"] == "http.response.start":
+                start.update(message)
+                message = {**message, "headers": [*message.get("headers", []), (b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and chunks is not None:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.cache.max_entry_bytes:
+                    # The body can no longer fit in the cache; stop collecting it.
+                    chunks = None
+                else:
+                    chunks.append(body)
+                if chunks is not None and not message.get("more_body", False):
+                    self._store(key, version, start, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+    def _store(self, key: str, version: int, start: Dict[str, Any], body: bytes) -> None:
+        headers: Headers = list(start.get("headers", []))
+        cache_control = _header(headers, b"cache-control")
+        if start.get("status") != 200 or _header(headers, b"set-cookie"):
+            return
+        if b"no-store" in cache_control or b"private" in cache_control:
+            return
+        self.cache.put(key, CachedResponse(200, headers, body, version, time.monotonic()))
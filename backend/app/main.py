@@ -1,10 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.conditional_get import ConditionalGetMiddleware
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import dispose_async_engine, init_db
+from app.core.response_cache import ResponseCache, ResponseCacheMiddleware
 from app.routers import api_router
+from app.services.dataset_version import dataset_versions
 from app.services.demo_data import seed_demo_data
+from app.services.mp_suggest import mp_suggestions
+from app.services.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from app.utils.logging import configure_logging
 
 configure_logging()
@@ -14,17 +19,62 @@ if settings.LOAD_DEMO_DATA:
 
 app = FastAPI(title=settings.APP_NAME, version=settings.VERSION)
 
+# Lookups answer from the postal code index and boundary files, which the dataset version does not track.
+UNVERSIONED_PREFIXES = (f"{settings.API_V1_STR}/lookup",)
+
+response_cache = ResponseCache(
+    settings.RESPONSE_CACHE_MAX_ENTRIES,
+    settings.RESPONSE_CACHE_MAX_BYTES,
+    settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+if settings.RESPONSE_CACHE_ENABLED:
+    dataset_versions.subscribe(response_cache.invalidate)
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        cache=response_cache,
+        prefix=settings.API_V1_STR,
+        current_version=lambda: dataset_versions.version,
+        exclude=UNVERSIONED_PREFIXES,
+    )
+if settings.API_ETAGS_ENABLED:
+    # Added after the cache so it runs first: revalidations are answered before the cache or a router is touched.
+    app.add_middleware(
+        ConditionalGetMiddleware,
+        prefix=settings.API_V1_STR,
+        current_version=lambda: dataset_versions.version,
+        last_modified=lambda: dataset_versions.updated_at,
+        exclude=UNVERSIONED_PREFIXES,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+def start_dataset_version_tracker():
+    dataset_versions.start()
+    mp_suggestions.warm()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    dataset_versions.stop()
+    await dispose_async_engine()
+
+
 @app.get("/health", tags=["meta"])
 def health_check():
     return {"status": "ok", "service": settings.APP_NAME, "version": settings.VERSION}
+
+
+@app.get("/health/cache", tags=["meta"])
+def response_cache_stats():
+    return {"enabled": settings.RESPONSE_CACHE_ENABLED, **response_cache.stats()}
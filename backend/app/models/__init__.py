@@ -1,5 +1,8 @@
+from app.models.dataset_version import DatasetVersion
+from app.models.ingestion_state import IngestionState
 from app.models.motion import Motion
 from app.models.mp import MP
+from app.models.politician_identity import PoliticianIdentity
 from app.models.vote_record import VoteRecord
 from app.models.speech import Speech
 from app.models.spending_entry import SpendingEntry
@@ -12,4 +15,7 @@ __all__ = [
     "Speech",
     "SpendingEntry",
     "TransparencyEntry",
+    "IngestionState",
+    "PoliticianIdentity",
+    "DatasetVersion",
 ]
@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, func
+
+from app.core.database import Base
+
+
+class DatasetVersion(Base):
+    __tablename__ = "dataset_version"
+
+    # Single row (id=1) bumped whenever ingestion or a write endpoint commits changes.
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,12 @@
+from sqlalchemy import JSON, Column, Date, DateTime, String, func
+
+from app.core.database import Base
+
+
+class IngestionState(Base):
+    __tablename__ = "ingestion_state"
+
+    resource = Column(String, primary_key=True)
+    high_water_date = Column(Date)
+    cursor = Column(JSON)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -1,5 +1,6 @@
-from sqlalchemy import ARRAY, Boolean, Column, Date, Enum, ForeignKey, Integer, JSON, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, Date, Enum, ForeignKey, Index, Integer, JSON, String, func, literal_column
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 from app.models.enums import MotionClassification
@@ -14,7 +15,10 @@ class Motion(Base):
     introduced_by_mp_id = Column(Integer, ForeignKey("mps.id"), nullable=False)
     introduced_by_party = Column(String)
     vote_results_by_party = Column(JSON)
+    # OpenParliament vote the party summary and per-MP ballots were taken from.
+    division_url = Column(String)
     passed = Column(Boolean, default=False)
+    # The PostgreSQL ARRAY type provides contains() (@>), which the GIN index below serves.
     categories = Column(ARRAY(String))
     classification = Column(
         Enum(
@@ -25,7 +29,40 @@ class Motion(Base):
         nullable=False,
     )
     date = Column(Date)
+    # sha1 of the last ingested normalized row; lets ingestion skip unchanged records.
+    content_hash = Column(String(40))
+    # Full-text search documents maintained by PostgreSQL; deferred so listings never load them.
+    search_en = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+    search_fr = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('french', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('french', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
 
     introduced_by_mp = relationship("MP", back_populates="motions")
     votes = relationship("VoteRecord", back_populates="motion", cascade="all,delete")
     speeches = relationship("Speech", back_populates="motion", cascade="all,delete")
+
+
+# Newest first with undated motions last. The placeholder date is an inline
+# constant rather than a bind parameter so queries match the index expression.
+MOTION_DATE_SORT = func.coalesce(Motion.date, literal_column("DATE '0001-01-01'"))
+Index("ix_motions_date_sort_id", MOTION_DATE_SORT.desc(), Motion.id.desc())
+Index("ix_motions_introduced_by_mp_id", Motion.introduced_by_mp_id)
+Index("ix_motions_categories", Motion.categories, postgresql_using="gin")
+Index("ix_motions_search_en", Motion.search_en, postgresql_using="gin")
+Index("ix_motions_search_fr", Motion.search_fr, postgresql_using="gin")
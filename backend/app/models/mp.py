@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Boolean, Column, Date, Float, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -6,6 +6,12 @@ from app.core.database import Base
 
 class MP(Base):
     __tablename__ = "mps"
+    __table_args__ = (
+        Index("ix_mps_name_id", "name", "id"),
+        # pg_trgm indexes serve both fuzzy search and the ILIKE '%term%' filter of list_mps.
+        Index("ix_mps_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_mps_riding_trgm", "riding", postgresql_using="gin", postgresql_ops={"riding": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -15,6 +21,12 @@ class MP(Base):
     attendance_rate = Column(Float)
     party_line_voting_rate = Column(Float)
     years_in_office = Column(Integer)
+    # Latest House membership: when it started and whether it is still open.
+    # Ridings keep their former members, so these pick the sitting one.
+    term_start = Column(Date)
+    is_current = Column(Boolean)
+    # sha1 of the last ingested normalized row; lets ingestion skip unchanged records.
+    content_hash = Column(String(40))
 
     motions = relationship("Motion", back_populates="introduced_by_mp", cascade="all,delete")
     votes = relationship("VoteRecord", back_populates="mp", cascade="all,delete")
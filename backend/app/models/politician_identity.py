@@ -0,0 +1,13 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from app.core.database import Base
+
+
+class PoliticianIdentity(Base):
+    __tablename__ = "politician_identities"
+
+    slug = Column(String, primary_key=True)
+    # NULL once the MP row is deleted; such rows are ignored and the slug is resolved again.
+    mp_id = Column(Integer, ForeignKey("mps.id", ondelete="SET NULL"), nullable=True)
+    name = Column(String)
+    party = Column(String)
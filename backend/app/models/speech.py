@@ -1,11 +1,16 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Date, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
 
 class Speech(Base):
     __tablename__ = "speeches"
+    __table_args__ = (
+        Index("ix_speeches_search_en", "search_en", postgresql_using="gin"),
+        Index("ix_speeches_search_fr", "search_fr", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     mp_id = Column(Integer, ForeignKey("mps.id"), nullable=False)
@@ -13,6 +18,31 @@ class Speech(Base):
     title = Column(String, nullable=False)
     content = Column(Text)
     date = Column(Date)
+    # Full-text search documents maintained by PostgreSQL; deferred so listings never load them.
+    search_en = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+    search_fr = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('french', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('french', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
 
     mp = relationship("MP", back_populates="speeches")
     motion = relationship("Motion", back_populates="speeches")
+
+
+# Matches the per-MP listing order (newest speech first, undated last).
+Index("ix_speeches_mp_id_date", Speech.mp_id, Speech.date.desc().nullslast())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -6,6 +6,7 @@ from app.core.database import Base
 
 class SpendingEntry(Base):
     __tablename__ = "spending_entries"
+    __table_args__ = (Index("ix_spending_entries_mp_id_fiscal_year", "mp_id", "fiscal_year"),)
 
     id = Column(Integer, primary_key=True, index=True)
     mp_id = Column(Integer, ForeignKey("mps.id"), nullable=False)
@@ -13,5 +14,7 @@ class SpendingEntry(Base):
     amount = Column(Float, nullable=False)
     fiscal_year = Column(String, nullable=False)
     details_url = Column(String)
+    # sha1 of the last ingested normalized row; lets ingestion skip unchanged records.
+    content_hash = Column(String(40))
 
     mp = relationship("MP", back_populates="spending_entries")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -12,5 +12,11 @@ class TransparencyEntry(Base):
     registry_type = Column(String, nullable=False)
     details = Column(Text)
     filed_date = Column(Date)
+    # sha1 of the last ingested normalized row; lets ingestion skip unchanged records.
+    content_hash = Column(String(40))
 
     mp = relationship("MP", back_populates="transparency_entries")
+
+
+# Matches the per-MP listing order (newest filing first, undated last).
+Index("ix_transparency_entries_mp_id_filed_date", TransparencyEntry.mp_id, TransparencyEntry.filed_date.desc().nullslast())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, ForeignKey, Integer
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -7,6 +7,11 @@ from app.models.enums import VoteChoice
 
 class VoteRecord(Base):
     __tablename__ = "vote_records"
+    # The unique (motion_id, mp_id) index also serves lookups by motion; voting records read by MP.
+    __table_args__ = (
+        UniqueConstraint("motion_id", "mp_id", name="uq_vote_records_motion_mp"),
+        Index("ix_vote_records_mp_id_motion_id", "mp_id", "motion_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     mp_id = Column(Integer, ForeignKey("mps.id"), nullable=False)
@@ -1,8 +1,17 @@
 from fastapi import APIRouter
 
-from app.routers import lookup, motions, mps
+from app.core.config import settings
+from app.routers import lookup
+
+if settings.DB_ASYNC:
+    from app.routers import async_motions as motions
+    from app.routers import async_mps as mps
+    from app.routers import async_search as search
+else:
+    from app.routers import motions, mps, search
 
 api_router = APIRouter()
 api_router.include_router(motions.router, prefix="/motions", tags=["motions"])
 api_router.include_router(mps.router, prefix="/mps", tags=["mps"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(lookup.router, prefix="/lookup", tags=["lookup"])
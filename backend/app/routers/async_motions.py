@@ -0,0 +1,49 @@
+"""Async variants of the ``motions`` routes, mounted instead of them when ``DB_ASYNC`` is set."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.schemas import AISummaryResponse, Motion, MotionVoteRequest, MotionVoteResponse
+from app.services.motion_service import AsyncMotionService
+from app.services.pagination import PageParams, apply_page_headers
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[Motion])
+async def list_motions(
+    response: Response,
+    category: Optional[str] = Query(None, description="Filter motions by category tag"),
+    paging: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncMotionService(db)
+    page = await service.list_motions(category=category, limit=paging.limit, cursor=paging.cursor)
+    total = await service.count_motions(category=category) if paging.include_total else None
+    return apply_page_headers(response, page, total)
+
+
+@router.get("/{motion_id}", response_model=Motion)
+async def get_motion(motion_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMotionService(db).get_motion(motion_id)
+
+
+@router.get("/{motion_id}/ai-summary", response_model=AISummaryResponse)
+async def get_motion_ai_summary(motion_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMotionService(db).get_ai_summary(motion_id)
+
+
+@router.post("/{motion_id}/vote", response_model=MotionVoteResponse)
+async def vote_on_motion(
+    motion_id: int,
+    payload: MotionVoteRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncMotionService(db).vote_on_motion(
+        motion_id=motion_id,
+        mp_id=payload.mp_id,
+        vote=payload.vote,
+    )
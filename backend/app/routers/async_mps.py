@@ -0,0 +1,103 @@
+"""Async variants of the ``mps`` routes, mounted instead of them when ``DB_ASYNC`` is set."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.schemas import (
+    MP,
+    MPActivity,
+    MPProfile,
+    MPSpendingSummary,
+    MPSuggestion,
+    MPTransparencySummary,
+    MPVotingRecord,
+    Speech,
+)
+from app.services.mp_service import PROFILE_SECTIONS, AsyncMPService, parse_profile_sections
+from app.services.mp_suggest import mp_suggestions
+from app.services.pagination import PageParams, apply_page_headers
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[MP])
+async def list_mps(
+    response: Response,
+    search: Optional[str] = Query(
+        None,
+        min_length=1,
+        description="Optional search string that matches MP name or riding",
+    ),
+    paging: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncMPService(db)
+    page = await service.list_mps(search=search, limit=paging.limit, cursor=paging.cursor)
+    total = await service.count_mps(search=search) if paging.include_total else None
+    return apply_page_headers(response, page, total)
+
+
+# Synchronous on purpose: it never touches the AsyncSession, and the threadpool absorbs the one-off index build.
+@router.get("/suggest", response_model=List[MPSuggestion])
+def suggest_mps(
+    q: str = Query(..., min_length=1, max_length=100, description="Partial MP name or riding"),
+    limit: int = Query(8, ge=1, le=settings.MP_SUGGEST_MAX_RESULTS),
+):
+    return mp_suggestions.suggest(q, limit)
+
+
+@router.get("/{mp_id}", response_model=MP)
+async def get_mp(mp_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMPService(db).get_mp(mp_id)
+
+
+@router.get("/{mp_id}/voting-record", response_model=List[MPVotingRecord])
+async def get_voting_record(
+    mp_id: int,
+    response: Response,
+    paging: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    service = AsyncMPService(db)
+    page = await service.get_voting_record(mp_id, limit=paging.limit, cursor=paging.cursor)
+    total = await service.count_voting_record(mp_id) if paging.include_total else None
+    return apply_page_headers(response, page, total)
+
+
+@router.get("/{mp_id}/parliamentary-activity", response_model=MPActivity)
+async def get_parliamentary_activity(mp_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMPService(db).get_parliamentary_activity(mp_id)
+
+
+@router.get("/{mp_id}/spending", response_model=MPSpendingSummary)
+async def get_spending(mp_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMPService(db).get_spending(mp_id)
+
+
+@router.get("/{mp_id}/transparency", response_model=MPTransparencySummary)
+async def get_transparency(mp_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMPService(db).get_transparency(mp_id)
+
+
+@router.get("/{mp_id}/speeches", response_model=List[Speech])
+async def get_speeches(mp_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMPService(db).get_speeches(mp_id)
+
+
+@router.get("/{mp_id}/profile", response_model=MPProfile)
+async def get_profile(
+    mp_id: int,
+    response: Response,
+    include: Optional[str] = Query(
+        None,
+        description=f"Comma-separated sections to include ({', '.join(PROFILE_SECTIONS)}); defaults to all",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    profile = await AsyncMPService(db).get_profile(mp_id, parse_profile_sections(include))
+    response.headers["Cache-Control"] = f"public, max-age={settings.API_CACHE_MAX_AGE}"
+    return profile
@@ -0,0 +1,30 @@
+"""Async variant of the ``search`` route, mounted instead of it when ``DB_ASYNC`` is set."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.schemas import SearchHit
+from app.services.pagination import PageParams, apply_page_headers
+from app.services.search_service import AsyncSearchService, parse_kinds
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[SearchHit])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search text; quotes, OR and -term are supported"),
+    lang: str = Query("en", pattern="^(en|fr)$", description="Text search language"),
+    types: Optional[str] = Query(None, description="Comma-separated subset of motions,speeches,mps"),
+    paging: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    kinds = parse_kinds(types)
+    service = AsyncSearchService(db)
+    page = await service.search(q, lang, kinds, limit=paging.limit or settings.API_PAGE_SIZE, cursor=paging.cursor)
+    total = await service.count(q, lang, kinds) if paging.include_total else None
+    return apply_page_headers(response, page, total)
@@ -1,11 +1,33 @@
-from fastapi import APIRouter
+from typing import List
 
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.core.config import settings
+from app.schemas import CoordinateLookup, PostalCodeBatchRequest, PostalCodeLookup
 from app.services.lookup_service import LookupService
 
 router = APIRouter()
 lookup_service = LookupService()
 
 
-@router.get("/postal-code/{postal_code}")
+@router.get("/postal-code/{postal_code}", response_model=PostalCodeLookup)
 def lookup_postal_code(postal_code: str):
     return lookup_service.lookup_postal_code(postal_code)
+
+
+@router.post("/postal-codes", response_model=List[PostalCodeLookup])
+def lookup_postal_codes(payload: PostalCodeBatchRequest):
+    if len(payload.postal_codes) > settings.LOOKUP_BATCH_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.LOOKUP_BATCH_MAX} postal codes per request",
+        )
+    return lookup_service.lookup_postal_codes(payload.postal_codes)
+
+
+@router.get("/coordinates", response_model=CoordinateLookup)
+def lookup_coordinates(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude in decimal degrees (WGS84)"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude in decimal degrees (WGS84)"),
+):
+    return lookup_service.lookup_coordinates(lat, lon)
@@ -1,27 +1,27 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas import AISummaryResponse, Motion, MotionVoteRequest, MotionVoteResponse
 from app.services.motion_service import MotionService
+from app.services.pagination import PageParams, apply_page_headers
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[Motion])
 def list_motions(
+    response: Response,
     category: Optional[str] = Query(None, description="Filter motions by category tag"),
-    limit: Optional[int] = Query(
-        None,
-        ge=1,
-        le=100,
-        description="Optional maximum number of motions to return",
-    ),
+    paging: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
-    return MotionService(db).list_motions(category=category, limit=limit)
+    service = MotionService(db)
+    page = service.list_motions(category=category, limit=paging.limit, cursor=paging.cursor)
+    total = service.count_motions(category=category) if paging.include_total else None
+    return apply_page_headers(response, page, total)
 
 
 @router.get("/{motion_id}", response_model=Motion)
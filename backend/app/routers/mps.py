@@ -2,33 +2,51 @@ from typing import List
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.schemas import (
     MP,
     MPActivity,
+    MPProfile,
     MPSpendingSummary,
+    MPSuggestion,
     MPTransparencySummary,
     MPVotingRecord,
     Speech,
 )
-from app.services.mp_service import MPService
+from app.services.mp_service import PROFILE_SECTIONS, MPService, parse_profile_sections
+from app.services.mp_suggest import mp_suggestions
+from app.services.pagination import PageParams, apply_page_headers
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[MP])
 def list_mps(
+    response: Response,
     search: Optional[str] = Query(
         None,
         min_length=1,
         description="Optional search string that matches MP name or riding",
     ),
+    paging: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
-    return MPService(db).list_mps(search=search)
+    service = MPService(db)
+    page = service.list_mps(search=search, limit=paging.limit, cursor=paging.cursor)
+    total = service.count_mps(search=search) if paging.include_total else None
+    return apply_page_headers(response, page, total)
+
+
+@router.get("/suggest", response_model=List[MPSuggestion])
+def suggest_mps(
+    q: str = Query(..., min_length=1, max_length=100, description="Partial MP name or riding"),
+    limit: int = Query(8, ge=1, le=settings.MP_SUGGEST_MAX_RESULTS),
+):
+    return mp_suggestions.suggest(q, limit)
 
 
 @router.get("/{mp_id}", response_model=MP)
@@ -37,8 +55,16 @@ def get_mp(mp_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{mp_id}/voting-record", response_model=List[MPVotingRecord])
-def get_voting_record(mp_id: int, db: Session = Depends(get_db)):
-    return MPService(db).get_voting_record(mp_id)
+def get_voting_record(
+    mp_id: int,
+    response: Response,
+    paging: PageParams = Depends(),
+    db: Session = Depends(get_db),
+):
+    service = MPService(db)
+    page = service.get_voting_record(mp_id, limit=paging.limit, cursor=paging.cursor)
+    total = service.count_voting_record(mp_id) if paging.include_total else None
+    return apply_page_headers(response, page, total)
 
 
 @router.get("/{mp_id}/parliamentary-activity", response_model=MPActivity)
@@ -59,3 +85,18 @@ def get_transparency(mp_id: int, db: Session = Depends(get_db)):
 @router.get("/{mp_id}/speeches", response_model=List[Speech])
 def get_speeches(mp_id: int, db: Session = Depends(get_db)):
     return MPService(db).get_speeches(mp_id)
+
+
+@router.get("/{mp_id}/profile", response_model=MPProfile)
+def get_profile(
+    mp_id: int,
+    response: Response,
+    include: Optional[str] = Query(
+        None,
+        description=f"Comma-separated sections to include ({', '.join(PROFILE_SECTIONS)}); defaults to all",
+    ),
+    db: Session = Depends(get_db),
+):
+    profile = MPService(db).get_profile(mp_id, parse_profile_sections(include))
+    response.headers["Cache-Control"] = f"public, max-age={settings.API_CACHE_MAX_AGE}"
+    return profile
@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.schemas import SearchHit
+from app.services.pagination import PageParams, apply_page_headers
+from app.services.search_service import SearchService, parse_kinds
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[SearchHit])
+def search(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search text; quotes, OR and -term are supported"),
+    lang: str = Query("en", pattern="^(en|fr)$", description="Text search language"),
+    types: Optional[str] = Query(None, description="Comma-separated subset of motions,speeches,mps"),
+    paging: PageParams = Depends(),
+    db: Session = Depends(get_db),
+):
+    kinds = parse_kinds(types)
+    service = SearchService(db)
+    page = service.search(q, lang, kinds, limit=paging.limit or settings.API_PAGE_SIZE, cursor=paging.cursor)
+    total = service.count(q, lang, kinds) if paging.include_total else None
+    return apply_page_headers(response, page, total)
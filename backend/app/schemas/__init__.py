@@ -1,3 +1,4 @@
+from app.schemas.lookup import CoordinateLookup, PostalCodeBatchRequest, PostalCodeLookup
 from app.schemas.motion import (
     AISummaryResponse,
     Motion,
@@ -10,10 +11,13 @@ from app.schemas.mp import (
     MP,
     MPActivity,
     MPBase,
+    MPProfile,
     MPSpendingSummary,
+    MPSuggestion,
     MPTransparencySummary,
     MPVotingRecord,
 )
+from app.schemas.search import SearchHit
 from app.schemas.speech import Speech
 from app.schemas.spending import SpendingEntry
 from app.schemas.transparency import TransparencyEntry
@@ -28,10 +32,16 @@ __all__ = [
     "AISummaryResponse",
     "MP",
     "MPBase",
+    "MPProfile",
+    "MPSuggestion",
     "MPVotingRecord",
     "MPActivity",
     "MPSpendingSummary",
     "MPTransparencySummary",
+    "CoordinateLookup",
+    "PostalCodeBatchRequest",
+    "PostalCodeLookup",
+    "SearchHit",
     "Speech",
     "SpendingEntry",
     "TransparencyEntry",
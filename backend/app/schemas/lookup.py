@@ -0,0 +1,22 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PostalCodeLookup(BaseModel):
+    postal_code: str
+    presumed_riding: Optional[str] = None
+    presumed_province: Optional[str] = None
+    mp_id: Optional[int] = None
+    match: Optional[str] = None
+
+
+class CoordinateLookup(BaseModel):
+    latitude: float
+    longitude: float
+    presumed_riding: Optional[str] = None
+    mp_id: Optional[int] = None
+
+
+class PostalCodeBatchRequest(BaseModel):
+    postal_codes: List[str] = Field(..., min_length=1)
@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from app.schemas.base import ORMBase
+from app.schemas.speech import Speech
 from app.schemas.spending import SpendingEntry
 from app.schemas.transparency import TransparencyEntry
 
@@ -19,6 +20,16 @@ class MP(MPBase):
     id: int
 
 
+class MPSuggestion(ORMBase):
+    id: int
+    name: str
+    riding: str
+    party: str
+    photo_url: Optional[str] = None
+    # "name" or "riding" for prefix completions, "fuzzy" for trigram matches.
+    match: str
+
+
 class MPVotingRecord(ORMBase):
     motion_id: int
     motion_title: str
@@ -38,3 +49,14 @@ class MPSpendingSummary(ORMBase):
 class MPTransparencySummary(ORMBase):
     filings_count: int
     entries: List[TransparencyEntry]
+
+
+# Sections that were not requested through ?include= are left null.
+class MPProfile(MP):
+    # The most recent votes only; pass voting_record_next_cursor to /mps/{id}/voting-record for older ones.
+    voting_record: Optional[List[MPVotingRecord]] = None
+    voting_record_next_cursor: Optional[str] = None
+    activity: Optional[MPActivity] = None
+    spending: Optional[MPSpendingSummary] = None
+    transparency: Optional[MPTransparencySummary] = None
+    speeches: Optional[List[Speech]] = None
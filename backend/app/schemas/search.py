@@ -0,0 +1,15 @@
+import datetime as dt
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: str
+    id: int
+    # HTML-escaped text in which matched terms are wrapped in <mark></mark>.
+    title: str
+    snippet: Optional[str] = None
+    rank: float
+    date: Optional[dt.date] = None
+    mp_id: Optional[int] = None
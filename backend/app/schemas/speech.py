@@ -1,4 +1,4 @@
-from datetime import date
+import datetime as dt
 from typing import Optional
 
 from app.schemas.base import ORMBase
@@ -10,4 +10,4 @@ class Speech(ORMBase):
     motion_id: Optional[int] = None
     title: str
     content: Optional[str] = None
-    date: Optional[date] = None
+    date: Optional[dt.date] = None
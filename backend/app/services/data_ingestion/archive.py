@@ -0,0 +1,235 @@
+"""Append-only archive of raw fetched documents and the offline replay source.
+
+Every document downloaded with a ``200`` is appended to gzip-compressed
+JSONL segments as ``{"url", "fetched_at", "body"}``; a ``304`` revalidation
+is not archived again, the body archived with the earlier ``200`` stands.
+Streamed pages are escaped into a per-document spool as they arrive and
+copied into the segment once complete, so archiving never holds a whole page
+in memory. Segments are never rewritten: a run opens a new one and rolls
+over once ``segment_bytes`` of JSON have been written, and segments older
+than ``retention_days`` are deleted when the archive is opened.
+``ArchiveReplay`` indexes a directory of segments so ``ingest.py --replay``
+can re-run normalization and loading without any network access.
+"""
+
+from __future__ import annotations
+
+import gzip
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Dict, Iterator, Optional, TextIO, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_GLOB = "segment-*.jsonl.gz"
+# A streamed document is spooled in memory up to this size, then on disk.
+SPOOL_MEMORY_BYTES = 1024 * 1024
+COPY_CHUNK = 64 * 1024
+# Process-wide, so an archive reopened within the same second never reuses a segment name.
+_segment_numbers = itertools.count(1)
+
+
+class ArchiveMiss(LookupError):
+    """Raised in replay mode for a URL the archive never fetched."""
+
+
+def archive_key(url: str) -> str:
+    """Canonical form of ``url`` so equivalent requests replay the same document."""
+
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+class RawArchive:
+    def __init__(self, directory: Path, segment_bytes: int, retention_days: int = 0):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._handle: Optional[TextIO] = None
+        self._written = 0
+        if retention_days > 0:
+            self._prune(time.time() - retention_days * 24 * 3600)
+
+    def _prune(self, cutoff: float) -> None:
+        removed = 0
+        for path in self.directory.glob(SEGMENT_GLOB):
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info("Removed %s archive segments past the retention period", removed)
+
+    def _open_segment(self) -> TextIO:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = self.directory / f"segment-{stamp}-{os.getpid()}-{next(_segment_numbers):04d}.jsonl.gz"
+        self._written = 0
+        return gzip.open(path, "wt", encoding="utf-8")
+
+    def _segment(self) -> TextIO:
+        if self._handle is None or self._written >= self.segment_bytes:
+            if self._handle is not None:
+                self._handle.close()
+            self._handle = self._open_segment()
+        return self._handle
+
+    def append(self, url: str, body: str) -> None:
+        record = {"url": url, "fetched_at": datetime.now(timezone.utc).isoformat(), "body": body}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._segment().write(line)
+            self._written += len(line)
+
+    def writer(self, url: str) -> "DocumentWriter":
+        return DocumentWriter(self, url)
+
+    def _append_escaped(self, url: str, body: IO[str], length: int) -> None:
+        # Same record as append(), with the already escaped body copied in from ``body``.
+        head = json.dumps({"url": url, "fetched_at": datetime.now(timezone.utc).isoformat()}, ensure_ascii=False)
+        prefix = head[:-1] + ', "body": "'
+        body.seek(0)
+        with self._lock:
+            handle = self._segment()
+            handle.write(prefix)
+            shutil.copyfileobj(body, handle, COPY_CHUNK)
+            handle.write('"}\n')
+            self._written += len(prefix) + length + 3
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class DocumentWriter:
+    """One streamed document on its way into the archive.
+
+    ``write`` JSON-escapes each chunk into a spool (escaping is per character,
+    so the pieces concatenate to the escaped whole); ``commit`` copies it into
+    the current segment as a single record and ``discard`` drops it.
+    """
+
+    def __init__(self, archive: RawArchive, url: str):
+        self.archive = archive
+        self.url = url
+        self._length = 0
+        self._spool: IO[str] = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES, mode="w+", encoding="utf-8")
+
+    def write(self, chunk: str) -> None:
+        escaped = json.dumps(chunk, ensure_ascii=False)[1:-1]
+        self._spool.write(escaped)
+        self._length += len(escaped)
+
+    def commit(self) -> None:
+        try:
+            self.archive._append_escaped(self.url, self._spool, self._length)
+        finally:
+            self._spool.close()
+
+    def discard(self) -> None:
+        self._spool.close()
+
+
+def iter_archive(directory: Path) -> Iterator[Tuple[str, str, str]]:
+    """Yield ``(url, fetched_at, body)`` from every segment, oldest segment first."""
+
+    for path in sorted(directory.glob(SEGMENT_GLOB)):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    record = json.loads(line)
+                    yield record["url"], record["fetched_at"], record["body"]
+        except (EOFError, OSError, json.JSONDecodeError) as exc:
+            # A run that was killed leaves a truncated final segment; keep what was readable.
+            logger.warning("Stopped reading archive segment %s: %s", path.name, exc)
+
+
+class ArchiveReplay:
+    """Latest archived body per URL, kept zlib-compressed in memory."""
+
+    def __init__(self, directory: Path):
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Archive directory {directory} does not exist")
+        self._documents: Dict[str, Tuple[str, bytes]] = {}
+        for url, fetched_at, body in iter_archive(directory):
+            key = archive_key(url)
+            previous = self._documents.get(key)
+            if previous is None or fetched_at >= previous[0]:
+                self._documents[key] = (fetched_at, zlib.compress(body.encode("utf-8")))
+        logger.info("Replaying %s archived documents from %s", len(self._documents), directory)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, url: str) -> str:
+        document = self._documents.get(archive_key(url))
+        if document is None:
+            raise ArchiveMiss(f"{url} is not in the replay archive")
+        return zlib.decompress(document[1]).decode("utf-8")
+
+
+_archive: Optional[RawArchive] = None
+_replay: Optional[ArchiveReplay] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[RawArchive]:
+    """Return the shared archive writer, or ``None`` when archiving is off or replaying."""
+
+    global _archive
+    if not settings.INGEST_ARCHIVE_ENABLED or _replay is not None:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = RawArchive(
+                    Path(settings.INGEST_ARCHIVE_DIR),
+                    settings.INGEST_ARCHIVE_SEGMENT_BYTES,
+                    settings.INGEST_ARCHIVE_RETENTION_DAYS,
+                )
+    return _archive
+
+
+def archive_document(url: str, body: str) -> None:
+    archive = get_archive()
+    if archive is not None:
+        archive.append(url, body)
+
+
+def close_archive() -> None:
+    global _archive
+    with _archive_lock:
+        if _archive is not None:
+            _archive.close()
+            _archive = None
+
+
+def start_replay(directory: str) -> ArchiveReplay:
+    global _replay
+    with _archive_lock:
+        _replay = ArchiveReplay(Path(directory))
+        return _replay
+
+
+def get_replay() -> Optional[ArchiveReplay]:
+    return _replay
+
+
+def stop_replay() -> None:
+    global _replay
+    with _archive_lock:
+        _replay = None
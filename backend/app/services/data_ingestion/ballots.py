@@ -0,0 +1,149 @@
+"""Per-MP ballot ingestion into ``vote_records``.
+
+Every motion remembers the OpenParliament division its party summary came
+from (``Motion.division_url``). This stage downloads the individual ballots for
+those divisions and streams them into ``vote_records`` through a PostgreSQL
+``COPY`` into a temporary staging table followed by one set-based merge per
+group of divisions, so memory stays bounded by a single group.
+"""
+
+from __future__ import annotations
+
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, insert, tuple_
+from sqlalchemy.orm import Session
+
+from app.models import Motion, VoteRecord
+from app.models.enums import VoteChoice
+from app.services.data_ingestion.bulk import UpsertResult
+from app.services.data_ingestion.common import paginate_openparliament
+from app.services.data_ingestion.concurrency import fetch_ordered
+from app.services.data_ingestion.identities import PoliticianIdentityMap, politician_slug
+from app.services.data_ingestion.pipeline import LineStream
+from app.services.data_ingestion.state import IngestMode
+from app.services.data_ingestion.telemetry import record_skipped, timed
+
+logger = logging.getLogger(__name__)
+
+DIVISIONS_PER_COPY = 100
+BALLOT_PAGE_SIZE = 500
+BALLOT_CHOICES = {"yes": VoteChoice.YEA, "no": VoteChoice.NAY}
+
+BallotRow = Tuple[int, int, str]
+
+STAGING_DDL = """
+CREATE TEMPORARY TABLE IF NOT EXISTS vote_records_staging (
+    motion_id integer NOT NULL,
+    mp_id integer NOT NULL,
+    vote text NOT NULL
+) ON COMMIT DELETE ROWS
+"""
+
+MERGE_SQL = """
+WITH merged AS (
+    INSERT INTO vote_records (motion_id, mp_id, vote)
+    SELECT DISTINCT ON (motion_id, mp_id) motion_id, mp_id, vote::votechoice
+    FROM vote_records_staging
+    ON CONFLICT (motion_id, mp_id) DO UPDATE SET vote = EXCLUDED.vote
+    WHERE vote_records.vote IS DISTINCT FROM EXCLUDED.vote
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+"""
+
+
+def _division_targets(db_session: Session, mode: IngestMode) -> List[Tuple[int, str]]:
+    query = db_session.query(Motion.id, Motion.division_url).filter(Motion.division_url.isnot(None))
+    if mode is IngestMode.INCREMENTAL:
+        query = query.filter(~exists().where(VoteRecord.motion_id == Motion.id))
+    return [(motion_id, division_url) for motion_id, division_url in query.order_by(Motion.id)]
+
+
+def _fetch_ballots(target: Tuple[int, str]) -> List[Dict[str, Any]]:
+    # Pages within one division are read sequentially; divisions fan out instead.
+    return list(
+        paginate_openparliament(
+            "/votes/ballots/",
+            page_size=BALLOT_PAGE_SIZE,
+            concurrency=1,
+            params={"vote": target[1]},
+        )
+    )
+
+
+def _ballot_choice(ballot: Optional[str]) -> VoteChoice:
+    return BALLOT_CHOICES.get((ballot or "").strip().lower(), VoteChoice.ABSTAIN)
+
+
+def _ballot_rows(
+    outcomes: Iterable[Tuple[Tuple[int, str], Optional[List[Dict[str, Any]]], Optional[Exception]]],
+    identities: PoliticianIdentityMap,
+    progress: Dict[str, int],
+) -> Iterator[BallotRow]:
+    for (motion_id, division_url), ballots, exc in outcomes:
+        progress["divisions"] += 1
+        if exc is not None:  # pragma: no cover - network dependent
+            logger.warning("Failed to download ballots for %s: %s", division_url, exc)
+            continue
+        for ballot in ballots or []:
+            mp_id = identities.mp_id_for(politician_slug(ballot.get("politician_url")))
+            if mp_id is None:
+                progress["skipped"] += 1
+                continue
+            yield motion_id, mp_id, _ballot_choice(ballot.get("ballot")).value
+
+
+def _copy_ballots(db_session: Session, rows: Iterator[BallotRow]) -> UpsertResult:
+    cursor = db_session.connection().connection.cursor()
+    try:
+        cursor.execute(STAGING_DDL)
+        lines = (f"{motion_id}\t{mp_id}\t{vote}\n" for motion_id, mp_id, vote in rows)
+        cursor.copy_expert("COPY vote_records_staging (motion_id, mp_id, vote) FROM STDIN", LineStream(lines))
+        copied = max(cursor.rowcount, 0)
+        # COPY is paced by the ballot downloads feeding it; only the merge is pure database time.
+        with timed("write"):
+            cursor.execute(MERGE_SQL)
+            inserted, updated = cursor.fetchone()
+    finally:
+        cursor.close()
+    with timed("write"):
+        db_session.commit()
+    return UpsertResult(inserted=inserted, updated=updated, unchanged=max(copied - inserted - updated, 0))
+
+
+def _replace_ballots(db_session: Session, rows: Iterator[BallotRow]) -> UpsertResult:
+    # Portable fallback (SQLite in tests): replace the affected pairs in one transaction.
+    latest = {(motion_id, mp_id): vote for motion_id, mp_id, vote in rows}
+    replaced = 0
+    with timed("write"):
+        if latest:
+            replaced = db_session.execute(
+                delete(VoteRecord).where(tuple_(VoteRecord.motion_id, VoteRecord.mp_id).in_(list(latest)))
+            ).rowcount
+            db_session.execute(
+                insert(VoteRecord),
+                [{"motion_id": motion_id, "mp_id": mp_id, "vote": vote} for (motion_id, mp_id), vote in latest.items()],
+            )
+        db_session.commit()
+    return UpsertResult(inserted=len(latest) - replaced, updated=replaced)
+
+
+def ingest_ballots(db_session, mode: IngestMode = IngestMode.DEFAULT) -> UpsertResult:
+    targets = _division_targets(db_session, mode)
+    logger.info("Ballots: %s divisions to load", len(targets))
+    identities = PoliticianIdentityMap(db_session)
+    write = _copy_ballots if db_session.get_bind().dialect.name == "postgresql" else _replace_ballots
+
+    outcomes = fetch_ordered(targets, _fetch_ballots)
+    result = UpsertResult()
+    progress = {"divisions": 0, "skipped": 0}
+    while progress["divisions"] < len(targets):
+        result += write(db_session, _ballot_rows(islice(outcomes, DIVISIONS_PER_COPY), identities, progress))
+        logger.info("Ballots: %s/%s divisions merged", progress["divisions"], len(targets))
+    record_skipped(progress["skipped"])
+    if progress["skipped"]:
+        logger.info("Ballots: skipped %s ballots from politicians without an MP record", progress["skipped"])
+    return result
@@ -0,0 +1,170 @@
+"""Set-based upserts used by every ingestion stage."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import JSON, Table, Text, bindparam, cast, insert, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.data_ingestion.scheduler import check_cancelled
+
+# Tables with this column store a digest of the last ingested row and skip identical rows outright.
+HASH_COLUMN = "content_hash"
+# Changed keys kept per result for run reports; the row counts stay exact.
+CHANGED_KEYS_LIMIT = 1000
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # Keys of the first CHANGED_KEYS_LIMIT rows that were inserted or updated.
+    changed: List[Any] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    def __add__(self, other: "UpsertResult") -> "UpsertResult":
+        return UpsertResult(
+            inserted=self.inserted + other.inserted,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
+            changed=self.changed + other.changed[: max(CHANGED_KEYS_LIMIT - len(self.changed), 0)],
+        )
+
+    def __str__(self) -> str:
+        return f"{self.inserted} inserted/{self.updated} updated/{self.unchanged} unchanged"
+
+
+def batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _dedupe(batch: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    # ON CONFLICT cannot touch the same row twice in one statement; last write wins.
+    return list({row[key]: row for row in batch}.values())
+
+
+def content_hash(row: Dict[str, Any]) -> str:
+    """Digest of a normalized row; equal rows hash equally in every process."""
+
+    payload = {name: value for name, value in row.items() if name != HASH_COLUMN}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _drop_unchanged(
+    db_session: Session, table: Table, batch: List[Dict[str, Any]], key: str
+) -> Tuple[List[Dict[str, Any]], int]:
+    # One indexed lookup per batch; rows whose stored digest matches never reach the upsert,
+    # so they are neither rewritten nor locked.
+    hashed = [{**row, HASH_COLUMN: content_hash(row)} for row in batch]
+    stored = dict(
+        db_session.execute(
+            select(table.c[key], table.c[HASH_COLUMN]).where(table.c[key].in_([row[key] for row in hashed]))
+        ).all()
+    )
+    changed = [row for row in hashed if stored.get(row[key]) != row[HASH_COLUMN]]
+    return changed, len(hashed) - len(changed)
+
+
+def _is_distinct(column, incoming):
+    # json (unlike jsonb) has no equality operator, so compare its text form.
+    if isinstance(column.type, JSON):
+        return cast(column, Text).is_distinct_from(cast(incoming, Text))
+    return column.is_distinct_from(incoming)
+
+
+def _upsert_batch_postgres(db_session: Session, table: Table, batch: List[Dict[str, Any]], key: str) -> UpsertResult:
+    stmt = pg_insert(table).values(batch)
+    columns = [name for name in batch[0] if name != key]
+    if not columns:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[key])
+    else:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={name: stmt.excluded[name] for name in columns},
+            where=or_(*(_is_distinct(table.c[name], stmt.excluded[name]) for name in columns)),
+        )
+    # xmax is zero only for freshly inserted tuples; rows skipped by the WHERE are not returned.
+    returned = db_session.execute(
+        stmt.returning(table.c[key].label("key"), literal_column("xmax = 0").label("inserted"))
+    ).all()
+    inserted = sum(1 for row in returned if row.inserted)
+    return UpsertResult(
+        inserted=inserted,
+        updated=len(returned) - inserted,
+        unchanged=len(batch) - len(returned),
+        changed=[row.key for row in returned],
+    )
+
+
+def _upsert_batch_portable(db_session: Session, table: Table, batch: List[Dict[str, Any]], key: str) -> UpsertResult:
+    key_column = table.c[key]
+    existing = {
+        row._mapping[key]: row._mapping
+        for row in db_session.execute(select(table).where(key_column.in_([item[key] for item in batch])))
+    }
+    to_insert: List[Dict[str, Any]] = []
+    to_update: List[Dict[str, Any]] = []
+    for item in batch:
+        current = existing.get(item[key])
+        if current is None:
+            to_insert.append(item)
+        elif any(current[name] != value for name, value in item.items()):
+            to_update.append({**item, "_key": item[key]})
+    if to_insert:
+        db_session.execute(insert(table), to_insert)
+    if to_update:
+        db_session.execute(update(table).where(key_column == bindparam("_key")), to_update)
+    return UpsertResult(
+        inserted=len(to_insert),
+        updated=len(to_update),
+        unchanged=len(batch) - len(to_insert) - len(to_update),
+        changed=[item[key] for item in to_insert + to_update],
+    )
+
+
+def bulk_upsert(
+    db_session: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    key: str = "id",
+    batch_size: Optional[int] = None,
+) -> UpsertResult:
+    """Insert or update ``rows`` in batches, committing after each batch.
+
+    PostgreSQL gets one ``INSERT ... ON CONFLICT DO UPDATE`` per batch that only
+    rewrites rows whose values changed; other dialects (SQLite in tests) fall
+    back to a keyed SELECT followed by executemany INSERT/UPDATE. For tables
+    with a ``content_hash`` column, rows matching their stored hash are counted
+    as unchanged without being sent at all.
+    """
+
+    table: Table = model.__table__
+    upsert_batch = (
+        _upsert_batch_postgres if db_session.get_bind().dialect.name == "postgresql" else _upsert_batch_portable
+    )
+    hashed = HASH_COLUMN in table.c
+    result = UpsertResult()
+    for batch in batched(rows, batch_size or settings.INGEST_BATCH_SIZE):
+        check_cancelled(db_session)
+        batch = _dedupe(batch, key)
+        if hashed:
+            batch, unchanged = _drop_unchanged(db_session, table, batch, key)
+            result += UpsertResult(unchanged=unchanged)
+        if batch:
+            result += upsert_batch(db_session, table, batch, key)
+        db_session.commit()
+    return result
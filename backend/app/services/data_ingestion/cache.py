@@ -0,0 +1,162 @@
+"""Persistent conditional-request cache for OpenParliament responses."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVICT_EVERY_PUTS = 200
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """URL-keyed response bodies plus validators, stored in a single SQLite file.
+
+    Entries that have not been revalidated within ``ttl_seconds`` are dropped,
+    and the least recently used entries are evicted once the compressed bodies
+    exceed ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: int, max_bytes: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn = sqlite3.connect(directory / "responses.sqlite3", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)")
+        self._conn.commit()
+        self.evict()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, validated_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, validated_at = row
+        if time.time() - validated_at > self.ttl_seconds:
+            return None
+        return CachedResponse(url=url, body=zlib.decompress(body), etag=etag, last_modified=last_modified)
+
+    def put(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (url, body, size, etag, last_modified, validated_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url, compressed, len(compressed), etag, last_modified, now, now),
+            )
+            self._conn.commit()
+            self._puts += 1
+            should_evict = self._puts % EVICT_EVERY_PUTS == 0
+        if should_evict:
+            self.evict()
+
+    def mark_revalidated(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET validated_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def evict(self) -> None:
+        with self._lock:
+            expired = self._conn.execute(
+                "DELETE FROM responses WHERE validated_at < ?",
+                (time.time() - self.ttl_seconds,),
+            ).rowcount
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            overflow = 0
+            if total > self.max_bytes:
+                cursor = self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at ASC")
+                doomed = []
+                for url, size in cursor:
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((url,))
+                    total -= size
+                self._conn.executemany("DELETE FROM responses WHERE url = ?", doomed)
+                overflow = len(doomed)
+            self._conn.commit()
+        if expired or overflow:
+            logger.info("Evicted %s expired and %s overflow cached responses", expired, overflow)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared cache, or ``None`` when caching is disabled."""
+
+    global _cache
+    if not settings.INGEST_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    Path(settings.INGEST_CACHE_DIR),
+                    ttl_seconds=settings.INGEST_CACHE_TTL_SECONDS,
+                    max_bytes=settings.INGEST_CACHE_MAX_BYTES,
+                )
+    return _cache
+
+
+def close_response_cache() -> None:
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
@@ -1,31 +1,99 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from urllib.parse import urlencode, urljoin
+
 import httpx
 
-from urllib.parse import urlencode, urljoin
+from app.core.config import settings
+from app.services.data_ingestion.archive import archive_document, get_archive, get_replay
+from app.services.data_ingestion.cache import get_response_cache
+from app.services.data_ingestion.concurrency import fetch_ordered
+from app.services.data_ingestion.resilience import send_with_retries
+from app.services.data_ingestion.telemetry import record_bytes, record_cache_hit
+from app.services.data_ingestion.transport import get_http_client
 
 logger = logging.getLogger(__name__)
 
 OPENPARLIAMENT_BASE = "https://api.openparliament.ca"
 
 
-def fetch_json(url: str) -> Any:
+def http_get(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """GET through the shared client under the host's rate limit, retry and breaker policy."""
+
+    client = get_http_client()
+    response = send_with_retries(url, lambda: client.get(url, headers=headers))
+    record_bytes(response.num_bytes_downloaded)
+    return response
+
+
+def fetch_text(url: str) -> str:
+    """Body of ``url``, read from the replay archive when one is active and archived otherwise."""
+
+    replay = get_replay()
+    if replay is not None:
+        return replay.get(url)
     logger.info("Fetching %s", url)
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return response.json()
+    response = http_get(url)
+    response.raise_for_status()
+    archive_document(url, response.text)
+    return response.text
+
+
+def fetch_json(url: str) -> Any:
+    return json.loads(fetch_text(url))
 
 
 def fetch_html(url: str) -> str:
-    logger.info("Fetching %s", url)
-    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        response = client.get(url)
+    return fetch_text(url)
+
+
+def stream_html(url: str, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Yield decoded chunks of an HTML page without holding the whole body.
+
+    When archiving is on, each chunk is also written to the archive's spool
+    for this page, which is committed once the page has been read completely.
+    """
+
+    replay = get_replay()
+    if replay is not None:
+        body = replay.get(url)
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+        return
+
+    logger.info("Streaming %s", url)
+    client = get_http_client()
+    response = send_with_retries(url, lambda: client.send(client.build_request("GET", url), stream=True))
+    archive = get_archive()
+    writer = archive.writer(url) if archive is not None else None
+    complete = False
+    try:
         response.raise_for_status()
-        return response.text
+        for chunk in response.iter_text(chunk_size):
+            if writer is not None:
+                writer.write(chunk)
+            yield chunk
+        complete = True
+    finally:
+        record_bytes(response.num_bytes_downloaded)
+        response.close()
+        if writer is not None:
+            if complete:
+                writer.commit()
+            else:
+                writer.discard()
+
+
+def stable_id(key: str) -> int:
+    """Positive 31-bit id derived from ``key``; unlike ``hash()`` it is identical in every process."""
+
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) & 0x7FFFFFFF
 
 
 def normalize_list(values: List[str] | None) -> List[str]:
@@ -48,16 +116,45 @@ def _build_openparliament_url(path_or_url: str, params: Optional[Dict[str, Any]]
 
 def fetch_openparliament(path_or_url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     url = _build_openparliament_url(path_or_url, params)
-    return fetch_json(url)
+    cache = get_response_cache()
+    if cache is None or get_replay() is not None:
+        return fetch_json(url)
+
+    cached = cache.get(url)
+    logger.info("Fetching %s", url)
+    response = http_get(url, headers=cached.conditional_headers() if cached else None)
+    if response.status_code == 304 and cached is not None:
+        cache.mark_revalidated(url)
+        record_cache_hit()
+        # Unchanged since the 200 that was archived with this body; archiving it again only grows the archive.
+        return json.loads(cached.body)
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.put(url, response.content, etag, last_modified)
+    archive_document(url, response.text)
+    return response.json()
 
 
 def paginate_openparliament(
     resource_path: str,
     page_size: int = 100,
     max_records: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+    start_offset: int = 0,
 ) -> Iterator[Dict[str, Any]]:
+    workers = concurrency or settings.INGEST_CONCURRENCY
+    if workers > 1:
+        yield from _paginate_by_offset(resource_path, page_size, max_records, workers, params or {}, start_offset)
+        return
+
     fetched = 0
-    next_url: Optional[str] = f"{resource_path}?limit={page_size}"
+    first_page = {"limit": page_size, **(params or {})}
+    if start_offset:
+        first_page["offset"] = start_offset
+    next_url: Optional[str] = _build_openparliament_url(resource_path, first_page)
     while next_url:
         data = fetch_openparliament(next_url)
         objects: Iterable[Dict[str, Any]] = data.get("objects", [])
@@ -69,6 +166,49 @@ def paginate_openparliament(
         next_url = data.get("pagination", {}).get("next_url")
 
 
+def _paginate_by_offset(
+    resource_path: str,
+    page_size: int,
+    max_records: Optional[int],
+    workers: int,
+    params: Dict[str, Any],
+    start_offset: int,
+) -> Iterator[Dict[str, Any]]:
+    # Listing pages are addressed by offset, so once the first page shows there
+    # is more to read, waves of `workers` pages are requested at once. Reading
+    # stops at the first page without a next_url.
+    fetched = 0
+    offset = start_offset
+    wave_size = 1
+    while True:
+        wave = [
+            offset + index * page_size
+            for index in range(wave_size)
+            if max_records is None or offset + index * page_size - start_offset < max_records
+        ]
+        if not wave:
+            return
+        pages = fetch_ordered(
+            wave,
+            lambda page_offset: fetch_openparliament(
+                resource_path, {"limit": page_size, "offset": page_offset, **params}
+            ),
+            workers,
+        )
+        for _, data, error in pages:
+            if error is not None:
+                raise error
+            for obj in data.get("objects", []):
+                yield obj
+                fetched += 1
+                if max_records is not None and fetched >= max_records:
+                    return
+            if not data.get("pagination", {}).get("next_url"):
+                return
+        offset += len(wave) * page_size
+        wave_size = workers
+
+
 def extract_parl_mp_id(detail: Dict[str, Any]) -> Optional[int]:
     other = detail.get("other_info") or {}
     candidates = other.get("parl_mp_id") or other.get("parl_affil_id") or []
@@ -78,23 +218,3 @@ def extract_parl_mp_id(detail: Dict[str, Any]) -> Optional[int]:
         except (TypeError, ValueError):
             continue
     return None
-
-
-def upsert_entities(db_session, model, data: List[Dict[str, Any]], lookup_field: str = "id") -> int:
-    """Simple bulk upsert helper used by ingestion tasks."""
-
-    updated = 0
-    for item in data:
-        lookup_value = item.get(lookup_field)
-        instance = None
-        if lookup_value is not None:
-            instance = db_session.query(model).filter(getattr(model, lookup_field) == lookup_value).first()
-        if instance:
-            for key, value in item.items():
-                setattr(instance, key, value)
-        else:
-            instance = model(**item)
-            db_session.add(instance)
-        updated += 1
-    db_session.commit()
-    return updated
@@ -0,0 +1,55 @@
+"""Bounded thread-pool fan-out for ingestion downloads."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextvars import copy_context
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+FetchOutcome = Tuple[T, Optional[R], Optional[Exception]]
+
+
+def _outcome(item: T, future: Future) -> FetchOutcome:
+    try:
+        return item, future.result(), None
+    except Exception as exc:
+        return item, None, exc
+
+
+def fetch_ordered(
+    items: Iterable[T],
+    fetch: Callable[[T], R],
+    max_workers: Optional[int] = None,
+) -> Iterator[FetchOutcome]:
+    """Apply ``fetch`` to each item concurrently, yielding ``(item, result, error)`` in input order.
+
+    At most ``2 * max_workers`` items are in flight, so ``items`` may be a lazy
+    (even unbounded) iterator. Exceptions are returned rather than raised so
+    callers keep their existing per-item failure handling. Each fetch runs in
+    a copy of the caller's context so context variables (stage telemetry)
+    carry over to the worker threads.
+    """
+
+    workers = max_workers or settings.INGEST_CONCURRENCY
+    if workers <= 1:
+        for item in items:
+            try:
+                yield item, fetch(item), None
+            except Exception as exc:
+                yield item, None, exc
+        return
+
+    window: Deque[Tuple[T, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest-fetch") as executor:
+        for item in items:
+            window.append((item, executor.submit(copy_context().run, fetch, item)))
+            if len(window) >= workers * 2:
+                yield _outcome(*window.popleft())
+        while window:
+            yield _outcome(*window.popleft())
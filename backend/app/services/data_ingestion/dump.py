@@ -0,0 +1,379 @@
+"""Initial load from an OpenParliament bulk data export instead of the API.
+
+OpenParliament publishes its database as a PostgreSQL dump. Restore it into
+a scratch database and export the tables below as CSV with a header row
+(``\\copy core_politician TO 'core_politician.csv' CSV HEADER``; ``.csv.gz`` is
+also accepted) into one directory, then run ``ingest.py --from-dump <dir>``.
+
+Each file is streamed once through a Python pass that keeps only the columns
+we use and derives our ids with the same rules as the API ingestors
+(``stable_id`` cannot be computed in SQL). The rows are ``COPY``-ed into
+temporary staging tables, and the ``mps``, ``politician_identities``,
+``motions`` and ``vote_records`` tables are then filled with one set-based
+``INSERT ... SELECT ... ON CONFLICT`` each, all in a single transaction.
+Loaded rows keep a NULL ``content_hash``, so the next API run hashes them once.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.services.data_ingestion.bulk import UpsertResult
+from app.services.data_ingestion.common import OPENPARLIAMENT_BASE, stable_id
+from app.services.data_ingestion.motions import RESOURCE as MOTIONS_RESOURCE
+from app.services.data_ingestion.pipeline import LineStream
+from app.services.data_ingestion.state import parse_iso_date, save_checkpoint
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_TABLES = ("core_politician", "core_party", "core_riding", "core_electedmember", "bills_bill")
+OPTIONAL_TABLES = ("core_politicianinfo", "bills_votequestion", "bills_partyvote", "bills_memberballot")
+
+STAGING_DDL = """
+CREATE TEMPORARY TABLE dump_politicians (
+    politician_id integer PRIMARY KEY, mp_id integer NOT NULL, slug text, name text NOT NULL, headshot text
+) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_parties (id integer PRIMARY KEY, short_name text) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_ridings (id integer PRIMARY KEY, name text) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_members (
+    politician_id integer NOT NULL, riding_id integer, party_id integer, start_date date, end_date date
+) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_bills (
+    bill_id integer PRIMARY KEY, motion_id integer NOT NULL, title text NOT NULL, description text,
+    sponsor_politician_id integer, introduced date, session_id text, private_member boolean,
+    institution text, law boolean, status_code text
+) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_votes (
+    id integer PRIMARY KEY, bill_id integer, session_id text, number integer, date date, result text
+) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_party_votes (votequestion_id integer NOT NULL, party_id integer, vote text) ON COMMIT DROP;
+CREATE TEMPORARY TABLE dump_ballots (votequestion_id integer NOT NULL, politician_id integer NOT NULL, vote text) ON COMMIT DROP;
+"""
+
+# Each statement ends in a CTE over RETURNING so it reports (inserted, updated).
+MPS_SQL = """
+WITH source AS (
+    SELECT DISTINCT ON (p.mp_id)
+        p.mp_id AS id,
+        p.name,
+        COALESCE(r.name, 'Unknown Riding') AS riding,
+        COALESCE(pa.short_name, 'Independent') AS party,
+        CASE WHEN p.headshot <> '' THEN %(media_base)s || p.headshot END AS photo_url,
+        GREATEST(0, EXTRACT(YEAR FROM current_date)::integer - first_term.year) AS years_in_office,
+        m.start_date AS term_start,
+        m.end_date IS NULL AS is_current
+    FROM dump_politicians p
+    JOIN dump_members m ON m.politician_id = p.politician_id
+    JOIN (
+        SELECT politician_id, min(EXTRACT(YEAR FROM start_date))::integer AS year
+        FROM dump_members GROUP BY politician_id
+    ) first_term ON first_term.politician_id = p.politician_id
+    LEFT JOIN dump_ridings r ON r.id = m.riding_id
+    LEFT JOIN dump_parties pa ON pa.id = m.party_id
+    ORDER BY p.mp_id, m.start_date DESC NULLS LAST
+), merged AS (
+    INSERT INTO mps (id, name, riding, party, photo_url, years_in_office, term_start, is_current)
+    SELECT id, name, riding, party, photo_url, years_in_office, term_start, is_current FROM source
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name, riding = EXCLUDED.riding, party = EXCLUDED.party,
+        photo_url = EXCLUDED.photo_url, years_in_office = EXCLUDED.years_in_office,
+        term_start = EXCLUDED.term_start, is_current = EXCLUDED.is_current, content_hash = NULL
+    WHERE (mps.name, mps.riding, mps.party, mps.photo_url, mps.years_in_office, mps.term_start, mps.is_current)
+        IS DISTINCT FROM (
+            EXCLUDED.name, EXCLUDED.riding, EXCLUDED.party, EXCLUDED.photo_url, EXCLUDED.years_in_office,
+            EXCLUDED.term_start, EXCLUDED.is_current
+        )
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted), (SELECT count(*) FROM source) FROM merged
+"""
+
+IDENTITIES_SQL = """
+WITH source AS (
+    SELECT DISTINCT ON (p.slug) '/politicians/' || p.slug AS slug, p.mp_id, p.name, mps.party
+    FROM dump_politicians p JOIN mps ON mps.id = p.mp_id
+    WHERE p.slug <> ''
+    ORDER BY p.slug, p.politician_id
+), merged AS (
+    INSERT INTO politician_identities (slug, mp_id, name, party)
+    SELECT slug, mp_id, name, party FROM source
+    ON CONFLICT (slug) DO UPDATE SET mp_id = EXCLUDED.mp_id, name = EXCLUDED.name, party = EXCLUDED.party
+    WHERE (politician_identities.mp_id, politician_identities.name, politician_identities.party)
+        IS DISTINCT FROM (EXCLUDED.mp_id, EXCLUDED.name, EXCLUDED.party)
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted), (SELECT count(*) FROM source) FROM merged
+"""
+
+# Like the API path, a bill's division is its first vote that recorded party positions.
+DIVISIONS_SQL = """
+CREATE TEMPORARY TABLE dump_divisions ON COMMIT DROP AS
+SELECT DISTINCT ON (v.bill_id) v.bill_id, v.id AS vote_id, v.session_id, v.number, v.result
+FROM dump_votes v
+WHERE v.bill_id IS NOT NULL
+  AND (NOT EXISTS (SELECT 1 FROM dump_party_votes) OR EXISTS (
+        SELECT 1 FROM dump_party_votes pv WHERE pv.votequestion_id = v.id))
+ORDER BY v.bill_id, v.date, v.number
+"""
+
+MOTIONS_SQL = """
+WITH party_summary AS (
+    SELECT pv.votequestion_id, json_object_agg(pa.short_name, json_build_object('vote',
+        CASE pv.vote WHEN 'Y' THEN 'Yes' WHEN 'N' THEN 'No' WHEN 'F' THEN 'Free vote' ELSE pv.vote END)) AS summary
+    FROM dump_party_votes pv JOIN dump_parties pa ON pa.id = pv.party_id
+    WHERE pa.short_name <> ''
+    GROUP BY pv.votequestion_id
+), source AS (
+    SELECT DISTINCT ON (b.motion_id)
+        b.motion_id AS id,
+        b.title,
+        b.description,
+        COALESCE(sponsor.id, fallback.id) AS introduced_by_mp_id,
+        COALESCE(sponsor.party, fallback.party) AS introduced_by_party,
+        COALESCE(ps.summary, '{}'::json) AS vote_results_by_party,
+        CASE WHEN d.vote_id IS NOT NULL THEN '/votes/' || d.session_id || '/' || d.number || '/' END AS division_url,
+        CASE WHEN d.result IS NOT NULL THEN d.result = 'Y'
+             ELSE COALESCE(b.law, false) OR b.status_code ILIKE '%royalassent%' END AS passed,
+        array_remove(ARRAY[
+            CASE b.institution WHEN 'C' THEN 'House' WHEN 'S' THEN 'Senate' END,
+            'Session ' || b.session_id
+        ], NULL)::varchar[] AS categories,
+        (CASE WHEN b.private_member THEN 'subsidiary' ELSE 'substantive' END)::motionclassification AS classification,
+        b.introduced AS date
+    FROM dump_bills b
+    LEFT JOIN dump_politicians sp ON sp.politician_id = b.sponsor_politician_id
+    LEFT JOIN mps sponsor ON sponsor.id = sp.mp_id
+    LEFT JOIN mps fallback ON fallback.id = (SELECT min(id) FROM mps)
+    LEFT JOIN dump_divisions d ON d.bill_id = b.bill_id
+    LEFT JOIN party_summary ps ON ps.votequestion_id = d.vote_id
+    WHERE COALESCE(sponsor.id, fallback.id) IS NOT NULL
+    ORDER BY b.motion_id, b.introduced DESC NULLS LAST
+), merged AS (
+    INSERT INTO motions (id, title, description, introduced_by_mp_id, introduced_by_party, vote_results_by_party,
+                         division_url, passed, categories, classification, date)
+    SELECT * FROM source
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title, description = EXCLUDED.description,
+        introduced_by_mp_id = EXCLUDED.introduced_by_mp_id, introduced_by_party = EXCLUDED.introduced_by_party,
+        vote_results_by_party = EXCLUDED.vote_results_by_party, division_url = EXCLUDED.division_url,
+        passed = EXCLUDED.passed, categories = EXCLUDED.categories, classification = EXCLUDED.classification,
+        date = EXCLUDED.date, content_hash = NULL
+    WHERE (motions.title, motions.description, motions.introduced_by_mp_id, motions.introduced_by_party,
+           motions.vote_results_by_party::text, motions.division_url, motions.passed, motions.categories,
+           motions.classification, motions.date)
+        IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.description, EXCLUDED.introduced_by_mp_id,
+           EXCLUDED.introduced_by_party, EXCLUDED.vote_results_by_party::text, EXCLUDED.division_url,
+           EXCLUDED.passed, EXCLUDED.categories, EXCLUDED.classification, EXCLUDED.date)
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted), (SELECT count(*) FROM source) FROM merged
+"""
+
+BALLOTS_SQL = """
+WITH source AS (
+    SELECT DISTINCT ON (b.motion_id, p.mp_id)
+        b.motion_id, p.mp_id,
+        (CASE bl.vote WHEN 'Y' THEN 'yea' WHEN 'N' THEN 'nay' ELSE 'abstain' END)::votechoice AS vote
+    FROM dump_divisions d
+    JOIN dump_bills b ON b.bill_id = d.bill_id
+    JOIN motions m ON m.id = b.motion_id
+    JOIN dump_ballots bl ON bl.votequestion_id = d.vote_id
+    JOIN dump_politicians p ON p.politician_id = bl.politician_id
+    JOIN mps ON mps.id = p.mp_id
+    ORDER BY b.motion_id, p.mp_id
+), merged AS (
+    INSERT INTO vote_records (motion_id, mp_id, vote)
+    SELECT motion_id, mp_id, vote FROM source
+    ON CONFLICT (motion_id, mp_id) DO UPDATE SET vote = EXCLUDED.vote
+    WHERE vote_records.vote IS DISTINCT FROM EXCLUDED.vote
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted), (SELECT count(*) FROM source) FROM merged
+"""
+
+MARKS_SQL = """
+SELECT (SELECT max(introduced) FROM dump_bills), (SELECT max(date) FROM dump_votes)
+"""
+
+
+def _table_path(directory: Path, table: str) -> Optional[Path]:
+    for suffix in (".csv", ".csv.gz"):
+        path = directory / f"{table}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _read_csv(path: Path) -> Iterator[Dict[str, str]]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8", newline="") as handle:
+        yield from csv.DictReader(handle)
+
+
+def _copy_value(value: Any) -> str:
+    if value is None or value == "":
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _flag(value: Optional[str]) -> Optional[bool]:
+    if value in (None, ""):
+        return None
+    return value.strip().lower() in ("t", "true", "1", "y", "yes")
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _parl_mp_ids(directory: Path) -> Dict[int, int]:
+    # Mirrors extract_parl_mp_id: prefer parl_mp_id, then parl_affil_id.
+    path = _table_path(directory, "core_politicianinfo")
+    if path is None:
+        return {}
+    preferred: Dict[int, int] = {}
+    fallback: Dict[int, int] = {}
+    for row in _read_csv(path):
+        politician_id, value = _int(row.get("politician_id")), _int(row.get("value"))
+        if politician_id is None or value is None:
+            continue
+        if row.get("schema") == "parl_mp_id":
+            preferred.setdefault(politician_id, value)
+        elif row.get("schema") == "parl_affil_id":
+            fallback.setdefault(politician_id, value)
+    return {**fallback, **preferred}
+
+
+def _politician_rows(directory: Path) -> Iterator[Sequence[Any]]:
+    parl_ids = _parl_mp_ids(directory)
+    for row in _read_csv(_table_path(directory, "core_politician")):
+        politician_id = _int(row.get("id"))
+        if politician_id is None:
+            continue
+        slug = row.get("slug") or ""
+        mp_id = parl_ids.get(politician_id) or stable_id(f"/politicians/{slug}/") or 1
+        yield politician_id, mp_id, slug, row.get("name") or "Unknown", row.get("headshot")
+
+
+def _bill_rows(directory: Path) -> Iterator[Sequence[Any]]:
+    for row in _read_csv(_table_path(directory, "bills_bill")):
+        bill_id = _int(row.get("id"))
+        if bill_id is None:
+            continue
+        url = f"/bills/{row.get('session_id')}/{row.get('number')}/"
+        title = row.get("name_en") or "Unknown Motion"
+        yield (
+            bill_id,
+            _int(row.get("legisinfo_id")) or stable_id(url),
+            title,
+            row.get("short_title_en") or title,
+            _int(row.get("sponsor_politician_id")),
+            parse_iso_date(row.get("introduced")),
+            row.get("session_id"),
+            _flag(row.get("privatemember")),
+            row.get("institution"),
+            _flag(row.get("law")),
+            row.get("status_code"),
+        )
+
+
+def _column_rows(directory: Path, table: str, columns: Sequence[str]) -> Iterator[Sequence[Any]]:
+    path = _table_path(directory, table)
+    if path is None:
+        return
+    for row in _read_csv(path):
+        yield [row.get(column) for column in columns]
+
+
+def _copy(cursor, table: str, rows: Iterator[Sequence[Any]]) -> int:
+    lines = ("\t".join(_copy_value(value) for value in row) + "\n" for row in rows)
+    cursor.copy_expert(f"COPY {table} FROM STDIN", LineStream(lines))
+    logger.info("Dump: staged %s rows into %s", cursor.rowcount, table)
+    return cursor.rowcount
+
+
+def _merge(cursor, label: str, sql: str, params: Optional[Dict[str, Any]] = None) -> UpsertResult:
+    # Statements without parameters are sent verbatim, so their % signs stay literal.
+    cursor.execute(sql, params)
+    inserted, updated, total = cursor.fetchone()
+    result = UpsertResult(inserted=inserted, updated=updated, unchanged=total - inserted - updated)
+    logger.info("Dump: %s %s", label, result)
+    return result
+
+
+def load_dump(db_session: Session, path: str) -> Dict[str, UpsertResult]:
+    """Load MPs, bills, divisions and ballots from an export directory in one transaction."""
+
+    if db_session.get_bind().dialect.name != "postgresql":
+        raise RuntimeError("--from-dump relies on COPY and requires PostgreSQL")
+    directory = Path(path)
+    missing = [table for table in REQUIRED_TABLES if _table_path(directory, table) is None]
+    if missing:
+        raise FileNotFoundError(f"{directory} is missing {', '.join(f'{table}.csv' for table in missing)}")
+    absent = [table for table in OPTIONAL_TABLES if _table_path(directory, table) is None]
+    if absent:
+        logger.warning("Dump: %s not found; related data will not be loaded", ", ".join(absent))
+
+    staged: List[Tuple[str, Callable[[], Iterator[Sequence[Any]]]]] = [
+        ("dump_politicians", lambda: _politician_rows(directory)),
+        ("dump_parties", lambda: _column_rows(directory, "core_party", ("id", "short_name_en"))),
+        ("dump_ridings", lambda: _column_rows(directory, "core_riding", ("id", "name_en"))),
+        (
+            "dump_members",
+            lambda: _column_rows(
+                directory, "core_electedmember", ("politician_id", "riding_id", "party_id", "start_date", "end_date")
+            ),
+        ),
+        ("dump_bills", lambda: _bill_rows(directory)),
+        (
+            "dump_votes",
+            lambda: _column_rows(directory, "bills_votequestion", ("id", "bill_id", "session_id", "number", "date", "result")),
+        ),
+        ("dump_party_votes", lambda: _column_rows(directory, "bills_partyvote", ("votequestion_id", "party_id", "vote"))),
+        (
+            "dump_ballots",
+            lambda: _column_rows(directory, "bills_memberballot", ("votequestion_id", "politician_id", "vote")),
+        ),
+    ]
+
+    cursor = db_session.connection().connection.cursor()
+    try:
+        cursor.execute(STAGING_DDL)
+        for table, rows in staged:
+            _copy(cursor, table, rows())
+        cursor.execute("ANALYZE dump_politicians, dump_members, dump_bills, dump_votes, dump_ballots")
+        results = {"mps": _merge(cursor, "MPs", MPS_SQL, {"media_base": f"{OPENPARLIAMENT_BASE}/media/"})}
+        results["identities"] = _merge(cursor, "identities", IDENTITIES_SQL)
+        cursor.execute(DIVISIONS_SQL)
+        results["motions"] = _merge(cursor, "motions", MOTIONS_SQL)
+        results["ballots"] = _merge(cursor, "ballots", BALLOTS_SQL)
+        cursor.execute(MARKS_SQL)
+        last_introduced, last_vote = cursor.fetchone()
+    except Exception:
+        db_session.rollback()
+        raise
+    finally:
+        cursor.close()
+    db_session.commit()
+
+    # Let the next --incremental API run continue from where the export ends.
+    save_checkpoint(
+        db_session,
+        MOTIONS_RESOURCE,
+        high_water_date=last_introduced,
+        cursor={"last_vote_date": last_vote.isoformat() if isinstance(last_vote, date) else None},
+    )
+    return results
@@ -0,0 +1,108 @@
+"""Streaming ``<table>`` row extraction on top of ``html.parser``.
+
+The tokenizer is fed chunks of a page as they arrive and yields each row's
+cell texts as soon as the row closes, so no DOM is built and memory is
+bounded by one row rather than by the page.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional
+
+
+class TableRowParser(HTMLParser):
+    """Collect the ``<td>`` texts of each row of the first table on a page.
+
+    Cell text matches BeautifulSoup's ``get_text(strip=True)``: every text node
+    is stripped and the pieces are joined without a separator. Unclosed ``td``
+    and ``tr`` tags are closed implicitly, as browsers do.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[str]] = []
+        self.found_table = False
+        self.finished = False
+        self._depth = 0
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.finished:
+            return
+        self._end_text()
+        if tag == "table":
+            self._depth += 1
+            self.found_table = True
+        elif self._depth != 1:
+            return
+        elif tag == "tr":
+            self._end_row()
+            self._row = []
+        elif tag == "td":
+            self._end_cell()
+            if self._row is None:
+                self._row = []
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if self.finished or not self._depth:
+            return
+        self._end_text()
+        if tag == "table":
+            self._depth -= 1
+            if not self._depth:
+                self._end_row()
+                self.finished = True
+        elif self._depth != 1:
+            return
+        elif tag == "td":
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+
+    def handle_data(self, data):
+        # A text node may arrive in several pieces when it spans fed chunks.
+        if self._cell is not None:
+            self._text.append(data)
+
+    def _end_text(self) -> None:
+        if self._text:
+            text = "".join(self._text).strip()
+            self._text = []
+            if text and self._cell is not None:
+                self._cell.append(text)
+
+    def _end_cell(self) -> None:
+        self._end_text()
+        if self._cell is not None and self._row is not None:
+            self._row.append("".join(self._cell))
+        self._cell = None
+
+    def _end_row(self) -> None:
+        self._end_cell()
+        if self._row:
+            self.rows.append(self._row)
+        self._row = None
+
+
+def iter_table_rows(chunks: Iterable[str], parser: Optional[TableRowParser] = None) -> Iterator[List[str]]:
+    """Yield the cell texts of each row of the first table in ``chunks``.
+
+    Pass a ``parser`` to inspect ``found_table`` once the iterator is exhausted.
+    Reading stops as soon as the table closes.
+    """
+
+    parser = parser or TableRowParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.rows:
+            yield from parser.rows
+            parser.rows.clear()
+        if parser.finished:
+            return
+    parser.close()
+    yield from parser.rows
+    parser.rows.clear()
@@ -0,0 +1,63 @@
+"""Persistent OpenParliament politician slug -> MP id/party map."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from sqlalchemy.orm import Session
+
+from app.models import MP, PoliticianIdentity
+from app.services.data_ingestion.bulk import UpsertResult, bulk_upsert
+
+
+def politician_slug(url: Optional[str]) -> Optional[str]:
+    """Normalize ``/politicians/x/`` or an absolute API URL to ``/politicians/x``."""
+
+    if not url:
+        return None
+    return urlparse(url).path.rstrip("/") or None
+
+
+class PoliticianIdentityMap:
+    """In-memory copy of ``politician_identities`` loaded with two bulk queries.
+
+    Only slugs that resolved to an MP are persisted. A miss is remembered for
+    the current run alone, so a politician whose MP row is ingested later
+    resolves on the next run instead of staying unresolved for good.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self.mp_ids: Dict[str, Optional[int]] = dict(
+            db_session.query(PoliticianIdentity.slug, PoliticianIdentity.mp_id)
+            .filter(PoliticianIdentity.mp_id.isnot(None))
+            .all()
+        )
+        self.parties: Dict[int, str] = dict(db_session.query(MP.id, MP.party).all())
+        self._discovered: List[Dict[str, Any]] = []
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.mp_ids
+
+    def mp_id_for(self, slug: str) -> Optional[int]:
+        return self.mp_ids.get(slug)
+
+    def party_for(self, mp_id: Optional[int]) -> Optional[str]:
+        return self.parties.get(mp_id) if mp_id is not None else None
+
+    def is_known_mp(self, mp_id: int) -> bool:
+        return mp_id in self.parties
+
+    def remember(self, slug: str, mp_id: Optional[int], name: Optional[str] = None) -> None:
+        self.mp_ids[slug] = mp_id
+        if mp_id is not None:
+            self._discovered.append({"slug": slug, "mp_id": mp_id, "name": name, "party": self.party_for(mp_id)})
+
+    def flush(self) -> UpsertResult:
+        discovered, self._discovered = self._discovered, []
+        return bulk_upsert(self.db_session, PoliticianIdentity, discovered, key="slug")
+
+
+def identity_row(slug: str, mp_row: Dict[str, Any]) -> Dict[str, Any]:
+    return {"slug": slug, "mp_id": mp_row["id"], "name": mp_row["name"], "party": mp_row["party"]}
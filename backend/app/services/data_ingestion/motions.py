@@ -1,67 +1,107 @@
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
-from app.models import MP, Motion
+from app.models import MP, IngestionState, Motion
 from app.models.enums import MotionClassification
+from app.services.data_ingestion.bulk import UpsertResult, bulk_upsert
 from app.services.data_ingestion.common import (
     extract_parl_mp_id,
     fetch_openparliament,
     normalize_list,
     paginate_openparliament,
-    upsert_entities,
+    stable_id,
+)
+from app.services.data_ingestion.concurrency import fetch_ordered
+from app.services.data_ingestion.identities import PoliticianIdentityMap, politician_slug
+from app.services.data_ingestion.pipeline import PositionedRow, write_in_batches
+from app.services.data_ingestion.telemetry import timed
+from app.services.data_ingestion.state import (
+    IngestMode,
+    later_date,
+    load_checkpoint,
+    parse_iso_date,
+    resume_offset,
+    save_checkpoint,
+    with_resume,
+    without_resume,
 )
 
 logger = logging.getLogger(__name__)
 
 MAX_BILLS = 75
+RESOURCE = "motions"
 
 
 class SponsorResolver:
+    """Resolves sponsor URLs to MP ids from the preloaded politician identity map.
+
+    Slugs missing from the map (typically before the first MP ingest that
+    records identities) fall back to one detail fetch. A resolved MP is stored
+    so later runs stay offline; a miss is only cached for this run.
+    """
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
-        self.cache: Dict[str, Optional[int]] = {}
+        self.identities = PoliticianIdentityMap(db_session)
         self.fallback_mp_id: Optional[int] = self._get_fallback_mp_id()
 
     def _get_fallback_mp_id(self) -> Optional[int]:
         mp = self.db_session.query(MP).first()
         return mp.id if mp else None
 
+    def party_for(self, mp_id: Optional[int]) -> Optional[str]:
+        return self.identities.party_for(mp_id)
+
     def resolve(self, sponsor_path: Optional[str]) -> Optional[int]:
-        if not sponsor_path:
+        slug = politician_slug(sponsor_path)
+        if not slug:
             return self.fallback_mp_id
-        slug = sponsor_path.rstrip("/")
-        if slug in self.cache:
-            return self.cache[slug]
+        if slug in self.identities:
+            mp_id = self.identities.mp_id_for(slug)
+            return mp_id if mp_id is not None else self.fallback_mp_id
         try:
             detail = fetch_openparliament(sponsor_path)
         except Exception as exc:  # pragma: no cover - network dependent
             logger.warning("Failed to fetch sponsor detail %s: %s", sponsor_path, exc)
-            self.cache[slug] = self.fallback_mp_id
             return self.fallback_mp_id
         mp_id = extract_parl_mp_id(detail)
-        if mp_id is None:
-            mp_id = self.fallback_mp_id
-        else:
-            mp = self.db_session.query(MP).filter(MP.id == mp_id).first()
-            if not mp:
-                logger.debug("Sponsor MP %s not found in DB; using fallback", mp_id)
-                mp_id = self.fallback_mp_id
-        self.cache[slug] = mp_id
-        return mp_id
+        if mp_id is not None and not self.identities.is_known_mp(mp_id):
+            logger.debug("Sponsor MP %s not found in DB; using fallback", mp_id)
+            mp_id = None
+        self.identities.remember(slug, mp_id, detail.get("name"))
+        return mp_id if mp_id is not None else self.fallback_mp_id
+
+    def flush(self) -> None:
+        self.identities.flush()
 
 
-def _fetch_vote_summary(vote_urls: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Optional[bool]]:
+VoteDocuments = Dict[str, Optional[Dict[str, Any]]]
+# (summary, detail, vote_url, last_for_bill); bills without divisions get one job with no URL.
+VoteJob = Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[str], bool]
+
+
+def _fetch_vote_summary(
+    vote_urls: List[str],
+    vote_documents: Optional[VoteDocuments] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], Optional[bool], Optional[str]]:
+    """Party summary, outcome and URL of the first division that recorded party votes."""
+
     for vote_url in vote_urls or []:
-        try:
-            vote = fetch_openparliament(vote_url)
-        except Exception as exc:  # pragma: no cover - network dependent
-            logger.warning("Failed to fetch vote %s: %s", vote_url, exc)
-            continue
+        if vote_documents is not None and vote_url in vote_documents:
+            vote = vote_documents[vote_url]
+            if vote is None:
+                continue
+        else:
+            try:
+                vote = fetch_openparliament(vote_url)
+            except Exception as exc:  # pragma: no cover - network dependent
+                logger.warning("Failed to fetch vote %s: %s", vote_url, exc)
+                continue
         party_votes = {}
         for entry in vote.get("party_votes", []):
             party = entry.get("party", {}).get("short_name", {}).get("en")
@@ -73,25 +113,84 @@ def _fetch_vote_summary(vote_urls: List[str]) -> Tuple[Dict[str, Dict[str, Any]]
         if result:
             passed = any(keyword in result for keyword in ("passed", "agreed", "adopted", "royal assent"))
         if party_votes:
-            return party_votes, passed
-    return {}, None
+            return party_votes, passed, vote_url
+    return {}, None, None
 
 
-def scrape_motions() -> List[Dict[str, Any]]:
-    bills: List[Dict[str, Any]] = []
-    for summary in paginate_openparliament("/bills/", page_size=50, max_records=MAX_BILLS):
-        try:
-            detail = fetch_openparliament(summary["url"])
-            bills.append(detail)
-        except Exception as exc:  # pragma: no cover - network dependent
+def _incremental_bill_summaries(checkpoint: IngestionState) -> Tuple[List[Dict[str, Any]], Optional[date]]:
+    """Bills introduced since the high-water mark plus bills with divisions since the last vote."""
+
+    summaries: Dict[str, Dict[str, Any]] = {}
+    if checkpoint.high_water_date:
+        params = {"introduced__gte": checkpoint.high_water_date.isoformat()}
+        for summary in paginate_openparliament("/bills/", page_size=50, params=params):
+            summaries.setdefault(summary.get("url"), summary)
+
+    last_vote_date = parse_iso_date((checkpoint.cursor or {}).get("last_vote_date"))
+    latest_vote_date = last_vote_date
+    if last_vote_date:
+        params = {"date__gte": last_vote_date.isoformat()}
+        for vote in paginate_openparliament("/votes/", page_size=100, params=params):
+            latest_vote_date = later_date(latest_vote_date, parse_iso_date(vote.get("date")))
+            bill_url = vote.get("bill_url")
+            if bill_url:
+                summaries.setdefault(bill_url, {"url": bill_url})
+    return list(summaries.values()), latest_vote_date
+
+
+def _latest_vote_date() -> Optional[date]:
+    try:
+        data = fetch_openparliament("/votes/", {"limit": 1})
+    except Exception as exc:  # pragma: no cover - network dependent
+        logger.warning("Failed to fetch latest vote date: %s", exc)
+        return None
+    objects = data.get("objects") or []
+    return parse_iso_date(objects[0].get("date")) if objects else None
+
+
+def _vote_jobs(bills: Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Exception]]]) -> Iterator[VoteJob]:
+    for summary, detail, exc in bills:
+        if exc is not None:  # pragma: no cover - network dependent
             logger.warning("Failed to download bill detail %s: %s", summary.get("url"), exc)
-    return bills
+            yield summary, None, None, True
+            continue
+        vote_urls = detail.get("vote_urls") or [None]
+        for index, vote_url in enumerate(vote_urls):
+            yield summary, detail, vote_url, index == len(vote_urls) - 1
+
+
+def _download_vote(job: VoteJob) -> Optional[Dict[str, Any]]:
+    vote_url = job[2]
+    return fetch_openparliament(vote_url) if vote_url else None
+
+
+def scrape_motions(
+    summaries: Optional[Iterable[Dict[str, Any]]] = None,
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], VoteDocuments]]:
+    """Yield ``(summary, detail, vote_documents)`` in listing order; ``detail`` is ``None`` on failure.
+
+    Bill details and every one of their divisions are downloaded on the pool;
+    a division that failed to download maps to ``None``.
+    """
+
+    if summaries is None:
+        summaries = paginate_openparliament("/bills/", page_size=50, max_records=MAX_BILLS)
+    bills = fetch_ordered(summaries, lambda summary: fetch_openparliament(summary["url"]))
+    vote_documents: VoteDocuments = {}
+    for (summary, detail, vote_url, last), vote, exc in fetch_ordered(_vote_jobs(bills), _download_vote):
+        if vote_url:
+            if exc is not None:  # pragma: no cover - network dependent
+                logger.warning("Failed to fetch vote %s: %s", vote_url, exc)
+            vote_documents[vote_url] = vote
+        if last:
+            yield summary, detail, vote_documents
+            vote_documents = {}
 
 
 def normalize_motion(
     detail: Dict[str, Any],
     sponsor_resolver: SponsorResolver,
-    db_session: Session,
+    vote_documents: Optional[VoteDocuments] = None,
 ) -> Optional[Dict[str, Any]]:
     categories = normalize_list(
         [
@@ -100,19 +199,11 @@ def normalize_motion(
         ]
     )
     sponsor_mp_id = sponsor_resolver.resolve(detail.get("sponsor_politician_url"))
-    vote_summary, vote_passed = _fetch_vote_summary(detail.get("vote_urls") or [])
+    vote_summary, vote_passed, division_url = _fetch_vote_summary(detail.get("vote_urls") or [], vote_documents)
     status_text = (detail.get("status") or {}).get("en", "")
     description = status_text or detail.get("short_title", {}).get("en") or detail.get("name", {}).get("en")
-    introduced_str = detail.get("introduced")
-    introduced_date = None
-    if introduced_str:
-        try:
-            introduced_date = datetime.fromisoformat(introduced_str).date()
-        except ValueError:
-            try:
-                introduced_date = datetime.strptime(introduced_str.split("T")[0], "%Y-%m-%d").date()
-            except ValueError:
-                introduced_date = date.today()
+    # Undated bills stay undated: a run-date fallback would change their content hash every day.
+    introduced_date = parse_iso_date(detail.get("introduced"))
     classification = (
         MotionClassification.SUBSIDIARY if detail.get("private_member_bill") else MotionClassification.SUBSTANTIVE
     )
@@ -125,37 +216,82 @@ def normalize_motion(
         logger.debug("Skipping motion %s due to missing sponsor MP", detail.get("url"))
         return None
 
-    mp_party = None
-    if sponsor_mp_id:
-        mp = db_session.query(MP).filter(MP.id == sponsor_mp_id).first()
-        mp_party = mp.party if mp else None
+    mp_party = sponsor_resolver.party_for(sponsor_mp_id)
 
     return {
-        "id": detail.get("legisinfo_id") or abs(hash(detail.get("url"))) % 10_000_000,
+        "id": detail.get("legisinfo_id") or stable_id(detail.get("url") or ""),
         "title": detail.get("name", {}).get("en", "Unknown Motion"),
         "description": description,
         "introduced_by_mp_id": sponsor_mp_id,
         "introduced_by_party": mp_party,
         "vote_results_by_party": vote_summary,
+        "division_url": division_url,
         "passed": bool(passed),
         "categories": categories,
         "classification": classification.value,
-        "date": introduced_date or date.today(),
+        "date": introduced_date,
     }
 
 
-def ingest_motions(db_session) -> int:
+def ingest_motions(db_session, mode: IngestMode = IngestMode.DEFAULT) -> UpsertResult:
+    checkpoint = load_checkpoint(db_session, RESOURCE)
+    start = resume_offset(checkpoint, mode)
+    previous_high_water = None
+    if mode is IngestMode.INCREMENTAL and checkpoint is not None and checkpoint.high_water_date is not None:
+        previous_high_water = checkpoint.high_water_date
+        incremental_summaries, latest_vote_date = _incremental_bill_summaries(checkpoint)
+        logger.info("Motions: %s bills new or re-voted since checkpoint", len(incremental_summaries))
+        summaries: Iterable[Dict[str, Any]] = incremental_summaries[start:]
+    else:
+        if mode is IngestMode.INCREMENTAL:
+            logger.info("No motions checkpoint yet; running a default scan")
+        max_records = None if mode is IngestMode.FULL else MAX_BILLS
+        if max_records is not None:
+            max_records = max(0, max_records - start)
+        summaries = paginate_openparliament("/bills/", page_size=50, max_records=max_records, start_offset=start)
+        latest_vote_date = _latest_vote_date()
+    previous_cursor = without_resume(checkpoint.cursor if checkpoint else None)
+
     sponsor_resolver = SponsorResolver(db_session)
-    raw_records = scrape_motions()
-    normalized: List[Dict[str, Any]] = []
     seen_ids: set[int] = set()
-    for record in raw_records:
-        normalized_motion = normalize_motion(record, sponsor_resolver, db_session)
-        if not normalized_motion:
-            continue
-        motion_id = normalized_motion["id"]
-        if motion_id in seen_ids:
-            continue
-        seen_ids.add(motion_id)
-        normalized.append(normalized_motion)
-    return upsert_entities(db_session, Motion, normalized)
+    high_water = previous_high_water
+    failed_dates: List[Optional[date]] = []
+
+    def rows() -> Iterator[PositionedRow]:
+        nonlocal high_water
+        for position, (summary, detail, vote_documents) in enumerate(scrape_motions(summaries), start=start):
+            if detail is None:
+                failed_dates.append(parse_iso_date(summary.get("introduced")))
+                yield position, None
+                continue
+            high_water = later_date(high_water, parse_iso_date(detail.get("introduced")))
+            with timed("normalize"):
+                normalized_motion = normalize_motion(detail, sponsor_resolver, vote_documents)
+            if not normalized_motion or normalized_motion["id"] in seen_ids:
+                yield position, None
+                continue
+            seen_ids.add(normalized_motion["id"])
+            yield position, normalized_motion
+
+    def on_commit(position: int) -> None:
+        save_checkpoint(
+            db_session,
+            RESOURCE,
+            high_water_date=previous_high_water,
+            cursor=with_resume(previous_cursor, mode, position),
+        )
+
+    result = write_in_batches(rows(), lambda batch: bulk_upsert(db_session, Motion, batch), on_commit=on_commit)
+    sponsor_resolver.flush()
+
+    if failed_dates:
+        # Hold the marks back so the next incremental run retries the failed bills.
+        high_water = min(failed_dates) if all(failed_dates) else previous_high_water
+        latest_vote_date = parse_iso_date(previous_cursor.get("last_vote_date"))
+    save_checkpoint(
+        db_session,
+        RESOURCE,
+        high_water_date=high_water,
+        cursor={"last_vote_date": latest_vote_date.isoformat() if latest_vote_date else None},
+    )
+    return result
@@ -1,21 +1,36 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from app.models import MP
+from app.models import MP, PoliticianIdentity
+from app.services.data_ingestion.bulk import UpsertResult, bulk_upsert
 from app.services.data_ingestion.common import (
     OPENPARLIAMENT_BASE,
     extract_parl_mp_id,
     fetch_openparliament,
     paginate_openparliament,
-    upsert_entities,
+    stable_id,
+)
+from app.services.data_ingestion.concurrency import fetch_ordered
+from app.services.data_ingestion.identities import identity_row, politician_slug
+from app.services.data_ingestion.pipeline import PositionedRow, write_in_batches
+from app.services.data_ingestion.telemetry import timed
+from app.services.data_ingestion.state import (
+    IngestMode,
+    load_checkpoint,
+    resume_offset,
+    save_checkpoint,
+    with_resume,
 )
 
 logger = logging.getLogger(__name__)
 
 MAX_POLITICIANS = 400
+RESOURCE = "mps"
 
 
 def _absolute_photo_url(path: Optional[str]) -> Optional[str]:
@@ -28,9 +43,8 @@ def _extract_mp_id(detail: Dict[str, Any]) -> int:
     extracted = extract_parl_mp_id(detail)
     if extracted:
         return extracted
-    # Fallback: hash the unique politician slug for deterministic ID
-    fallback = abs(hash(detail.get("url"))) % 10_000_000
-    return fallback or 1
+    # Fallback: derive a stable ID from the unique politician slug
+    return stable_id(detail.get("url") or "") or 1
 
 
 def _years_in_office(detail: Dict[str, Any]) -> Optional[int]:
@@ -49,6 +63,22 @@ def _years_in_office(detail: Dict[str, Any]) -> Optional[int]:
     return max(0, date.today().year - earliest.year)
 
 
+def _latest_term(detail: Dict[str, Any]) -> Tuple[Optional[date], bool]:
+    """Start of the most recent membership and whether it is still open."""
+
+    latest: Optional[Tuple[date, Dict[str, Any]]] = None
+    for membership in detail.get("memberships") or []:
+        try:
+            start = datetime.fromisoformat(membership.get("start_date") or "").date()
+        except ValueError:
+            continue
+        if latest is None or start > latest[0]:
+            latest = (start, membership)
+    if latest is None:
+        return None, bool(detail.get("current_riding"))
+    return latest[0], not latest[1].get("end_date")
+
+
 def _current_riding(detail: Dict[str, Any]) -> str:
     current = detail.get("memberships") or []
     if current:
@@ -72,19 +102,27 @@ def _current_party(detail: Dict[str, Any]) -> str:
     return "Independent"
 
 
-def scrape_mps() -> List[Dict[str, Any]]:
-    details: List[Dict[str, Any]] = []
-    for summary in paginate_openparliament("/politicians/", page_size=100, max_records=MAX_POLITICIANS):
-        try:
-            detail = fetch_openparliament(summary["url"])
-            details.append(detail)
-        except Exception as exc:  # pragma: no cover - network issues
+def _summary_fingerprint(summary: Dict[str, Any]) -> str:
+    payload = json.dumps(summary, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def scrape_mps(
+    summaries: Optional[Iterable[Dict[str, Any]]] = None,
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """Yield ``(summary, detail)`` pairs in listing order; ``detail`` is ``None`` when the download failed."""
+
+    if summaries is None:
+        summaries = paginate_openparliament("/politicians/", page_size=100, max_records=MAX_POLITICIANS)
+    for summary, detail, exc in fetch_ordered(summaries, lambda item: fetch_openparliament(item["url"])):
+        if exc is not None:  # pragma: no cover - network issues
             logger.warning("Failed to download politician detail %s: %s", summary.get("url"), exc)
-    return details
+        yield summary, detail
 
 
 def normalize_mp(detail: Dict[str, Any]) -> Dict[str, Any]:
     mp_id = _extract_mp_id(detail)
+    term_start, is_current = _latest_term(detail)
     normalized = {
         "id": mp_id,
         "name": detail.get("name", "Unknown"),
@@ -94,11 +132,61 @@ def normalize_mp(detail: Dict[str, Any]) -> Dict[str, Any]:
         "attendance_rate": None,
         "party_line_voting_rate": None,
         "years_in_office": _years_in_office(detail),
+        "term_start": term_start,
+        "is_current": is_current,
     }
     return normalized
 
 
-def ingest_mps(db_session) -> int:
-    raw_records = scrape_mps()
-    normalized = [normalize_mp(record) for record in raw_records]
-    return upsert_entities(db_session, MP, normalized)
+def ingest_mps(db_session, mode: IngestMode = IngestMode.DEFAULT) -> UpsertResult:
+    # The politician listing is small, so incremental runs re-read it and only
+    # download details for politicians whose listing entry changed.
+    checkpoint = load_checkpoint(db_session, RESOURCE)
+    known: Dict[str, str] = {}
+    if mode is IngestMode.INCREMENTAL and checkpoint is not None:
+        known = (checkpoint.cursor or {}).get("fingerprints") or {}
+    max_records = MAX_POLITICIANS if mode is IngestMode.DEFAULT else None
+
+    fingerprints: Dict[str, str] = {}
+    pending: List[Dict[str, Any]] = []
+    for summary in paginate_openparliament("/politicians/", page_size=100, max_records=max_records):
+        fingerprint = _summary_fingerprint(summary)
+        fingerprints[summary.get("url")] = fingerprint
+        if known.get(summary.get("url")) != fingerprint:
+            pending.append(summary)
+    logger.info("Politicians: %s listed, %s new or changed", len(fingerprints), len(pending))
+
+    # Incremental runs resume naturally through the saved fingerprints; other
+    # modes pick up after the last committed position of an interrupted run.
+    start = 0 if mode is IngestMode.INCREMENTAL else resume_offset(checkpoint, mode)
+    committed: Dict[str, str] = dict(known)
+    fetched: List[str] = []
+    slugs: Dict[int, str] = {}
+
+    def rows() -> Iterator[PositionedRow]:
+        for position, (summary, detail) in enumerate(scrape_mps(pending[start:]), start=start):
+            if detail is None:
+                yield position, None
+                continue
+            fetched.append(summary.get("url"))
+            with timed("normalize"):
+                normalized = normalize_mp(detail)
+            slugs[normalized["id"]] = politician_slug(summary.get("url"))
+            yield position, normalized
+
+    def write(batch: List[Dict[str, Any]]) -> UpsertResult:
+        result = bulk_upsert(db_session, MP, batch)
+        # Keep the slug -> MP identity map in step so motion ingestion can resolve sponsors offline.
+        identities = [identity_row(slugs.pop(row["id"]), row) for row in batch if slugs.get(row["id"])]
+        bulk_upsert(db_session, PoliticianIdentity, identities, key="slug")
+        return result
+
+    def on_commit(position: int) -> None:
+        committed.update((url, fingerprints[url]) for url in fetched)
+        fetched.clear()
+        save_checkpoint(db_session, RESOURCE, cursor=with_resume({"fingerprints": committed}, mode, position))
+
+    result = write_in_batches(rows(), write, on_commit=on_commit)
+    # Failed downloads keep their previous fingerprint so the next incremental run retries them.
+    save_checkpoint(db_session, RESOURCE, cursor={"fingerprints": committed})
+    return result
@@ -0,0 +1,77 @@
+"""Batching/write stage shared by the streaming ingestion pipelines.
+
+Each ingestor is a chain of generators (fetch -> normalize -> batch -> write).
+Generators are pull-based and ``fetch_ordered`` keeps a bounded window of
+in-flight downloads, so memory stays flat regardless of how many records the
+source yields.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.data_ingestion.bulk import UpsertResult
+from app.services.data_ingestion.telemetry import record_skipped, timed
+
+PositionedRow = Tuple[int, Optional[Dict[str, Any]]]
+
+
+def write_in_batches(
+    rows: Iterable[PositionedRow],
+    write: Callable[[List[Dict[str, Any]]], UpsertResult],
+    batch_size: Optional[int] = None,
+    on_commit: Optional[Callable[[int], None]] = None,
+) -> UpsertResult:
+    """Write ``(position, row)`` pairs in batches and report progress after each commit.
+
+    ``position`` is the index of the source item that produced the row; rows
+    may be ``None`` for items that were skipped so progress still advances.
+    ``on_commit`` receives the number of source items that are fully persisted.
+    """
+
+    size = batch_size or settings.INGEST_BATCH_SIZE
+    result = UpsertResult()
+    batch: List[Dict[str, Any]] = []
+    position: Optional[int] = None
+    for position, row in rows:
+        if row is not None:
+            batch.append(row)
+        else:
+            record_skipped()
+        if len(batch) >= size:
+            with timed("write"):
+                result += write(batch)
+            batch = []
+            if on_commit is not None:
+                on_commit(position + 1)
+    if batch:
+        with timed("write"):
+            result += write(batch)
+    if position is not None and on_commit is not None:
+        on_commit(position + 1)
+    return result
+
+
+class LineStream:
+    """Minimal file-like wrapper that lets ``COPY ... FROM STDIN`` pull lines lazily."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        buffered = len(self._buffer)
+        while size < 0 or buffered < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            buffered += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
@@ -0,0 +1,260 @@
+"""Per-host rate limiting, retries, adaptive concurrency and circuit breaking.
+
+Every ingestion request goes through ``send_with_retries``, which applies the
+host's policy:
+
+* a token bucket caps the sustained request rate (with a small burst);
+* an AIMD limiter adapts how many requests may be in flight, adding one slot
+  after a window of successes and halving when the host throttles or times out;
+* transient failures (429, 5xx, transport errors) are retried with full-jitter
+  exponential backoff, honouring ``Retry-After`` for the whole host;
+* a circuit breaker opens after consecutive failures. While it is open,
+  callers wait out the cooldown and then let a single probe through, instead
+  of failing, so an upstream outage delays a run rather than dropping records.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+from app.services.data_ingestion.telemetry import record_request
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+MAX_RETRY_AFTER = 300.0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request to this host for ``seconds`` (e.g. a ``Retry-After``)."""
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit: +1 after ``limit`` successes, halved on congestion."""
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, congested: bool = False) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if congested:
+                self._successes = 0
+                # Requests already in flight report the same congestion; shrink once per burst.
+                if now - self._last_decrease >= 1.0:
+                    self.limit = max(self.minimum, self.limit // 2)
+                    self._last_decrease = now
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._condition = threading.Condition()
+
+    def wait_until_allowed(self) -> None:
+        with self._condition:
+            while True:
+                if self.state == self.CLOSED:
+                    return
+                remaining = self._opened_at + self.cooldown - time.monotonic()
+                if remaining <= 0 and not self._probing:
+                    self.state = self.HALF_OPEN
+                    self._probing = True
+                    return
+                self._condition.wait(timeout=remaining if remaining > 0 else None)
+
+    def record_success(self) -> None:
+        with self._condition:
+            self._failures = 0
+            self._probing = False
+            self.state = self.CLOSED
+            self._condition.notify_all()
+
+    def release_probe(self) -> None:
+        """Let another caller probe when the current one ended without a verdict."""
+
+        with self._condition:
+            self._probing = False
+            self._condition.notify_all()
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns ``True`` when this failure opened the circuit."""
+
+        with self._condition:
+            self._failures += 1
+            reopened = self._probing
+            self._probing = False
+            if reopened or (self.state == self.CLOSED and self._failures >= self.threshold):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._condition.notify_all()
+                return True
+            self._condition.notify_all()
+            return False
+
+
+class HostPolicy:
+    def __init__(self, host: str):
+        self.host = host
+        self.bucket = TokenBucket(settings.INGEST_RATE_PER_HOST, settings.INGEST_RATE_BURST)
+        self.limiter = AdaptiveLimiter(settings.INGEST_CONCURRENCY, settings.INGEST_HTTP_MAX_CONNECTIONS)
+        self.breaker = CircuitBreaker(settings.INGEST_BREAKER_THRESHOLD, settings.INGEST_BREAKER_COOLDOWN)
+
+
+_policies: Dict[str, HostPolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def policy_for(url: str) -> HostPolicy:
+    host = urlsplit(url).netloc.lower()
+    with _policies_lock:
+        policy = _policies.get(host)
+        if policy is None:
+            policy = _policies[host] = HostPolicy(host)
+        return policy
+
+
+def reset_policies() -> None:
+    with _policies_lock:
+        _policies.clear()
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry ``attempt`` (0-based)."""
+
+    ceiling = min(settings.INGEST_RETRY_BACKOFF_MAX, settings.INGEST_RETRY_BACKOFF_BASE * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+def send_with_retries(url: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+    """Issue ``send()`` under ``url``'s host policy, retrying transient failures.
+
+    Returns the final response (which may still be an error status once the
+    attempts are exhausted, so callers keep using ``raise_for_status``) or
+    re-raises the last transport error.
+    """
+
+    policy = policy_for(url)
+    attempts = max(settings.INGEST_RETRY_ATTEMPTS, 1)
+    for attempt in range(attempts):
+        policy.breaker.wait_until_allowed()
+        policy.bucket.acquire()
+        policy.limiter.acquire()
+        response: Optional[httpx.Response] = None
+        started = time.perf_counter()
+        try:
+            response = send()
+        except httpx.TransportError as exc:
+            record_request(time.perf_counter() - started, retry=attempt > 0)
+            policy.limiter.release(congested=isinstance(exc, httpx.TimeoutException))
+            if policy.breaker.record_failure():
+                logger.warning("Circuit for %s opened after %s", policy.host, exc)
+            if attempt + 1 == attempts:
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("Retrying %s in %.1fs after %s", url, delay, exc)
+            time.sleep(delay)
+            continue
+        except BaseException:
+            policy.limiter.release()
+            policy.breaker.release_probe()
+            raise
+
+        record_request(time.perf_counter() - started, retry=attempt > 0)
+        if response.status_code not in RETRY_STATUSES:
+            policy.limiter.release()
+            policy.breaker.record_success()
+            return response
+
+        policy.limiter.release(congested=response.status_code in THROTTLE_STATUSES)
+        if policy.breaker.record_failure():
+            logger.warning("Circuit for %s opened after HTTP %s", policy.host, response.status_code)
+        if attempt + 1 == attempts:
+            return response
+        retry_after = retry_after_seconds(response)
+        if retry_after is not None:
+            policy.bucket.pause(retry_after)
+        delay = retry_after if retry_after is not None else backoff_delay(attempt)
+        logger.warning("Retrying %s in %.1fs after HTTP %s", url, delay, response.status_code)
+        response.close()
+        if retry_after is None:
+            time.sleep(delay)
+    raise AssertionError("unreachable")  # pragma: no cover
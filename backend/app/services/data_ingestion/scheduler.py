@@ -0,0 +1,261 @@
+"""Dependency-aware parallel runner for ingestion stages.
+
+Stages form a small DAG. A stage starts as soon as every dependency has
+succeeded, runs in its own thread with its own Session (and therefore its own
+pooled connection), and is bounded by a timeout. A failed or timed-out stage
+only skips the stages that depend on it; everything else keeps running.
+
+A timed-out stage is cancelled: its Session refuses any further statement or
+commit (``StageCancelled``), so whatever it was writing is rolled back and it
+never reaches the dataset version bump.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+FAILED = "failed"
+TIMED_OUT = "timeout"
+SKIPPED = "skipped"
+
+CANCELLED_KEY = "ingest_cancelled"
+
+
+class StageCancelled(RuntimeError):
+    """Raised inside a stage's thread once the scheduler has given up on it."""
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[Session], Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+@dataclass
+class StageOutcome:
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    depends_on: Tuple[str, ...] = field(default_factory=tuple)
+    # Set on timed-out stages: the abandoned thread, which may still be running.
+    thread: Optional[threading.Thread] = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+def select_stages(
+    stages: Sequence[Stage],
+    only: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None,
+) -> List[Stage]:
+    """Filter ``stages`` by name; dependencies on stages left out are treated as satisfied."""
+
+    names = [stage.name for stage in stages]
+    requested = set(only) if only else set(names)
+    excluded = set(skip or ())
+    unknown = (requested | excluded) - set(names)
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(sorted(unknown))}; choose from {', '.join(names)}")
+    chosen = requested - excluded
+    return [
+        Stage(stage.name, stage.run, tuple(dep for dep in stage.depends_on if dep in chosen), stage.timeout)
+        for stage in stages
+        if stage.name in chosen
+    ]
+
+
+def check_cancelled(session: Session) -> None:
+    """Raise ``StageCancelled`` if the stage owning ``session`` has been abandoned."""
+
+    cancelled = session.info.get(CANCELLED_KEY)
+    if cancelled is not None and cancelled.is_set():
+        raise StageCancelled("stage was abandoned after its timeout")
+
+
+def _guard(session: Session, cancelled: threading.Event) -> None:
+    # Checked before every statement (so between batches) and before every commit, raw-cursor stages included.
+    session.info[CANCELLED_KEY] = cancelled
+
+    def before_execute(state: ORMExecuteState) -> None:
+        check_cancelled(state.session)
+
+    event.listen(session, "do_orm_execute", before_execute)
+    event.listen(session, "before_commit", check_cancelled)
+
+
+def _run_stage(
+    stage: Stage,
+    session_factory: Callable[[], Session],
+    done: "queue.Queue[StageOutcome]",
+    cancelled: threading.Event,
+) -> None:
+    outcome = StageOutcome(stage.name, OK, started=time.perf_counter(), depends_on=stage.depends_on)
+    session = session_factory()
+    _guard(session, cancelled)
+    try:
+        outcome.result = stage.run(session)
+    except Exception as exc:
+        session.rollback()
+        outcome.status = FAILED
+        outcome.error = exc
+    finally:
+        session.close()
+        outcome.finished = time.perf_counter()
+        done.put(outcome)
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    session_factory: Callable[[], Session],
+    default_timeout: Optional[float] = None,
+    max_parallel: Optional[int] = None,
+) -> Dict[str, StageOutcome]:
+    """Run ``stages`` respecting ``depends_on`` and return an outcome per stage.
+
+    ``max_parallel`` caps how many stages run at once (``1`` runs them one at
+    a time in dependency order).
+
+    Threads are daemonic: Python cannot interrupt a running stage, so a stage
+    that exceeds its timeout is cancelled and abandoned rather than joined,
+    and its result is discarded. Cancelling makes its next statement or
+    commit raise ``StageCancelled``; nothing it writes afterwards is kept.
+    Its thread is kept on the outcome so callers can wait for it
+    (``wait_for_abandoned``) before closing shared resources.
+    """
+
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage {stage.name} depends on unknown stage(s): {', '.join(missing)}")
+
+    timeout = default_timeout if default_timeout is not None else settings.INGEST_STAGE_TIMEOUT
+    done: "queue.Queue[StageOutcome]" = queue.Queue()
+    outcomes: Dict[str, StageOutcome] = {}
+    pending = list(stages)
+    running: Dict[str, Tuple[float, float]] = {}
+    threads: Dict[str, threading.Thread] = {}
+    cancels: Dict[str, threading.Event] = {}
+
+    while pending or running:
+        progressed = False
+        for stage in list(pending):
+            statuses = [outcomes[dep].status for dep in stage.depends_on if dep in outcomes]
+            if any(status != OK for status in statuses):
+                pending.remove(stage)
+                progressed = True
+                outcomes[stage.name] = StageOutcome(stage.name, SKIPPED, depends_on=stage.depends_on)
+                logger.warning("Stage %s skipped: a dependency did not succeed", stage.name)
+            elif len(statuses) == len(stage.depends_on) and (not max_parallel or len(running) < max_parallel):
+                pending.remove(stage)
+                progressed = True
+                started = time.perf_counter()
+                limit = stage.timeout if stage.timeout is not None else timeout
+                running[stage.name] = (started, started + limit if limit else float("inf"))
+                logger.info("Stage %s started", stage.name)
+                cancels[stage.name] = threading.Event()
+                threads[stage.name] = threading.Thread(
+                    target=_run_stage,
+                    args=(stage, session_factory, done, cancels[stage.name]),
+                    name=f"ingest-{stage.name}",
+                    daemon=True,
+                )
+                threads[stage.name].start()
+        if not running:
+            if pending and not progressed:
+                raise ValueError(f"Stage dependencies form a cycle: {', '.join(stage.name for stage in pending)}")
+            continue
+
+        wait = min(deadline for _, deadline in running.values()) - time.perf_counter()
+        try:
+            outcome = done.get(timeout=None if wait == float("inf") else max(wait, 0))
+        except queue.Empty:
+            now = time.perf_counter()
+            for name, (started, deadline) in list(running.items()):
+                if deadline <= now:
+                    del running[name]
+                    cancels[name].set()
+                    outcomes[name] = StageOutcome(
+                        name,
+                        TIMED_OUT,
+                        started=started,
+                        finished=now,
+                        depends_on=by_name[name].depends_on,
+                        thread=threads[name],
+                    )
+                    logger.error("Stage %s timed out after %.1fs", name, now - started)
+            continue
+        if outcome.name not in running:
+            continue  # finished after it was already reported as timed out
+        del running[outcome.name]
+        outcomes[outcome.name] = outcome
+        if outcome.status == FAILED:
+            logger.error("Stage %s failed: %s", outcome.name, outcome.error, exc_info=outcome.error)
+        else:
+            logger.info("Stage %s finished in %.1fs: %s", outcome.name, outcome.duration, outcome.result)
+
+    return {stage.name: outcomes[stage.name] for stage in stages}
+
+
+def wait_for_abandoned(outcomes: Dict[str, StageOutcome], timeout: float) -> List[str]:
+    """Give timed-out stages up to ``timeout`` seconds to finish; return the names still running."""
+
+    deadline = time.monotonic() + timeout
+    for outcome in outcomes.values():
+        if outcome.thread is not None:
+            outcome.thread.join(max(deadline - time.monotonic(), 0))
+    return [name for name, outcome in outcomes.items() if outcome.thread is not None and outcome.thread.is_alive()]
+
+
+def critical_path(outcomes: Dict[str, StageOutcome]) -> Tuple[List[str], float]:
+    """Longest chain of dependent stages by wall time; it bounds the whole run."""
+
+    memo: Dict[str, Tuple[float, List[str]]] = {}
+
+    def longest(name: str) -> Tuple[float, List[str]]:
+        if name not in memo:
+            outcome = outcomes[name]
+            best: Tuple[float, List[str]] = (0.0, [])
+            for dep in outcome.depends_on:
+                candidate = longest(dep)
+                if candidate[0] > best[0]:
+                    best = candidate
+            memo[name] = (best[0] + outcome.duration, best[1] + [name])
+        return memo[name]
+
+    if not outcomes:
+        return [], 0.0
+    total, path = max((longest(name) for name in outcomes), key=lambda item: item[0])
+    return path, total
+
+
+def format_summary(outcomes: Dict[str, StageOutcome]) -> str:
+    lines = [f"{'stage':<14} {'status':<8} {'seconds':>8}  result"]
+    for outcome in outcomes.values():
+        detail = outcome.error if outcome.error is not None else outcome.result
+        lines.append(f"{outcome.name:<14} {outcome.status:<8} {outcome.duration:>8.1f}  {detail if detail is not None else ''}")
+    path, total = critical_path(outcomes)
+    lines.append(f"critical path: {' -> '.join(path) or '-'} ({total:.1f}s)")
+    return "\n".join(lines)
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-import hashlib
 import logging
-from typing import Any, Dict, List
+import tempfile
+from datetime import date
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+import httpx
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models import MP, SpendingEntry
-from app.services.data_ingestion.common import fetch_html, upsert_entities
+from app.services.data_ingestion.bulk import UpsertResult, bulk_upsert
+from app.services.data_ingestion.common import stable_id, stream_html
+from app.services.data_ingestion.concurrency import fetch_ordered
+from app.services.data_ingestion.html_table import TableRowParser, iter_table_rows
+from app.services.data_ingestion.pipeline import write_in_batches
+from app.services.data_ingestion.telemetry import record_skipped
+from app.services.data_ingestion.state import IngestMode, load_checkpoint, save_checkpoint
 
 logger = logging.getLogger(__name__)
 
-SPENDING_YEAR = 2026
-SPENDING_QUARTER = 1
-SPENDING_URL = f"https://www.ourcommons.ca/ProactiveDisclosure/en/members/{SPENDING_YEAR}/{SPENDING_QUARTER}"
+SPENDING_URL_TEMPLATE = "https://www.ourcommons.ca/ProactiveDisclosure/en/members/{year}/{quarter}"
 CATEGORIES = ["Salaries", "Travel", "Hospitality", "Contracts"]
+RESOURCE = "spending"
+# Downloaded pages spill from memory to a temporary file beyond this size.
+SPOOL_MEMORY_BYTES = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
 
 
 def _normalize_name(value: str) -> str:
@@ -35,70 +45,196 @@ def _parse_currency(value: str) -> float:
         return 0.0
 
 
-def _deterministic_id(key: str) -> int:
-    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
-    return int(digest[:8], 16) & 0x7FFFFFFF
-
-
 def _build_mp_index(db_session: Session) -> Dict[str, int]:
     return {mp.name.lower(): mp.id for mp in db_session.query(MP).all()}
 
 
-def scrape_spending_rows() -> List[Dict[str, Any]]:
-    html = fetch_html(SPENDING_URL)
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table")
-    if not table:
-        logger.warning("Spending table not found on %s", SPENDING_URL)
-        return []
+# (fiscal year, quarter); fiscal years start in April, so Q1 is April-June.
+Period = Tuple[int, int]
+
+
+def spending_url(period: Period) -> str:
+    year, quarter = period
+    return SPENDING_URL_TEMPLATE.format(year=year, quarter=quarter)
+
+
+def fiscal_label(period: Period) -> str:
+    year, quarter = period
+    return f"{year}-Q{quarter}"
+
+
+def current_period(today: Optional[date] = None) -> Period:
+    today = today or date.today()
+    if today.month >= 4:
+        return today.year, (today.month - 4) // 3 + 1
+    return today.year - 1, 4
+
+
+def _previous_period(period: Period) -> Period:
+    year, quarter = period
+    return (year, quarter - 1) if quarter > 1 else (year - 1, 4)
+
+
+def available_periods(first_year: Optional[int] = None, today: Optional[date] = None) -> List[Period]:
+    """Every quarter from ``first_year`` Q1 up to the current one, oldest first."""
+
+    latest = current_period(today)
+    first_year = first_year or settings.INGEST_SPENDING_FIRST_YEAR
+    return [
+        (year, quarter)
+        for year in range(first_year, latest[0] + 1)
+        for quarter in range(1, 5)
+        if (year, quarter) <= latest
+    ]
+
+
+def _recent_periods(today: Optional[date] = None) -> List[Period]:
+    # The current quarter is usually not published yet, so also try the one before.
+    latest = current_period(today)
+    return [_previous_period(latest), latest]
+
+
+def _spending_row(cells: List[str]) -> Optional[Dict[str, Any]]:
+    if len(cells) < 7:
+        return None
+    return {
+        "name": _normalize_name(cells[0]),
+        "riding": cells[1],
+        "party": cells[2],
+        "amounts": {
+            "Salaries": _parse_currency(cells[3]),
+            "Travel": _parse_currency(cells[4]),
+            "Hospitality": _parse_currency(cells[5]),
+            "Contracts": _parse_currency(cells[6]),
+        },
+    }
 
-    rows: List[Dict[str, Any]] = []
-    for tr in table.find_all("tr"):
-        cells = [td.get_text(strip=True) for td in tr.find_all("td")]
-        if len(cells) < 7:
-            continue
-        entry = {
-            "name": _normalize_name(cells[0]),
-            "riding": cells[1],
-            "party": cells[2],
-            "amounts": {
-                "Salaries": _parse_currency(cells[3]),
-                "Travel": _parse_currency(cells[4]),
-                "Hospitality": _parse_currency(cells[5]),
-                "Contracts": _parse_currency(cells[6]),
-            },
-        }
-        rows.append(entry)
-    return rows
-
-
-def expand_spending_entries(rows: List[Dict[str, Any]], db_session: Session) -> List[Dict[str, Any]]:
-    mp_index = _build_mp_index(db_session)
-    fiscal_label = f"{SPENDING_YEAR}-Q{SPENDING_QUARTER}"
-    entries: List[Dict[str, Any]] = []
+
+def parse_spending_rows(chunks: Iterator[str], url: str) -> Iterator[Dict[str, Any]]:
+    """Yield disclosure rows from ``chunks`` of the page at ``url`` as they are parsed."""
+
+    parser = TableRowParser()
+    for cells in iter_table_rows(chunks, parser):
+        row = _spending_row(cells)
+        if row is not None:
+            yield row
+    if not parser.found_table:
+        logger.warning("Spending table not found on %s", url)
+
+
+def scrape_spending_rows(period: Period) -> Iterator[Dict[str, Any]]:
+    """Stream the disclosure table for ``period``, yielding rows as they are parsed."""
+
+    chunks = stream_html(spending_url(period))
+    try:
+        yield from parse_spending_rows(chunks, spending_url(period))
+    finally:
+        chunks.close()
+
+
+def _read_chunks(page: IO[str]) -> Iterator[str]:
+    while True:
+        chunk = page.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _download_period(period: Period) -> Optional[IO[str]]:
+    """Spool the raw page for ``period``; parsing happens in the consumer so no quarter is held as rows."""
+
+    page = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES, mode="w+", encoding="utf-8")
+    try:
+        for chunk in stream_html(spending_url(period)):
+            page.write(chunk)
+    except httpx.HTTPStatusError as exc:
+        page.close()
+        if exc.response.status_code == 404:
+            logger.info("Spending for %s is not published yet", fiscal_label(period))
+            return None
+        raise
+    except BaseException:
+        page.close()
+        raise
+    page.seek(0)
+    return page
+
+
+def expand_spending_entries(
+    rows: Iterable[Dict[str, Any]],
+    period: Period,
+    mp_index: Dict[str, int],
+) -> Iterator[Dict[str, Any]]:
+    label = fiscal_label(period)
+    details_url = spending_url(period)
 
     for row in rows:
         mp_id = mp_index.get(row["name"].lower())
         if not mp_id:
             logger.debug("Skipping spending row for %s; MP not found", row["name"])
+            record_skipped()
             continue
         for category, amount in row["amounts"].items():
-            key = f"{mp_id}:{category}:{fiscal_label}"
-            entry_id = _deterministic_id(key)
-            entries.append(
-                {
-                    "id": entry_id,
-                    "mp_id": mp_id,
-                    "category": category,
-                    "amount": amount,
-                    "fiscal_year": fiscal_label,
-                    "details_url": SPENDING_URL,
-                }
+            key = f"{mp_id}:{category}:{label}"
+            entry_id = stable_id(key)
+            yield {
+                "id": entry_id,
+                "mp_id": mp_id,
+                "category": category,
+                "amount": amount,
+                "fiscal_year": label,
+                "details_url": details_url,
+            }
+
+
+def _loaded_labels(db_session: Session) -> List[str]:
+    checkpoint = load_checkpoint(db_session, RESOURCE)
+    cursor = (checkpoint.cursor or {}) if checkpoint else {}
+    labels = set(cursor.get("loaded_periods") or [])
+    if cursor.get("fiscal_label"):
+        labels.add(cursor["fiscal_label"])
+    return sorted(labels)
+
+
+def ingest_spending(db_session, mode: IngestMode = IngestMode.DEFAULT, backfill: bool = False) -> UpsertResult:
+    """Load the recent quarters, or with ``backfill`` every quarter since the configured first year.
+
+    Quarters download concurrently into spooled temporary files, then are
+    parsed and written in order one row at a time. Each quarter is recorded in
+    the checkpoint once committed, so incremental runs (and a re-run after an
+    interrupted backfill) skip quarters that are already loaded.
+    """
+
+    periods = available_periods() if backfill else _recent_periods()
+    loaded = _loaded_labels(db_session)
+    if mode is IngestMode.INCREMENTAL:
+        periods = [period for period in periods if fiscal_label(period) not in loaded]
+    if not periods:
+        logger.info("Spending already loaded for every requested quarter; skipping")
+        return UpsertResult()
+
+    logger.info("Spending: loading %s quarter(s)", len(periods))
+    mp_index = _build_mp_index(db_session)
+    result = UpsertResult()
+    for period, page, exc in fetch_ordered(periods, _download_period):
+        label = fiscal_label(period)
+        if exc is not None:  # pragma: no cover - network dependent
+            logger.warning("Failed to download spending for %s: %s", label, exc)
+            continue
+        if page is None:
+            continue
+        with page:
+            rows = parse_spending_rows(_read_chunks(page), spending_url(period))
+            period_result = write_in_batches(
+                enumerate(expand_spending_entries(rows, period, mp_index)),
+                lambda batch: bulk_upsert(db_session, SpendingEntry, batch),
             )
-    return entries
-
-
-def ingest_spending(db_session) -> int:
-    rows = scrape_spending_rows()
-    normalized = expand_spending_entries(rows, db_session)
-    return upsert_entities(db_session, SpendingEntry, normalized)
+        logger.info("Spending %s: %s", label, period_result)
+        result += period_result
+        if not period_result.total:
+            # An empty table is not a loaded quarter; leave it for the next run.
+            continue
+        if label not in loaded:
+            loaded = sorted([*loaded, label])
+        save_checkpoint(db_session, RESOURCE, cursor={"loaded_periods": loaded})
+    return result
@@ -0,0 +1,68 @@
+"""Per-resource ingestion checkpoints used by incremental runs."""
+
+from __future__ import annotations
+
+from datetime import date
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import IngestionState
+
+
+class IngestMode(str, Enum):
+    DEFAULT = "default"
+    INCREMENTAL = "incremental"
+    FULL = "full"
+
+
+def load_checkpoint(db_session: Session, resource: str) -> Optional[IngestionState]:
+    return db_session.get(IngestionState, resource)
+
+
+def save_checkpoint(
+    db_session: Session,
+    resource: str,
+    high_water_date: Optional[date] = None,
+    cursor: Optional[Dict[str, Any]] = None,
+) -> IngestionState:
+    state = db_session.get(IngestionState, resource)
+    if state is None:
+        state = IngestionState(resource=resource)
+        db_session.add(state)
+    state.high_water_date = high_water_date
+    state.cursor = cursor
+    db_session.commit()
+    return state
+
+
+def resume_offset(checkpoint: Optional[IngestionState], mode: IngestMode) -> int:
+    """Source position an interrupted run of the same mode had fully committed."""
+
+    resume = ((checkpoint.cursor or {}) if checkpoint else {}).get("resume") or {}
+    if resume.get("mode") != mode.value:
+        return 0
+    return int(resume.get("offset") or 0)
+
+
+def with_resume(cursor: Optional[Dict[str, Any]], mode: IngestMode, offset: int) -> Dict[str, Any]:
+    return {**(cursor or {}), "resume": {"mode": mode.value, "offset": offset}}
+
+
+def without_resume(cursor: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {key: value for key, value in (cursor or {}).items() if key != "resume"}
+
+
+def later_date(*values: Optional[date]) -> Optional[date]:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def parse_iso_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
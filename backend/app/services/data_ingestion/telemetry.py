@@ -0,0 +1,258 @@
+"""Per-stage ingestion metrics, run reports and profiling hooks.
+
+Metrics are collected into the ``StageMetrics`` bound to the current context.
+The scheduler runs each stage in its own context, and ``fetch_ordered`` copies
+the context into its workers, so fetches made on download threads still count
+towards the stage that issued them. Outside an instrumented stage every
+``record_*`` call is a no-op.
+"""
+
+from __future__ import annotations
+
+import bisect
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.services.data_ingestion.bulk import CHANGED_KEYS_LIMIT, UpsertResult
+
+# Upper bounds (seconds) of the fetch latency histogram buckets; +Inf is implicit.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class StageMetrics:
+    stage: str
+    requests: int = 0
+    retries: int = 0
+    bytes_downloaded: int = 0
+    cache_hits: int = 0
+    latency_counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    latency_sum: float = 0.0
+    normalize_seconds: float = 0.0
+    write_seconds: float = 0.0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    rows_unchanged: int = 0
+    rows_skipped: int = 0
+    changed_ids: List[Any] = field(default_factory=list)
+    peak_memory_bytes: Optional[int] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **values: float) -> None:
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def observe_latency(self, seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.latency_sum += seconds
+            self.latency_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def record_result(self, result: Any) -> None:
+        if isinstance(result, dict):
+            for value in result.values():
+                self.record_result(value)
+        elif isinstance(result, UpsertResult):
+            self.add(rows_inserted=result.inserted, rows_updated=result.updated, rows_unchanged=result.unchanged)
+            with self._lock:
+                self.changed_ids.extend(result.changed[: max(CHANGED_KEYS_LIMIT - len(self.changed_ids), 0)])
+
+    def as_dict(self) -> Dict[str, Any]:
+        histogram = {f"le_{bound:g}": count for bound, count in zip(LATENCY_BUCKETS, self.latency_counts)}
+        histogram["le_inf"] = self.latency_counts[-1]
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes_downloaded": self.bytes_downloaded,
+            "cache_hits": self.cache_hits,
+            "fetch_latency": {"sum_seconds": round(self.latency_sum, 6), "buckets": histogram},
+            "normalize_seconds": round(self.normalize_seconds, 6),
+            "write_seconds": round(self.write_seconds, 6),
+            "rows": {
+                "inserted": self.rows_inserted,
+                "updated": self.rows_updated,
+                "unchanged": self.rows_unchanged,
+                "skipped": self.rows_skipped,
+            },
+            # At most CHANGED_KEYS_LIMIT ids; the count covers every changed row.
+            "changed_count": self.rows_inserted + self.rows_updated,
+            "changed_ids": self.changed_ids,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+_current: ContextVar[Optional[StageMetrics]] = ContextVar("ingest_stage_metrics", default=None)
+
+
+def current_metrics() -> Optional[StageMetrics]:
+    return _current.get()
+
+
+def record_request(seconds: float, retry: bool = False) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.observe_latency(seconds)
+        if retry:
+            metrics.add(retries=1)
+
+
+def record_bytes(count: int) -> None:
+    metrics = _current.get()
+    if metrics is not None and count:
+        metrics.add(bytes_downloaded=count)
+
+
+def record_cache_hit() -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add(cache_hits=1)
+
+
+def record_skipped(count: int = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None and count:
+        metrics.add(rows_skipped=count)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Accumulate wall time into ``<phase>_seconds`` (``normalize`` or ``write``)."""
+
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add(**{f"{phase}_seconds": time.perf_counter() - started})
+
+
+def instrument(
+    metrics: StageMetrics,
+    run: Callable[[Session], Any],
+    profile_dir: Optional[str] = None,
+    trace_memory: bool = False,
+) -> Callable[[Session], Any]:
+    """Wrap a stage's ``run`` so it records into ``metrics``.
+
+    ``profile_dir`` dumps ``<stage>.prof`` (cProfile of the stage thread; fetch
+    worker threads are not included). ``trace_memory`` records the tracemalloc
+    peak, which is only attributable when stages run one at a time.
+    """
+
+    def instrumented(session: Session) -> Any:
+        token = _current.set(metrics)
+        profiler = cProfile.Profile() if profile_dir else None
+        if trace_memory:
+            tracemalloc.reset_peak()
+        try:
+            if profiler is not None:
+                profiler.enable()
+            result = run(session)
+            metrics.record_result(result)
+            return result
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                os.makedirs(profile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(profile_dir, f"{metrics.stage}.prof"))
+            if trace_memory:
+                metrics.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            _current.reset(token)
+
+    return instrumented
+
+
+def build_report(
+    outcomes: Dict[str, Any],
+    metrics: Dict[str, StageMetrics],
+    mode: str,
+    started_at: datetime,
+    critical_path: List[str],
+) -> Dict[str, Any]:
+    stages = {}
+    for name, outcome in outcomes.items():
+        stages[name] = {
+            "status": outcome.status,
+            "duration_seconds": round(outcome.duration, 6),
+            "error": str(outcome.error) if outcome.error is not None else None,
+            **metrics[name].as_dict(),
+        }
+    return {
+        "mode": mode,
+        "started_at": started_at.isoformat(),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "critical_path": critical_path,
+        "stages": stages,
+    }
+
+
+def write_json_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+        handle.write("\n")
+
+
+def prometheus_text(report: Dict[str, Any]) -> str:
+    """Render a run report in the Prometheus text exposition format (e.g. for the node exporter textfile collector)."""
+
+    families = [
+        ("ingest_stage_duration_seconds", "gauge", "Wall time of the stage."),
+        ("ingest_stage_success", "gauge", "1 when the stage finished successfully."),
+        ("ingest_requests_total", "counter", "HTTP requests issued, including retries."),
+        ("ingest_retries_total", "counter", "HTTP requests that were retries."),
+        ("ingest_bytes_downloaded_total", "counter", "Response bytes downloaded."),
+        ("ingest_cache_hits_total", "counter", "Responses served from the local cache."),
+        ("ingest_fetch_latency_seconds", "histogram", "Latency of individual HTTP requests."),
+        ("ingest_phase_seconds", "gauge", "Time spent normalizing records and writing to the database."),
+        ("ingest_rows_total", "counter", "Rows by write outcome."),
+        ("ingest_peak_memory_bytes", "gauge", "tracemalloc peak while the stage ran."),
+    ]
+    samples: Dict[str, List[str]] = {name: [] for name, _, _ in families}
+    for stage, data in report["stages"].items():
+        label = f'stage="{stage}"'
+        samples["ingest_stage_duration_seconds"].append(f"ingest_stage_duration_seconds{{{label}}} {data['duration_seconds']}")
+        samples["ingest_stage_success"].append(f"ingest_stage_success{{{label}}} {int(data['status'] == 'ok')}")
+        samples["ingest_requests_total"].append(f"ingest_requests_total{{{label}}} {data['requests']}")
+        samples["ingest_retries_total"].append(f"ingest_retries_total{{{label}}} {data['retries']}")
+        samples["ingest_bytes_downloaded_total"].append(f"ingest_bytes_downloaded_total{{{label}}} {data['bytes_downloaded']}")
+        samples["ingest_cache_hits_total"].append(f"ingest_cache_hits_total{{{label}}} {data['cache_hits']}")
+        cumulative = 0
+        for bucket, count in data["fetch_latency"]["buckets"].items():
+            cumulative += count
+            bound = "+Inf" if bucket == "le_inf" else bucket[3:]
+            samples["ingest_fetch_latency_seconds"].append(
+                f'ingest_fetch_latency_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+            )
+        samples["ingest_fetch_latency_seconds"].append(
+            f"ingest_fetch_latency_seconds_sum{{{label}}} {data['fetch_latency']['sum_seconds']}"
+        )
+        samples["ingest_fetch_latency_seconds"].append(f"ingest_fetch_latency_seconds_count{{{label}}} {cumulative}")
+        for phase in ("normalize", "write"):
+            samples["ingest_phase_seconds"].append(
+                f'ingest_phase_seconds{{{label},phase="{phase}"}} {data[f"{phase}_seconds"]}'
+            )
+        for outcome, count in data["rows"].items():
+            samples["ingest_rows_total"].append(f'ingest_rows_total{{{label},outcome="{outcome}"}} {count}')
+        if data["peak_memory_bytes"] is not None:
+            samples["ingest_peak_memory_bytes"].append(f"ingest_peak_memory_bytes{{{label}}} {data['peak_memory_bytes']}")
+
+    lines: List[str] = []
+    for name, kind, help_text in families:
+        if samples[name]:
+            lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples[name]])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,61 @@
+"""Process-wide HTTP client shared by every ingestion fetch."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client() -> httpx.Client:
+    http2 = settings.INGEST_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("INGEST_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        follow_redirects=True,
+        headers={"User-Agent": settings.INGEST_USER_AGENT},
+        timeout=httpx.Timeout(settings.INGEST_HTTP_TIMEOUT, connect=settings.INGEST_HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.INGEST_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.INGEST_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.INGEST_HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Return the shared pooled client, creating it on first use."""
+
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = build_http_client()
+    return _client
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,127 @@
+"""Dataset version shared by every API worker.
+
+Anything that changes served data (an ingestion stage, a vote) bumps the
+single ``dataset_version`` row in the same transaction as its writes. Each
+worker runs a ``DatasetVersionTracker`` that polls the row and notifies its
+listeners (the response cache) when the version moves, so caches drop stale
+entries without a restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import Update, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import DatasetVersion
+
+logger = logging.getLogger(__name__)
+
+ROW_ID = 1
+
+
+def _bump_statement() -> Update:
+    return (
+        update(DatasetVersion)
+        .where(DatasetVersion.id == ROW_ID)
+        .values(version=DatasetVersion.version + 1, updated_at=func.now())
+        .returning(DatasetVersion.version, DatasetVersion.updated_at)
+    )
+
+
+def _first_version(db) -> Tuple[int, datetime]:
+    updated_at = datetime.now(timezone.utc)
+    db.add(DatasetVersion(id=ROW_ID, version=1, updated_at=updated_at))
+    return 1, updated_at
+
+
+def bump_dataset_version(db: Session) -> Tuple[int, datetime]:
+    """Increment the version inside the caller's transaction; returns the new version and its timestamp."""
+
+    row = db.execute(_bump_statement()).first()
+    return (row.version, row.updated_at) if row is not None else _first_version(db)
+
+
+async def bump_dataset_version_async(db: AsyncSession) -> Tuple[int, datetime]:
+    row = (await db.execute(_bump_statement())).first()
+    return (row.version, row.updated_at) if row is not None else _first_version(db)
+
+
+class DatasetVersionTracker:
+    def __init__(self, session_factory: sessionmaker = SessionLocal, interval: Optional[float] = None):
+        self.session_factory = session_factory
+        self.interval = interval if interval is not None else settings.DATASET_VERSION_POLL_SECONDS
+        self.version = 0
+        self.updated_at: Optional[datetime] = None
+        self._listeners: List[Callable[[int], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        self._listeners.append(listener)
+
+    def observe(self, version: int, updated_at: Optional[datetime] = None) -> None:
+        """Adopt ``version`` if it is newer, e.g. right after this worker bumped it.
+
+        A newer ``updated_at`` for the current version is still taken, so
+        ``Last-Modified`` never lags the data this worker serves.
+        """
+
+        if updated_at is not None and updated_at.tzinfo is None:
+            # SQLite hands back naive timestamps; the column is stored in UTC.
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        with self._lock:
+            if version < self.version:
+                return
+            if updated_at is not None and (self.updated_at is None or updated_at > self.updated_at):
+                self.updated_at = updated_at
+            if version == self.version:
+                return
+            self.version = version
+        for listener in self._listeners:
+            listener(version)
+
+    def refresh(self) -> int:
+        db = self.session_factory()
+        try:
+            row = db.execute(select(DatasetVersion.version, DatasetVersion.updated_at).where(DatasetVersion.id == ROW_ID)).first()
+        finally:
+            db.close()
+        if row is not None:
+            self.observe(row.version, row.updated_at)
+        return self.version
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as exc:  # pragma: no cover - database dependent
+                logger.warning("Could not poll the dataset version: %s", exc)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        try:
+            self.refresh()
+        except Exception as exc:  # pragma: no cover - database dependent
+            logger.warning("Could not read the dataset version: %s", exc)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name="dataset-version", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+
+dataset_versions = DatasetVersionTracker()
@@ -31,6 +31,8 @@ DEMO_MPS: List[Dict] = [
         "attendance_rate": 94.0,
         "party_line_voting_rate": 87.0,
         "years_in_office": 6,
+        "term_start": date(2019, 10, 21),
+        "is_current": True,
     },
     {
         "id": 2,
@@ -41,6 +43,8 @@ DEMO_MPS: List[Dict] = [
         "attendance_rate": 91.0,
         "party_line_voting_rate": 82.0,
         "years_in_office": 4,
+        "term_start": date(2021, 9, 20),
+        "is_current": True,
     },
 ]
 
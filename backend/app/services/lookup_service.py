@@ -1,24 +1,140 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
 from dataclasses import dataclass
-from typing import Optional
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.mp import MP
+from app.services.postal_index import (
+    POSTAL_CODE_PATTERN,
+    PostalCodeIndex,
+    normalize_postal_code,
+    province_for,
+)
+from app.services.riding_boundaries import RidingBoundaryIndex
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class PostalCodeLookupResult:
     postal_code: str
-    presumed_riding: str
-    presumed_province: str
+    presumed_riding: Optional[str]
+    presumed_province: Optional[str]
     mp_id: Optional[int]
+    # "postal_code" for an exact match, "fsa" when only the first three characters matched.
+    match: Optional[str] = None
+
+
+@dataclass
+class CoordinateLookupResult:
+    latitude: float
+    longitude: float
+    presumed_riding: Optional[str]
+    mp_id: Optional[int]
+
+
+def riding_key(name: str) -> str:
+    """Fold accents, dash styles and spacing so Elections Canada and OpenParliament riding names compare equal."""
+
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(char for char in folded if not unicodedata.combining(char)).lower()
+    folded = re.sub(r"\s*(?:--|[\u2010-\u2015-])\s*", "-", folded)
+    return " ".join(folded.split())
 
 
 class LookupService:
     """Provides helper lookups for frontend dropdowns and search."""
 
+    def __init__(self, index_path: Optional[str] = None, boundaries_path: Optional[str] = None):
+        self.index_path = Path(index_path or settings.POSTAL_INDEX_PATH)
+        self.boundaries_path = Path(boundaries_path or settings.RIDING_BOUNDARIES_PATH)
+        self._index: Optional[PostalCodeIndex] = None
+        self._index_missing = False
+        self._boundaries: Optional[RidingBoundaryIndex] = None
+        self._boundaries_missing = False
+        self._mp_ids: Dict[str, int] = {}
+        self._mp_ids_loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _get_index(self) -> Optional[PostalCodeIndex]:
+        if self._index is None and not self._index_missing:
+            with self._lock:
+                if self._index is None and not self._index_missing:
+                    try:
+                        self._index = PostalCodeIndex(self.index_path)
+                    except FileNotFoundError:
+                        logger.warning("Postal code index %s not found; lookups will not resolve ridings", self.index_path)
+                        self._index_missing = True
+        return self._index
+
+    def _get_boundaries(self) -> Optional[RidingBoundaryIndex]:
+        if self._boundaries is None and not self._boundaries_missing:
+            with self._lock:
+                if self._boundaries is None and not self._boundaries_missing:
+                    try:
+                        self._boundaries = RidingBoundaryIndex.from_geojson(
+                            self.boundaries_path,
+                            settings.RIDING_BOUNDARIES_NAME_PROPERTY,
+                            settings.RIDING_BOUNDARIES_CELL_DEGREES,
+                        )
+                    except FileNotFoundError:
+                        logger.warning("Riding boundaries %s not found; coordinate lookups will not resolve", self.boundaries_path)
+                        self._boundaries_missing = True
+        return self._boundaries
+
+    def _riding_mp_ids(self) -> Dict[str, int]:
+        loaded_at = self._mp_ids_loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < settings.RIDING_MP_CACHE_SECONDS:
+            return self._mp_ids
+        with self._lock:
+            if self._mp_ids_loaded_at is loaded_at:
+                db = SessionLocal()
+                try:
+                    rows = db.execute(select(MP.id, MP.riding, MP.is_current, MP.term_start)).all()
+                finally:
+                    db.close()
+                # A riding keeps its former members; the sitting member wins, then the latest term.
+                rows = sorted(rows, key=lambda row: (bool(row.is_current), row.term_start or date.min, row.id))
+                self._mp_ids = {riding_key(row.riding): row.id for row in rows}
+                self._mp_ids_loaded_at = time.monotonic()
+        return self._mp_ids
+
+    def _resolve(self, code: str, mp_ids: Dict[str, int]) -> PostalCodeLookupResult:
+        formatted = normalize_postal_code(code)
+        if not POSTAL_CODE_PATTERN.match(formatted):
+            return PostalCodeLookupResult(formatted, None, None, None)
+        riding, match = (None, None)
+        index = self._get_index()
+        if index is not None:
+            riding, match = index.lookup(formatted)
+        mp_id = mp_ids.get(riding_key(riding)) if riding else None
+        return PostalCodeLookupResult(formatted, riding, province_for(formatted), mp_id, match)
+
     def lookup_postal_code(self, code: str) -> PostalCodeLookupResult:
-        formatted = code.upper().replace(" ", "")
-        # Placeholder mapping; integrate Elections Canada API here later.
-        return PostalCodeLookupResult(
-            postal_code=formatted,
-            presumed_riding="Placeholder Riding",
-            presumed_province="ON",
-            mp_id=None,
-        )
+        return self._resolve(code, self._riding_mp_ids())
+
+    def lookup_postal_codes(self, codes: Iterable[str]) -> List[PostalCodeLookupResult]:
+        mp_ids = self._riding_mp_ids()
+        resolved: Dict[str, PostalCodeLookupResult] = {}
+        results = []
+        for code in codes:
+            result = resolved.get(code)
+            if result is None:
+                result = resolved[code] = self._resolve(code, mp_ids)
+            results.append(result)
+        return results
+
+    def lookup_coordinates(self, latitude: float, longitude: float) -> CoordinateLookupResult:
+        boundaries = self._get_boundaries()
+        riding = boundaries.locate(latitude, longitude) if boundaries is not None else None
+        mp_id = self._riding_mp_ids().get(riding_key(riding)) if riding else None
+        return CoordinateLookupResult(latitude, longitude, riding, mp_id)
@@ -1,11 +1,57 @@
-from typing import List, Optional
+from datetime import date
+from typing import Optional, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Motion as MotionModel, MP, VoteRecord
 from app.models.enums import VoteChoice
+from app.models.motion import MOTION_DATE_SORT
 from app.schemas import AISummaryResponse, MotionVoteResponse
+from app.services.dataset_version import bump_dataset_version, bump_dataset_version_async, dataset_versions
+from app.services.pagination import Page, decode_cursor, estimate_count, optional_date, page_size, paginate
+
+
+def _list_statement(category: Optional[str], cursor: Optional[str] = None, limit: Optional[int] = None) -> Select:
+    statement = select(MotionModel).order_by(MOTION_DATE_SORT.desc(), MotionModel.id.desc())
+    if category:
+        statement = statement.where(MotionModel.categories.contains([category]))
+    if cursor:
+        motion_date, motion_id = decode_cursor(cursor, optional_date, int)
+        statement = statement.where(
+            tuple_(MOTION_DATE_SORT, MotionModel.id) < tuple_(motion_date or date.min, motion_id)
+        )
+    if limit:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _sort_key(motion: MotionModel) -> Tuple[Optional[date], int]:
+    return motion.date, motion.id
+
+
+def _vote_statement(motion_id: int, mp_id: int) -> Select:
+    return select(VoteRecord).where(VoteRecord.motion_id == motion_id, VoteRecord.mp_id == mp_id)
+
+
+def _require(instance, detail: str):
+    if not instance:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return instance
+
+
+def _ai_summary(motion: MotionModel) -> AISummaryResponse:
+    summary = (
+        f"This is a placeholder AI summary for '{motion.title}'. "
+        "Integrate your preferred LLM provider to replace this text."
+    )
+    return AISummaryResponse(motion_id=motion.id, summary=summary)
+
+
+def _normalize_vote(vote: str) -> VoteChoice:
+    return VoteChoice.YEA if vote == "upvote" else VoteChoice.NAY
 
 
 class MotionService:
@@ -14,50 +60,79 @@ class MotionService:
     def __init__(self, db: Session):
         self.db = db
 
-    def list_motions(self, category: Optional[str] = None, limit: Optional[int] = None) -> List[MotionModel]:
-        query = self.db.query(MotionModel).order_by(MotionModel.date.desc().nullslast())
-        if category:
-            query = query.filter(MotionModel.categories.isnot(None)).filter(
-                MotionModel.categories.contains([category])
-            )
-        if limit:
-            query = query.limit(limit)
-        return query.all()
+    def list_motions(
+        self, category: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
+        limit = page_size(limit, cursor)
+        return paginate(self.db.scalars(_list_statement(category, cursor, limit)).all(), limit, _sort_key)
+
+    def count_motions(self, category: Optional[str] = None) -> int:
+        return estimate_count(self.db, _list_statement(category))
 
     def get_motion(self, motion_id: int) -> MotionModel:
-        motion = self.db.query(MotionModel).filter(MotionModel.id == motion_id).first()
-        if not motion:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Motion not found")
-        return motion
+        return _require(self.db.get(MotionModel, motion_id), "Motion not found")
 
     def get_ai_summary(self, motion_id: int) -> AISummaryResponse:
-        motion = self.get_motion(motion_id)
-        summary = (
-            f"This is a placeholder AI summary for '{motion.title}'. "
-            "Integrate your preferred LLM provider to replace this text."
-        )
-        return AISummaryResponse(motion_id=motion.id, summary=summary)
+        return _ai_summary(self.get_motion(motion_id))
 
     def vote_on_motion(self, motion_id: int, mp_id: int, vote: str) -> MotionVoteResponse:
         motion = self.get_motion(motion_id)
-        mp = self.db.query(MP).filter(MP.id == mp_id).first()
-        if not mp:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="MP not found")
+        mp = _require(self.db.get(MP, mp_id), "MP not found")
 
-        normalized_vote = VoteChoice.YEA if vote == "upvote" else VoteChoice.NAY
+        normalized_vote = _normalize_vote(vote)
 
-        record = (
-            self.db.query(VoteRecord)
-            .filter(VoteRecord.motion_id == motion.id, VoteRecord.mp_id == mp.id)
-            .first()
-        )
+        record = self.db.scalars(_vote_statement(motion.id, mp.id)).first()
         if record:
             record.vote = normalized_vote
         else:
             record = VoteRecord(motion_id=motion.id, mp_id=mp.id, vote=normalized_vote)
             self.db.add(record)
 
+        version, updated_at = bump_dataset_version(self.db)
         self.db.commit()
         self.db.refresh(record)
+        # Let this worker's caches drop stale vote tallies without waiting for the next poll.
+        dataset_versions.observe(version, updated_at)
+
+        return MotionVoteResponse(motion_id=motion.id, mp_id=mp.id, vote=vote)
+
+
+class AsyncMotionService:
+    """``MotionService`` on an ``AsyncSession``, used when ``DB_ASYNC`` is enabled."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_motions(
+        self, category: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
+        limit = page_size(limit, cursor)
+        return paginate((await self.db.scalars(_list_statement(category, cursor, limit))).all(), limit, _sort_key)
+
+    async def count_motions(self, category: Optional[str] = None) -> int:
+        return await self.db.run_sync(estimate_count, _list_statement(category))
+
+    async def get_motion(self, motion_id: int) -> MotionModel:
+        return _require(await self.db.get(MotionModel, motion_id), "Motion not found")
+
+    async def get_ai_summary(self, motion_id: int) -> AISummaryResponse:
+        return _ai_summary(await self.get_motion(motion_id))
+
+    async def vote_on_motion(self, motion_id: int, mp_id: int, vote: str) -> MotionVoteResponse:
+        motion = await self.get_motion(motion_id)
+        mp = _require(await self.db.get(MP, mp_id), "MP not found")
+
+        normalized_vote = _normalize_vote(vote)
+
+        record = (await self.db.scalars(_vote_statement(motion.id, mp.id))).first()
+        if record:
+            record.vote = normalized_vote
+        else:
+            record = VoteRecord(motion_id=motion.id, mp_id=mp.id, vote=normalized_vote)
+            self.db.add(record)
+
+        version, updated_at = await bump_dataset_version_async(self.db)
+        await self.db.commit()
+        dataset_versions.observe(version, updated_at)
 
         return MotionVoteResponse(motion_id=motion.id, mp_id=mp.id, vote=vote)
@@ -1,13 +1,18 @@
-from typing import List, Optional
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, or_
+from sqlalchemy import Select, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models import MP, Motion, SpendingEntry, Speech, TransparencyEntry, VoteRecord
+from app.models.motion import MOTION_DATE_SORT
 from app.schemas import MP as MPSchema
 from app.schemas import (
     MPActivity,
+    MPProfile,
     MPSpendingSummary,
     MPTransparencySummary,
     MPVotingRecord,
@@ -15,6 +20,192 @@ from app.schemas import (
     SpendingEntry as SpendingEntrySchema,
     TransparencyEntry as TransparencyEntrySchema,
 )
+from app.services.pagination import Page, decode_cursor, estimate_count, optional_date, page_size, paginate
+
+# Statements and result shaping are shared by the sync and async services so
+# both API modes return identical payloads.
+
+
+def _list_statement(search: Optional[str], cursor: Optional[str] = None, limit: Optional[int] = None) -> Select:
+    statement = select(MP).order_by(MP.name.asc(), MP.id.asc())
+    if search:
+        like_pattern = f"%{search.strip()}%"
+        statement = statement.where(or_(MP.name.ilike(like_pattern), MP.riding.ilike(like_pattern)))
+    if cursor:
+        name, last_id = decode_cursor(cursor, str, int)
+        statement = statement.where(tuple_(MP.name, MP.id) > tuple_(name, last_id))
+    if limit:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _voting_record_statement(mp_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> Select:
+    statement = (
+        select(VoteRecord, Motion)
+        .join(Motion, VoteRecord.motion_id == Motion.id)
+        .where(VoteRecord.mp_id == mp_id)
+        .order_by(MOTION_DATE_SORT.desc(), Motion.id.desc())
+    )
+    if cursor:
+        motion_date, motion_id = decode_cursor(cursor, optional_date, int)
+        statement = statement.where(
+            tuple_(MOTION_DATE_SORT, Motion.id) < tuple_(motion_date or date.min, motion_id)
+        )
+    if limit:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _mp_sort_key(mp: MP) -> Tuple[str, int]:
+    return mp.name, mp.id
+
+
+def _voting_record_sort_key(row: Sequence) -> Tuple[Optional[date], int]:
+    motion = row[1]
+    return motion.date, motion.id
+
+
+def _activity_statement(mp_id: int) -> Select:
+    return select(
+        select(func.count(Speech.id)).where(Speech.mp_id == mp_id).scalar_subquery(),
+        select(func.count(Motion.id)).where(Motion.introduced_by_mp_id == mp_id).scalar_subquery(),
+    )
+
+
+def _spending_statement(mp_id: int) -> Select:
+    return select(SpendingEntry).where(SpendingEntry.mp_id == mp_id).order_by(SpendingEntry.fiscal_year.desc())
+
+
+def _transparency_statement(mp_id: int) -> Select:
+    return (
+        select(TransparencyEntry)
+        .where(TransparencyEntry.mp_id == mp_id)
+        .order_by(TransparencyEntry.filed_date.desc().nullslast())
+    )
+
+
+def _speeches_statement(mp_id: int) -> Select:
+    return select(Speech).where(Speech.mp_id == mp_id).order_by(Speech.date.desc().nullslast())
+
+
+def _voting_records(rows: Sequence) -> List[MPVotingRecord]:
+    return [
+        MPVotingRecord(motion_id=motion.id, motion_title=motion.title, vote=vote.vote.value)
+        for vote, motion in rows
+    ]
+
+
+def _activity(row: Sequence) -> MPActivity:
+    return MPActivity(speeches_count=row[0] or 0, motions_sponsored=row[1] or 0)
+
+
+def _spending_summary(entries: Sequence[SpendingEntry]) -> MPSpendingSummary:
+    total_amount = sum(entry.amount or 0 for entry in entries)
+    entry_schemas = [
+        SpendingEntrySchema(
+            id=entry.id,
+            mp_id=entry.mp_id,
+            category=entry.category,
+            amount=entry.amount,
+            fiscal_year=entry.fiscal_year,
+            details_url=entry.details_url,
+        )
+        for entry in entries
+    ]
+    return MPSpendingSummary(total_amount=total_amount, entries=entry_schemas)
+
+
+def _transparency_summary(entries: Sequence[TransparencyEntry]) -> MPTransparencySummary:
+    entry_schemas = [
+        TransparencyEntrySchema(
+            id=entry.id,
+            mp_id=entry.mp_id,
+            registry_type=entry.registry_type,
+            details=entry.details,
+            filed_date=entry.filed_date,
+        )
+        for entry in entries
+    ]
+    return MPTransparencySummary(filings_count=len(entries), entries=entry_schemas)
+
+
+def _speeches(speeches: Sequence[Speech]) -> List[SpeechSchema]:
+    return [
+        SpeechSchema(
+            id=speech.id,
+            mp_id=speech.mp_id,
+            motion_id=speech.motion_id,
+            title=speech.title,
+            content=speech.content,
+            date=speech.date,
+        )
+        for speech in speeches
+    ]
+
+
+def _recent_votes_statement(mp_id: int) -> Select:
+    return _voting_record_statement(mp_id, limit=settings.PROFILE_RECENT_VOTES)
+
+
+def _recent_votes(rows: Sequence) -> Page:
+    page = paginate(rows, settings.PROFILE_RECENT_VOTES, _voting_record_sort_key)
+    page.items = _voting_records(page.items)
+    return page
+
+
+PROFILE_SECTIONS = ("voting_record", "activity", "spending", "transparency", "speeches")
+
+# Profile sections loaded with one list query each: statement, shaping, and
+# whether the rows are single ORM entities (scalars) or tuples. A section shaped
+# into a ``Page`` also gets a ``<section>_next_cursor`` for its paged route.
+_PROFILE_LISTS: Dict[str, Tuple[Callable[[int], Select], Callable[[Sequence], Any], bool]] = {
+    "voting_record": (_recent_votes_statement, _recent_votes, False),
+    "spending": (_spending_statement, _spending_summary, True),
+    "transparency": (_transparency_statement, _transparency_summary, True),
+    "speeches": (_speeches_statement, _speeches, True),
+}
+
+
+def parse_profile_sections(include: Optional[str]) -> List[str]:
+    """Validate a comma-separated ``?include=`` value; ``None`` selects every section."""
+
+    if include is None:
+        return list(PROFILE_SECTIONS)
+    sections = [section.strip() for section in include.split(",") if section.strip()]
+    unknown = sorted(set(sections) - set(PROFILE_SECTIONS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown profile sections: {', '.join(unknown)}",
+        )
+    return sections
+
+
+def _profile_statement(mp_id: int, sections: Sequence[str]) -> Select:
+    # The MP row and the activity counts come back together in one round trip.
+    statement = select(MP).where(MP.id == mp_id)
+    if "activity" in sections:
+        statement = statement.add_columns(*_activity_statement(mp_id).selected_columns)
+    return statement
+
+
+def _profile(row: Optional[Sequence], sections: Sequence[str], lists: Dict[str, Any]) -> MPProfile:
+    mp = _require(row[0] if row else None)
+    profile = MPProfile.model_validate(mp)
+    if "activity" in sections:
+        profile.activity = _activity(row[1:])
+    for name, value in lists.items():
+        if isinstance(value, Page):
+            setattr(profile, f"{name}_next_cursor", value.next_cursor)
+            value = value.items
+        setattr(profile, name, value)
+    return profile
+
+
+def _require(mp: Optional[MP]) -> MP:
+    if not mp:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="MP not found")
+    return mp
 
 
 class MPService:
@@ -23,97 +214,109 @@ class MPService:
     def __init__(self, db: Session):
         self.db = db
 
-    def list_mps(self, search: Optional[str] = None) -> List[MPSchema]:
-        query = self.db.query(MP).order_by(MP.name.asc())
-        if search:
-            like_pattern = f"%{search.strip()}%"
-            query = query.filter(or_(MP.name.ilike(like_pattern), MP.riding.ilike(like_pattern)))
-        return query.all()
+    def list_mps(
+        self, search: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
+        limit = page_size(limit, cursor)
+        return paginate(self.db.scalars(_list_statement(search, cursor, limit)).all(), limit, _mp_sort_key)
+
+    def count_mps(self, search: Optional[str] = None) -> int:
+        return estimate_count(self.db, _list_statement(search))
 
     def get_mp(self, mp_id: int) -> MPSchema:
-        mp = self.db.query(MP).filter(MP.id == mp_id).first()
-        if not mp:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="MP not found")
-        return mp
+        return _require(self.db.get(MP, mp_id))
 
-    def get_voting_record(self, mp_id: int) -> List[MPVotingRecord]:
+    def get_voting_record(self, mp_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
         self.get_mp(mp_id)
-        records = (
-            self.db.query(VoteRecord, Motion)
-            .join(Motion, VoteRecord.motion_id == Motion.id)
-            .filter(VoteRecord.mp_id == mp_id)
-            .order_by(Motion.date.desc().nullslast())
-            .all()
-        )
-        return [
-            MPVotingRecord(motion_id=motion.id, motion_title=motion.title, vote=vote.vote.value)
-            for vote, motion in records
-        ]
+        limit = page_size(limit, cursor)
+        rows = self.db.execute(_voting_record_statement(mp_id, cursor, limit)).all()
+        page = paginate(rows, limit, _voting_record_sort_key)
+        page.items = _voting_records(page.items)
+        return page
+
+    def count_voting_record(self, mp_id: int) -> int:
+        return estimate_count(self.db, _voting_record_statement(mp_id))
 
     def get_parliamentary_activity(self, mp_id: int) -> MPActivity:
         self.get_mp(mp_id)
-        speeches_count = self.db.query(func.count(Speech.id)).filter(Speech.mp_id == mp_id).scalar() or 0
-        motions_sponsored = self.db.query(func.count(Motion.id)).filter(Motion.introduced_by_mp_id == mp_id).scalar() or 0
-        return MPActivity(speeches_count=speeches_count, motions_sponsored=motions_sponsored)
+        return _activity(self.db.execute(_activity_statement(mp_id)).one())
 
     def get_spending(self, mp_id: int) -> MPSpendingSummary:
         self.get_mp(mp_id)
-        entries = (
-            self.db.query(SpendingEntry)
-            .filter(SpendingEntry.mp_id == mp_id)
-            .order_by(SpendingEntry.fiscal_year.desc())
-            .all()
-        )
-        total_amount = sum(entry.amount or 0 for entry in entries)
-        entry_schemas = [
-            SpendingEntrySchema(
-                id=entry.id,
-                mp_id=entry.mp_id,
-                category=entry.category,
-                amount=entry.amount,
-                fiscal_year=entry.fiscal_year,
-                details_url=entry.details_url,
-            )
-            for entry in entries
-        ]
-        return MPSpendingSummary(total_amount=total_amount, entries=entry_schemas)
+        return _spending_summary(self.db.scalars(_spending_statement(mp_id)).all())
 
     def get_transparency(self, mp_id: int) -> MPTransparencySummary:
         self.get_mp(mp_id)
-        entries = (
-            self.db.query(TransparencyEntry)
-            .filter(TransparencyEntry.mp_id == mp_id)
-            .order_by(TransparencyEntry.filed_date.desc().nullslast())
-            .all()
-        )
-        entry_schemas = [
-            TransparencyEntrySchema(
-                id=entry.id,
-                mp_id=entry.mp_id,
-                registry_type=entry.registry_type,
-                details=entry.details,
-                filed_date=entry.filed_date,
-            )
-            for entry in entries
-        ]
-        return MPTransparencySummary(filings_count=len(entries), entries=entry_schemas)
+        return _transparency_summary(self.db.scalars(_transparency_statement(mp_id)).all())
 
     def get_speeches(self, mp_id: int) -> List[SpeechSchema]:
         self.get_mp(mp_id)
-        speeches = (
-            self.db.query(Speech)
-            .filter(Speech.mp_id == mp_id)
-            .order_by(Speech.date.desc().nullslast())
-            .all()
-        )
-        return [
-            SpeechSchema(
-                id=speech.id,
-                mp_id=speech.mp_id,
-                motion_id=speech.motion_id,
-                title=speech.title,
-                content=speech.content,
-                date=speech.date,
-            )
-            for speech in speeches
-        ]
+        return _speeches(self.db.scalars(_speeches_statement(mp_id)).all())
+
+    def get_profile(self, mp_id: int, sections: Sequence[str]) -> MPProfile:
+        row = self.db.execute(_profile_statement(mp_id, sections)).first()
+        _require(row[0] if row else None)
+        lists = {}
+        for name in sections:
+            if name in _PROFILE_LISTS:
+                statement, shape, scalars = _PROFILE_LISTS[name]
+                result = self.db.scalars(statement(mp_id)) if scalars else self.db.execute(statement(mp_id))
+                lists[name] = shape(result.all())
+        return _profile(row, sections, lists)
+
+
+class AsyncMPService:
+    """``MPService`` on an ``AsyncSession``, used when ``DB_ASYNC`` is enabled."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_mps(
+        self, search: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page:
+        limit = page_size(limit, cursor)
+        return paginate((await self.db.scalars(_list_statement(search, cursor, limit))).all(), limit, _mp_sort_key)
+
+    async def count_mps(self, search: Optional[str] = None) -> int:
+        return await self.db.run_sync(estimate_count, _list_statement(search))
+
+    async def get_mp(self, mp_id: int) -> MPSchema:
+        return _require(await self.db.get(MP, mp_id))
+
+    async def get_voting_record(self, mp_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        await self.get_mp(mp_id)
+        limit = page_size(limit, cursor)
+        rows = (await self.db.execute(_voting_record_statement(mp_id, cursor, limit))).all()
+        page = paginate(rows, limit, _voting_record_sort_key)
+        page.items = _voting_records(page.items)
+        return page
+
+    async def count_voting_record(self, mp_id: int) -> int:
+        return await self.db.run_sync(estimate_count, _voting_record_statement(mp_id))
+
+    async def get_parliamentary_activity(self, mp_id: int) -> MPActivity:
+        await self.get_mp(mp_id)
+        return _activity((await self.db.execute(_activity_statement(mp_id))).one())
+
+    async def get_spending(self, mp_id: int) -> MPSpendingSummary:
+        await self.get_mp(mp_id)
+        return _spending_summary((await self.db.scalars(_spending_statement(mp_id))).all())
+
+    async def get_transparency(self, mp_id: int) -> MPTransparencySummary:
+        await self.get_mp(mp_id)
+        return _transparency_summary((await self.db.scalars(_transparency_statement(mp_id))).all())
+
+    async def get_speeches(self, mp_id: int) -> List[SpeechSchema]:
+        await self.get_mp(mp_id)
+        return _speeches((await self.db.scalars(_speeches_statement(mp_id))).all())
+
+    async def get_profile(self, mp_id: int, sections: Sequence[str]) -> MPProfile:
+        row = (await self.db.execute(_profile_statement(mp_id, sections))).first()
+        _require(row[0] if row else None)
+        lists = {}
+        for name in sections:
+            if name in _PROFILE_LISTS:
+                statement, shape, scalars = _PROFILE_LISTS[name]
+                result = await (self.db.scalars(statement(mp_id)) if scalars else self.db.execute(statement(mp_id)))
+                lists[name] = shape(result.all())
+        return _profile(row, sections, lists)
@@ -0,0 +1,77 @@
+"""Process-wide MP typeahead kept in step with the dataset version.
+
+The index is built in the background at startup (or by the first request if
+that comes sooner). A request that sees a newer dataset version rebuilds it
+before answering: the response cache and ETags tag the answer with that
+version, so it must not come from an older index. The MP table is small, so
+the rebuild costs one short query, once per worker per ingest.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import MP
+from app.services.dataset_version import dataset_versions
+from app.services.typeahead import Suggestion, TypeaheadIndex
+
+logger = logging.getLogger(__name__)
+
+
+class MPSuggestions:
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        current_version: Callable[[], int] = lambda: dataset_versions.version,
+        max_results: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.current_version = current_version
+        self.max_results = max_results or settings.MP_SUGGEST_MAX_RESULTS
+        self._index: Optional[TypeaheadIndex] = None
+        self._lock = threading.Lock()
+
+    def build(self, version: int) -> TypeaheadIndex:
+        db = self.session_factory()
+        try:
+            rows = db.execute(select(MP.id, MP.name, MP.riding, MP.party, MP.photo_url).order_by(MP.name, MP.id)).all()
+        finally:
+            db.close()
+        return TypeaheadIndex(
+            (Suggestion(row.id, row.name, row.riding, row.party, row.photo_url) for row in rows),
+            max_results=self.max_results,
+            version=version,
+        )
+
+    def index(self) -> TypeaheadIndex:
+        version = self.current_version()
+        index = self._index
+        if index is None or index.version != version:
+            with self._lock:
+                # Another request may have rebuilt it while this one waited.
+                if self._index is None or self._index.version != version:
+                    self._index = self.build(version)
+                index = self._index
+        return index
+
+    def warm(self) -> None:
+        def build() -> None:
+            try:
+                self.index()
+            except Exception as exc:  # pragma: no cover - database dependent
+                logger.warning("Could not build the MP typeahead index: %s", exc)
+
+        threading.Thread(target=build, name="mp-typeahead", daemon=True).start()
+
+    def suggest(self, query: str, limit: int) -> List[Suggestion]:
+        return self.index().suggest(query, limit)
+
+
+mp_suggestions = MPSuggestions()
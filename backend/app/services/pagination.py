@@ -0,0 +1,113 @@
+"""Keyset pagination with opaque continuation tokens.
+
+A cursor is the URL-safe base64 of the JSON sort key of the last row served;
+the next page is read with a row-value comparison against that key
+(``(sort, id) < (:sort, :id)``), which an index on the same columns serves
+with a single seek, so page 1000 costs the same as page 1. Every listing is
+paged, ``API_PAGE_SIZE`` rows when no limit is given. Pages are returned as
+plain JSON lists with the continuation token in ``X-Next-Cursor``, set
+whenever more rows follow, so the response shape is unchanged.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+@dataclass
+class Page:
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    """Query parameters shared by every paginated route (``Depends(PageParams)``)."""
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            le=settings.API_MAX_PAGE_SIZE,
+            description=f"Page size (default {settings.API_PAGE_SIZE}); follow X-Next-Cursor for the rest",
+        ),
+        cursor: Optional[str] = Query(None, description="Continuation token from a previous X-Next-Cursor header"),
+        include_total: bool = Query(False, description="Add an X-Total-Count header with the planner's row estimate"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.include_total = include_total
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([value.isoformat() if isinstance(value, date) else value for value in values])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, *parsers: Callable[[Any], Any]) -> List[Any]:
+    """Decode ``token`` and convert each value with the matching parser; malformed tokens are a 400."""
+
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor arity")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def optional_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value is not None else None
+
+
+def page_size(limit: Optional[int], cursor: Optional[str] = None) -> int:
+    """Rows per page: ``limit`` when given, else ``API_PAGE_SIZE``, capped at ``API_MAX_PAGE_SIZE``."""
+
+    return min(limit or settings.API_PAGE_SIZE, settings.API_MAX_PAGE_SIZE)
+
+
+def paginate(rows: Sequence[Any], limit: int, sort_key: Callable[[Any], Sequence[Any]]) -> Page:
+    """Trim the ``limit + 1`` rows a statement fetched to one page, noting whether more follow."""
+
+    if len(rows) <= limit:
+        return Page(list(rows))
+    rows = list(rows[:limit])
+    return Page(rows, encode_cursor(sort_key(rows[-1])))
+
+
+def estimate_count(db: Session, statement: Select) -> int:
+    """Planner row estimate for ``statement`` on PostgreSQL (no scan); an exact count elsewhere."""
+
+    statement = statement.order_by(None).limit(None)
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        return db.scalar(select(func.count()).select_from(statement.subquery())) or 0
+    compiled = statement.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def apply_page_headers(response: Response, page: Page, total: Optional[int] = None) -> List[Any]:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return page.items
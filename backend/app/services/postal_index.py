@@ -0,0 +1,185 @@
+"""Precompiled, memory-mapped postal code -> riding index.
+
+The index is built once from a local Elections Canada postal code/riding
+extract and written as a flat binary file::
+
+    header   "<8sIII"  magic, postal code count, FSA count, riding count
+    codes    "<6sH"    sorted six-character postal codes and riding numbers
+    fsas     "<3sH"    sorted forward sortation areas and riding numbers
+    ridings  "<H" + n  length-prefixed UTF-8 riding names
+
+Lookups binary-search the fixed-width records straight out of the mmap, so
+loading is instant, memory is shared between worker processes, and a lookup
+costs about twenty slice comparisons. Postal codes missing from the file fall
+back to their FSA, whose riding is the one most of its postal codes map to
+(or an explicit three-character row in the source file).
+
+Build with::
+
+    python -m app.services.postal_index build postal_codes.csv data/postal_ridings.idx
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import mmap
+import re
+import struct
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b"RMPPCI01"
+HEADER = struct.Struct("<8sIII")
+CODE_RECORD = struct.Struct("<6sH")
+FSA_RECORD = struct.Struct("<3sH")
+LENGTH = struct.Struct("<H")
+
+POSTAL_CODE_PATTERN = re.compile(r"^[A-Z]\d[A-Z](\d[A-Z]\d)?$")
+
+# First letter of the FSA -> province/territory; X is split between NU and NT below.
+PROVINCE_BY_LETTER = {
+    "A": "NL",
+    "B": "NS",
+    "C": "PE",
+    "E": "NB",
+    "G": "QC",
+    "H": "QC",
+    "J": "QC",
+    "K": "ON",
+    "L": "ON",
+    "M": "ON",
+    "N": "ON",
+    "P": "ON",
+    "R": "MB",
+    "S": "SK",
+    "T": "AB",
+    "V": "BC",
+    "X": "NT",
+    "Y": "YT",
+}
+NUNAVUT_FSAS = {"X0A", "X0B", "X0C"}
+
+
+def normalize_postal_code(code: str) -> str:
+    return re.sub(r"[\s-]", "", code or "").upper()
+
+
+def province_for(code: str) -> Optional[str]:
+    if code[:3] in NUNAVUT_FSAS:
+        return "NU"
+    return PROVINCE_BY_LETTER.get(code[:1])
+
+
+class PostalCodeIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.code_count, self.fsa_count, riding_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a postal code index")
+        self._codes_offset = HEADER.size
+        self._fsas_offset = self._codes_offset + self.code_count * CODE_RECORD.size
+        offset = self._fsas_offset + self.fsa_count * FSA_RECORD.size
+        self.ridings: List[str] = []
+        for _ in range(riding_count):
+            (length,) = LENGTH.unpack_from(self._mm, offset)
+            offset += LENGTH.size
+            self.ridings.append(self._mm[offset : offset + length].decode("utf-8"))
+            offset += length
+
+    def _search(self, base: int, count: int, record: struct.Struct, key: bytes) -> Optional[int]:
+        width = len(key)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            offset = base + middle * record.size
+            probe = self._mm[offset : offset + width]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return record.unpack_from(self._mm, offset)[1]
+        return None
+
+    def lookup(self, code: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return ``(riding, match)`` for a normalized code; ``match`` is ``postal_code``, ``fsa`` or ``None``."""
+
+        if len(code) == 6:
+            riding = self._search(self._codes_offset, self.code_count, CODE_RECORD, code.encode("ascii"))
+            if riding is not None:
+                return self.ridings[riding], "postal_code"
+        riding = self._search(self._fsas_offset, self.fsa_count, FSA_RECORD, code[:3].encode("ascii"))
+        if riding is not None:
+            return self.ridings[riding], "fsa"
+        return None, None
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def build_index(
+    source: Path,
+    destination: Path,
+    code_column: str = "postal_code",
+    riding_column: str = "riding",
+) -> Tuple[int, int, int]:
+    """Compile a CSV of postal code/riding rows into an index file; returns the record counts."""
+
+    codes: Dict[str, str] = {}
+    explicit_fsas: Dict[str, str] = {}
+    with open(source, encoding="utf-8-sig", newline="") as handle:
+        for row in csv.DictReader(handle):
+            code = normalize_postal_code(row.get(code_column) or "")
+            riding = (row.get(riding_column) or "").strip()
+            if not riding or not POSTAL_CODE_PATTERN.match(code):
+                continue
+            (codes if len(code) == 6 else explicit_fsas)[code] = riding
+
+    votes: Dict[str, Counter] = defaultdict(Counter)
+    for code, riding in codes.items():
+        votes[code[:3]][riding] += 1
+    fsas = {fsa: counter.most_common(1)[0][0] for fsa, counter in votes.items()}
+    fsas.update(explicit_fsas)
+
+    ridings = sorted(set(codes.values()) | set(fsas.values()))
+    if len(ridings) > 0xFFFF:
+        raise ValueError("Too many distinct ridings for a 16-bit riding number")
+    numbers = {riding: number for number, riding in enumerate(ridings)}
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_suffix(destination.suffix + ".tmp")
+    with open(temporary, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, len(codes), len(fsas), len(ridings)))
+        for code in sorted(codes):
+            handle.write(CODE_RECORD.pack(code.encode("ascii"), numbers[codes[code]]))
+        for fsa in sorted(fsas):
+            handle.write(FSA_RECORD.pack(fsa.encode("ascii"), numbers[fsas[fsa]]))
+        for riding in ridings:
+            encoded = riding.encode("utf-8")
+            handle.write(LENGTH.pack(len(encoded)) + encoded)
+    # Readers map the file, so swap it in atomically rather than rewriting it in place.
+    temporary.replace(destination)
+    return len(codes), len(fsas), len(ridings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the postal code -> riding lookup index.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    build = subcommands.add_parser("build", help="Compile a postal code/riding CSV into an index file.")
+    build.add_argument("source", type=Path)
+    build.add_argument("destination", type=Path)
+    build.add_argument("--code-column", default="postal_code")
+    build.add_argument("--riding-column", default="riding")
+    args = parser.parse_args()
+
+    counts = build_index(args.source, args.destination, args.code_column, args.riding_column)
+    print(f"Wrote {args.destination}: {counts[0]} postal codes, {counts[1]} FSAs, {counts[2]} ridings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""In-process spatial index of riding boundary polygons.
+
+Boundaries are read from a GeoJSON export of the Elections Canada electoral
+district file in WGS84 longitude/latitude, e.g.::
+
+    ogr2ogr -f GeoJSON -t_srs EPSG:4326 data/riding_boundaries.geojson FED_CA_2023_EN.shp
+
+The index is a uniform grid of ``cell_size`` degree cells. Each cell lists the
+ridings whose bounding box overlaps it, and each riding keeps its boundary
+edges bucketed by grid row. A lookup therefore only ray-casts against the
+candidate ridings of one cell, and only against their edges that cross the
+point's row, instead of every vertex of every boundary.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+Edge = Tuple[float, float, float, float]
+Ring = Sequence[Sequence[float]]
+
+# Riding name properties used by the various Elections Canada boundary files.
+NAME_PROPERTIES = ("ENNAME", "FEDENAME", "ED_NAMEE", "name")
+
+
+@dataclass
+class _Riding:
+    name: str
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+    edges_by_row: Dict[int, List[Edge]] = field(default_factory=dict)
+
+
+def _rings(geometry: Dict) -> Iterable[Ring]:
+    if geometry["type"] == "Polygon":
+        yield from geometry["coordinates"]
+    elif geometry["type"] == "MultiPolygon":
+        for polygon in geometry["coordinates"]:
+            yield from polygon
+    else:
+        raise ValueError(f"Unsupported riding geometry {geometry['type']}")
+
+
+class RidingBoundaryIndex:
+    def __init__(self, features: Iterable[Tuple[str, Dict]], cell_size: float = 0.25):
+        self.cell_size = cell_size
+        self.ridings: List[_Riding] = []
+        self._grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for name, geometry in features:
+            self._add(name, geometry)
+        self._grid = dict(self._grid)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_size)
+
+    def _add(self, name: str, geometry: Dict) -> None:
+        edges: List[Edge] = []
+        for ring in _rings(geometry):
+            # Holes and the parts of a multipolygon need no special casing: the
+            # even-odd crossing count over every ring gives the right answer.
+            for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:]):
+                if y1 != y2:
+                    edges.append((x1, y1, x2, y2))
+        if not edges:
+            return
+        xs = [x for edge in edges for x in (edge[0], edge[2])]
+        ys = [y for edge in edges for y in (edge[1], edge[3])]
+        riding = _Riding(name, min(xs), min(ys), max(xs), max(ys))
+        by_row: Dict[int, List[Edge]] = defaultdict(list)
+        for edge in edges:
+            low, high = sorted((edge[1], edge[3]))
+            for row in range(self._cell(low), self._cell(high) + 1):
+                by_row[row].append(edge)
+        riding.edges_by_row = dict(by_row)
+
+        number = len(self.ridings)
+        self.ridings.append(riding)
+        for row in range(self._cell(riding.min_y), self._cell(riding.max_y) + 1):
+            for column in range(self._cell(riding.min_x), self._cell(riding.max_x) + 1):
+                self._grid[(column, row)].append(number)
+
+    def locate(self, latitude: float, longitude: float) -> Optional[str]:
+        x, y = longitude, latitude
+        row = self._cell(y)
+        for number in self._grid.get((self._cell(x), row), ()):
+            riding = self.ridings[number]
+            if not (riding.min_x <= x <= riding.max_x and riding.min_y <= y <= riding.max_y):
+                continue
+            inside = False
+            for x1, y1, x2, y2 in riding.edges_by_row.get(row, ()):
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+            if inside:
+                return riding.name
+        return None
+
+    @classmethod
+    def from_geojson(
+        cls,
+        path: Path,
+        name_property: Optional[str] = None,
+        cell_size: float = 0.25,
+    ) -> "RidingBoundaryIndex":
+        with open(path, encoding="utf-8") as handle:
+            collection = json.load(handle)
+
+        def features() -> Iterable[Tuple[str, Dict]]:
+            for feature in collection.get("features", []):
+                properties = feature.get("properties") or {}
+                keys = (name_property,) if name_property else NAME_PROPERTIES
+                name = next((properties[key] for key in keys if properties.get(key)), None)
+                if name and feature.get("geometry"):
+                    yield str(name).strip(), feature["geometry"]
+
+        return cls(features(), cell_size)
@@ -0,0 +1,192 @@
+import html
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, cast, func, literal, null, or_, select, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import MP, Motion, Speech
+from app.schemas import SearchHit
+from app.services.pagination import Page, decode_cursor, estimate_count, paginate
+
+SEARCH_KINDS = ("motions", "speeches", "mps")
+TEXT_SEARCH_CONFIGS = {"en": "english", "fr": "french"}
+
+# Private-use delimiters survive html.escape() untouched and are then swapped for <mark> tags.
+_START, _STOP = "\ue000", "\ue001"
+TITLE_HEADLINE = f'StartSel="{_START}", StopSel="{_STOP}", HighlightAll=true'
+BODY_HEADLINE = f'StartSel="{_START}", StopSel="{_STOP}", MaxFragments=2, MaxWords=30, MinWords=12'
+
+# Full-text documents: kind -> (model, weight-A column, weight-B column, MP column).
+_DOCUMENTS = {
+    "motions": (Motion, Motion.title, Motion.description, Motion.introduced_by_mp_id),
+    "speeches": (Speech, Speech.title, Speech.content, Speech.mp_id),
+}
+
+
+def parse_kinds(types: Optional[str]) -> List[str]:
+    if types is None:
+        return list(SEARCH_KINDS)
+    kinds = [kind.strip() for kind in types.split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(SEARCH_KINDS))
+    if unknown or not kinds:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown search types: {', '.join(unknown) or '(none)'}",
+        )
+    return kinds
+
+
+def _config(language: str):
+    return cast(literal(TEXT_SEARCH_CONFIGS[language]), REGCONFIG)
+
+
+def _tsquery(text: str, language: str):
+    return func.websearch_to_tsquery(_config(language), text)
+
+
+def _search_statement(text: str, language: str, kinds: Sequence[str], cursor: Optional[str], limit: Optional[int]) -> Select:
+    branches = []
+    query = _tsquery(text, language)
+    for kind in kinds:
+        if kind in _DOCUMENTS:
+            model, title, _, mp_id = _DOCUMENTS[kind]
+            document = getattr(model, f"search_{language}")
+            branches.append(
+                select(
+                    literal(kind).label("kind"),
+                    model.id.label("id"),
+                    title.label("title"),
+                    model.date.label("date"),
+                    mp_id.label("mp_id"),
+                    null().label("detail"),
+                    # Normalization 32 maps rank into [0, 1) so it sits on the same scale as trigram similarity.
+                    func.ts_rank_cd(document, query, 32).label("rank"),
+                ).where(document.op("@@")(query))
+            )
+        elif kind == "mps":
+            pattern = f"%{text}%"
+            branches.append(
+                select(
+                    literal(kind).label("kind"),
+                    MP.id.label("id"),
+                    MP.name.label("title"),
+                    null().label("date"),
+                    MP.id.label("mp_id"),
+                    MP.riding.label("detail"),
+                    func.greatest(func.similarity(MP.name, text), func.similarity(MP.riding, text)).label("rank"),
+                ).where(
+                    or_(
+                        MP.name.op("%")(text),
+                        MP.riding.op("%")(text),
+                        MP.name.ilike(pattern),
+                        MP.riding.ilike(pattern),
+                    )
+                )
+            )
+    hits = union_all(*branches).subquery()
+    statement = select(hits).order_by(hits.c.rank.desc(), hits.c.kind, hits.c.id)
+    if cursor:
+        rank, kind, hit_id = decode_cursor(cursor, float, str, int)
+        statement = statement.where(
+            or_(
+                hits.c.rank < rank,
+                and_(hits.c.rank == rank, or_(hits.c.kind > kind, and_(hits.c.kind == kind, hits.c.id > hit_id))),
+            )
+        )
+    if limit:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _headline_statements(text: str, language: str, rows: Sequence) -> List[Tuple[str, Select]]:
+    """One statement per document kind on the page; headlines are only computed for the rows served."""
+
+    config, query = _config(language), _tsquery(text, language)
+    statements = []
+    for kind, (model, title, body, _) in _DOCUMENTS.items():
+        ids = [row.id for row in rows if row.kind == kind]
+        if ids:
+            statements.append(
+                (
+                    kind,
+                    select(
+                        model.id,
+                        func.ts_headline(config, title, query, TITLE_HEADLINE),
+                        func.ts_headline(config, func.coalesce(body, ""), query, BODY_HEADLINE),
+                    ).where(model.id.in_(ids)),
+                )
+            )
+    return statements
+
+
+def _mark(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return html.escape(text).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def _hits(rows: Sequence, headlines: Dict[Tuple[str, int], Tuple[str, str]]) -> List[SearchHit]:
+    hits = []
+    for row in rows:
+        title, snippet = headlines.get((row.kind, row.id), (None, None))
+        hits.append(
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                title=_mark(title) if title is not None else html.escape(row.title),
+                snippet=_mark(snippet) if snippet is not None else _mark(row.detail),
+                rank=row.rank,
+                date=row.date,
+                mp_id=row.mp_id,
+            )
+        )
+    return hits
+
+
+def _sort_key(row) -> Tuple[float, str, int]:
+    return row.rank, row.kind, row.id
+
+
+class SearchService:
+    """Ranked, highlighted search over motions, speeches and MPs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(self, text: str, language: str, kinds: Sequence[str], limit: int, cursor: Optional[str] = None) -> Page:
+        rows = self.db.execute(_search_statement(text, language, kinds, cursor, limit)).all()
+        page = paginate(rows, limit, _sort_key)
+        headlines = {}
+        for kind, statement in _headline_statements(text, language, page.items):
+            for hit_id, title, snippet in self.db.execute(statement):
+                headlines[(kind, hit_id)] = (title, snippet)
+        page.items = _hits(page.items, headlines)
+        return page
+
+    def count(self, text: str, language: str, kinds: Sequence[str]) -> int:
+        return estimate_count(self.db, _search_statement(text, language, kinds, None, None))
+
+
+class AsyncSearchService:
+    """``SearchService`` on an ``AsyncSession``, used when ``DB_ASYNC`` is enabled."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self, text: str, language: str, kinds: Sequence[str], limit: int, cursor: Optional[str] = None
+    ) -> Page:
+        rows = (await self.db.execute(_search_statement(text, language, kinds, cursor, limit))).all()
+        page = paginate(rows, limit, _sort_key)
+        headlines = {}
+        for kind, statement in _headline_statements(text, language, page.items):
+            for hit_id, title, snippet in await self.db.execute(statement):
+                headlines[(kind, hit_id)] = (title, snippet)
+        page.items = _hits(page.items, headlines)
+        return page
+
+    async def count(self, text: str, language: str, kinds: Sequence[str]) -> int:
+        return await self.db.run_sync(estimate_count, _search_statement(text, language, kinds, None, None))
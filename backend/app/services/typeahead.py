@@ -0,0 +1,159 @@
+"""In-memory typeahead over MP names and ridings.
+
+The MP table is small and only changes at ingest, so every worker keeps the
+whole suggestion set in memory:
+
+* a prefix trie over accent-folded keys whose nodes carry the ids of the
+  best-ranked entries below them, so a completion is one walk of
+  ``len(prefix)`` nodes with no traversal of the subtree;
+* a trigram -> entry map used as a fuzzy fallback when the prefix yields too
+  few results (typos, missing hyphens).
+
+Names are indexed in both "First Last" and "Last First" order and from every
+word start, so "poilievre, pierre", "pierre poi" and "poi" all complete the
+same entry.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+# Share of the query's trigrams an entry must contain to be a fuzzy match.
+FUZZY_THRESHOLD = 0.5
+
+
+def fold(text: str) -> str:
+    """Lower-case, strip accents and reduce punctuation and dashes to single spaces."""
+
+    folded = unicodedata.normalize("NFKD", text)
+    folded = "".join(char for char in folded if not unicodedata.combining(char)).lower()
+    return _NON_ALNUM.sub(" ", folded).strip()
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Word trigrams padded the way pg_trgm pads them, so "blanchett" still shares "  b" with "blanchet"."""
+
+    grams = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def name_keys(name: str) -> List[str]:
+    """Folded keys for a person's name: as written, "Last First" and every word start."""
+
+    if "," in name:
+        # Stored as "Last, First"; index the natural order too.
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    words = fold(name).split()
+    keys = [" ".join(words[i:]) for i in range(len(words))]
+    if len(words) > 1:
+        keys.append(" ".join([words[-1], *words[:-1]]))
+    return keys
+
+
+def phrase_keys(text: str) -> List[str]:
+    words = fold(text).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    id: int
+    name: str
+    riding: str
+    party: str
+    photo_url: Optional[str] = None
+    # "name", "riding" or "fuzzy".
+    match: str = "name"
+
+
+class _Node:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.ids: List[int] = []
+
+
+class TypeaheadIndex:
+    """Immutable once built; safe to share between request threads."""
+
+    def __init__(self, entries: Iterable[Suggestion], max_results: int = 20, version: int = 0):
+        self.version = version
+        self.max_results = max_results
+        self.entries: List[Suggestion] = list(entries)
+        self._names = _Node()
+        self._ridings = _Node()
+        self._trigrams: Dict[str, List[int]] = {}
+        # Entries arrive in rank order, so the first ``max_results`` ids reaching a node are its best ones.
+        for position, entry in enumerate(self.entries):
+            for key in name_keys(entry.name):
+                self._insert(self._names, key, position)
+            for key in phrase_keys(entry.riding):
+                self._insert(self._ridings, key, position)
+            for gram in trigrams(fold(entry.name)) | trigrams(fold(entry.riding)):
+                self._trigrams.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _insert(self, root: _Node, key: str, position: int) -> None:
+        node = root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+            if len(node.ids) < self.max_results and (not node.ids or node.ids[-1] != position):
+                node.ids.append(position)
+
+    @staticmethod
+    def _walk(root: _Node, prefix: str) -> List[int]:
+        node = root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.ids
+
+    def _fuzzy(self, query: str, exclude: Set[int], limit: int) -> List[int]:
+        grams = trigrams(query)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._trigrams.get(gram, ()))
+        needed = FUZZY_THRESHOLD * len(grams)
+        scored: List[Tuple[int, int]] = [
+            (-common, position) for position, common in shared.items() if common >= needed and position not in exclude
+        ]
+        scored.sort()
+        return [position for _, position in scored[:limit]]
+
+    def suggest(self, query: str, limit: int = 8) -> List[Suggestion]:
+        query = fold(query)
+        if not query:
+            return []
+        limit = min(limit, self.max_results)
+        seen: Set[int] = set()
+        results: List[Suggestion] = []
+        for root, match in ((self._names, "name"), (self._ridings, "riding")):
+            for position in self._walk(root, query):
+                if position not in seen and len(results) < limit:
+                    seen.add(position)
+                    entry = self.entries[position]
+                    results.append(entry if entry.match == match else _with_match(entry, match))
+        if len(results) < limit and len(query) >= 3:
+            for position in self._fuzzy(query, seen, limit - len(results)):
+                results.append(_with_match(self.entries[position], "fuzzy"))
+        return results
+
+
+def _with_match(entry: Suggestion, match: str) -> Suggestion:
+    return Suggestion(entry.id, entry.name, entry.riding, entry.party, entry.photo_url, match)
@@ -0,0 +1,132 @@
+"""Load-test the API with sync threadpool handlers versus the async engine.
+
+Starts one uvicorn server per mode (``DB_ASYNC=false`` / ``true``) against the
+same PostgreSQL database, then keeps ``--concurrency`` requests in flight over
+a mix of MP and motion endpoints and reports throughput and latency
+percentiles. The database must already hold data (e.g. from ``ingest.py`` or
+the demo seed). The response cache and ETags are switched off in both
+servers.
+
+Usage (from ``backend/``)::
+
+    DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bench_api_modes --concurrency 200 --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+PATHS = (
+    "/api/mps",
+    "/api/mps/{mp_id}",
+    "/api/mps/{mp_id}/voting-record",
+    "/api/mps/{mp_id}/parliamentary-activity",
+    "/api/motions?limit=20",
+)
+
+
+def _start_server(port: int, async_mode: bool, workers: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DB_ASYNC": "true" if async_mode else "false",
+        "LOAD_DEMO_DATA": "false",
+        "LOG_LEVEL": "WARNING",
+        # Measure the handlers and the database, not cached replays of the same few URLs.
+        "RESPONSE_CACHE_ENABLED": "false",
+        "API_ETAGS_ENABLED": "false",
+    }
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--port", str(port), "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+    ]
+    return subprocess.Popen(command, env=env)
+
+
+def _wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def _load(base_url: str, mp_ids: List[int], total: int, concurrency: int) -> Dict[str, float]:
+    urls = itertools.cycle(
+        path.format(mp_id=mp_id) for mp_id in mp_ids for path in PATHS
+    )
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                url = next(urls)
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes per server")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    for offset, async_mode in enumerate((False, True)):
+        port = args.port + offset
+        base_url = f"http://127.0.0.1:{port}"
+        server = _start_server(port, async_mode, args.workers)
+        try:
+            _wait_ready(base_url)
+            mp_ids = [mp["id"] for mp in httpx.get(f"{base_url}/api/mps", timeout=30.0).json()[:50]] or [1]
+            # Warm connection pools before measuring.
+            asyncio.run(_load(base_url, mp_ids, min(500, args.requests), min(50, args.concurrency)))
+            result = asyncio.run(_load(base_url, mp_ids, args.requests, args.concurrency))
+        finally:
+            server.terminate()
+            server.wait()
+        label = "async" if async_mode else "sync"
+        print(
+            f"{label:>5}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.1f} ms  "
+            f"p99 {result['p99_ms']:7.1f} ms  errors {result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Measure coordinate-to-riding latency of the boundary grid index.
+
+Loads an Elections Canada boundary GeoJSON (or writes a synthetic one of the
+same shape: 343 ridings tiling Canada's bounding box, small and dense around
+the large cities, large in the north, with finely digitized shared borders),
+builds ``RidingBoundaryIndex`` from it the way ``LookupService`` does, then
+times ``locate`` one call at a time over points drawn mostly around the
+cities, the way requests arrive. Reports the build time and latency
+percentiles against the sub-millisecond p99 target, and checks a sample of
+answers against a brute-force scan of every boundary.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_coordinate_lookup --boundaries data/riding_boundaries.geojson
+    python -m benchmarks.bench_coordinate_lookup --ridings 343 --step 0.005
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.services.riding_boundaries import NAME_PROPERTIES, RidingBoundaryIndex, _rings
+
+# Longitude/latitude bounding box and the places most ridings crowd around: (lon, lat, weight, spread in degrees).
+BOUNDS = (-141.0, 42.0, -52.0, 70.0)
+CITIES = (
+    (-79.38, 43.70, 60, 0.35),
+    (-73.60, 45.52, 40, 0.30),
+    (-123.10, 49.25, 25, 0.30),
+    (-114.07, 51.05, 10, 0.20),
+    (-113.50, 53.55, 10, 0.20),
+    (-75.70, 45.42, 10, 0.20),
+    (-71.21, 46.81, 8, 0.20),
+    (-97.14, 49.90, 8, 0.20),
+    (-63.58, 44.65, 5, 0.20),
+    (-80.25, 43.40, 20, 0.60),
+)
+TARGET_P99_MS = 1.0
+VERIFY_SAMPLE = 2000
+
+
+def _density(x: float, y: float) -> float:
+    rural = 0.05 if y < 55 else 0.005
+    return rural + sum(weight * math.exp(-((x - cx) ** 2 + (y - cy) ** 2) / (2 * spread**2)) for cx, cy, weight, spread in CITIES)
+
+
+def _wiggle(t: float, seed: int) -> float:
+    return (math.sin(t * 37.1 + seed) + 0.5 * math.sin(t * 113.7 + seed * 1.7)) / 1.5
+
+
+def _quantiles(values: Sequence[float], weights: Sequence[float], parts: int) -> List[float]:
+    """Split ``values`` (ascending) into ``parts`` runs of equal total weight; return the inner cut points."""
+
+    total = sum(weights)
+    cuts, running, goal = [], 0.0, total / parts
+    for value, weight in zip(values, weights):
+        running += weight
+        if running >= goal and len(cuts) < parts - 1:
+            cuts.append(value)
+            goal += total / parts
+    return cuts
+
+
+def _synthetic_boundaries(ridings: int, step: float) -> Dict:
+    min_x, min_y, max_x, max_y = BOUNDS
+    xs = [min_x + i * step for i in range(int(round((max_x - min_x) / step)) + 1)]
+    coarse_x = xs[:: max(1, len(xs) // 400)]
+    coarse_y = [min_y + i * 0.05 for i in range(int((max_y - min_y) / 0.05))]
+    row_weight = [sum(_density(x, y) for x in coarse_x) for y in coarse_y]
+
+    bands = max(1, round(math.sqrt(ridings / 4)))
+    band_edges = [min_y, *_quantiles(coarse_y, row_weight, bands), max_y]
+    band_weight = [
+        sum(w for y, w in zip(coarse_y, row_weight) if low <= y < high) for low, high in zip(band_edges, band_edges[1:])
+    ]
+    per_band = [max(1, round(ridings * weight / sum(band_weight))) for weight in band_weight]
+    per_band[per_band.index(max(per_band))] += ridings - sum(per_band)
+
+    # Horizontal borders are shared by the bands above and below them, so generate each one once.
+    def horizontal(index: int) -> List[float]:
+        y = band_edges[index]
+        if index in (0, len(band_edges) - 1):
+            return [y] * len(xs)
+        amplitude = 0.2 * min(y - band_edges[index - 1], band_edges[index + 1] - y)
+        return [y + amplitude * _wiggle(x, index) for x in xs]
+
+    borders = [horizontal(index) for index in range(len(band_edges))]
+    features = []
+    for band, count in enumerate(per_band):
+        low, high = band_edges[band], band_edges[band + 1]
+        middle = (low + high) / 2
+        cuts = _quantiles(xs, [_density(x, middle) for x in xs], count)
+        columns = [0, *sorted({bisect.bisect_left(xs, cut) for cut in cuts} - {0, len(xs) - 1}), len(xs) - 1]
+
+        def vertical(column: int, position: int) -> List[Tuple[float, float]]:
+            # Shared by the ridings left and right of it; tapers to meet the horizontal borders exactly.
+            start, end = borders[band][column], borders[band + 1][column]
+            x = xs[column]
+            if column in (0, len(xs) - 1):
+                return [(x, start), (x, end)]
+            neighbours = (x - xs[columns[position - 1]], xs[columns[position + 1]] - x)
+            amplitude = 0.2 * min(neighbours)
+            points = [(x, start)]
+            samples = max(1, int((end - start) / step))
+            for i in range(1, samples):
+                y = start + (end - start) * i / samples
+                points.append((x + amplitude * math.sin(math.pi * i / samples) * _wiggle(y, column), y))
+            points.append((x, end))
+            return points
+
+        for position, (left, right) in enumerate(zip(columns, columns[1:])):
+            bottom = [(xs[i], borders[band][i]) for i in range(left, right + 1)]
+            top = [(xs[i], borders[band + 1][i]) for i in range(right, left - 1, -1)]
+            ring = bottom + vertical(right, position + 1)[1:-1] + top + vertical(left, position)[::-1][1:-1]
+            ring.append(ring[0])
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {"ENNAME": f"Riding {len(features) + 1}"},
+                    "geometry": {"type": "Polygon", "coordinates": [[list(point) for point in ring]]},
+                }
+            )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _points(count: int, seed: int) -> Iterator[Tuple[float, float]]:
+    rng = random.Random(seed)
+    min_x, min_y, max_x, max_y = BOUNDS
+    total = sum(city[2] for city in CITIES)
+    for _ in range(count):
+        if rng.random() < 0.8:
+            pick = rng.uniform(0, total)
+            for x, y, weight, spread in CITIES:
+                pick -= weight
+                if pick <= 0:
+                    break
+            yield rng.gauss(y, spread), rng.gauss(x, spread)
+        else:
+            yield rng.uniform(min_y, max_y), rng.uniform(min_x, max_x)
+
+
+def _outlines(collection: Dict) -> List[Tuple[str, Tuple[float, float, float, float], List[Sequence]]]:
+    outlines = []
+    for feature in collection["features"]:
+        properties = feature.get("properties") or {}
+        name = next((properties[key] for key in NAME_PROPERTIES if properties.get(key)), None)
+        if not name or not feature.get("geometry"):
+            continue
+        rings = list(_rings(feature["geometry"]))
+        xs = [point[0] for ring in rings for point in ring]
+        ys = [point[1] for ring in rings for point in ring]
+        outlines.append((str(name).strip(), (min(xs), min(ys), max(xs), max(ys)), rings))
+    return outlines
+
+
+def _brute_force(outlines: Sequence, latitude: float, longitude: float) -> Optional[str]:
+    """Ray-cast against every vertex of every riding whose bounding box holds the point."""
+
+    for name, (min_x, min_y, max_x, max_y), rings in outlines:
+        if not (min_x <= longitude <= max_x and min_y <= latitude <= max_y):
+            continue
+        inside = False
+        for ring in rings:
+            for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:]):
+                if (y1 > latitude) != (y2 > latitude) and longitude < x1 + (latitude - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+        if inside:
+            return name
+    return None
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boundaries", help="Path to a boundary GeoJSON; a synthetic file is used otherwise.")
+    parser.add_argument("--ridings", type=int, default=343, help="Ridings in the synthetic file.")
+    parser.add_argument("--step", type=float, default=0.005, help="Degrees between border vertices in the synthetic file.")
+    parser.add_argument("--cell-size", type=float, default=0.25, help="Grid cell size in degrees (RIDING_BOUNDARIES_CELL_DEGREES).")
+    parser.add_argument("--lookups", type=int, default=200000, help="Timed locate calls.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        if args.boundaries:
+            path = Path(args.boundaries)
+        else:
+            path = Path(scratch) / "riding_boundaries.geojson"
+            path.write_text(json.dumps(_synthetic_boundaries(args.ridings, args.step)), encoding="utf-8")
+        collection = json.loads(path.read_text(encoding="utf-8"))
+        vertices = sum(len(ring) for feature in collection["features"] for ring in _rings(feature["geometry"]))
+        print(
+            f"file={path.stat().st_size / 1024 / 1024:.1f}MiB ridings={len(collection['features'])} "
+            f"vertices={vertices} cell={args.cell_size}"
+        )
+
+        started = time.perf_counter()
+        index = RidingBoundaryIndex.from_geojson(path, cell_size=args.cell_size)
+        print(f"build={time.perf_counter() - started:.2f}s cells={len(index._grid)}")
+
+    points = list(_points(args.lookups, args.seed))
+    latencies: List[float] = []
+    located = 0
+    for latitude, longitude in points:
+        started = time.perf_counter_ns()
+        riding = index.locate(latitude, longitude)
+        latencies.append((time.perf_counter_ns() - started) / 1e6)
+        located += riding is not None
+    latencies.sort()
+    p99 = _percentile(latencies, 0.99)
+    print(
+        f"lookups={len(points)} located={located} "
+        f"p50={_percentile(latencies, 0.50) * 1000:.1f}us p95={_percentile(latencies, 0.95) * 1000:.1f}us "
+        f"p99={p99 * 1000:.1f}us max={latencies[-1] * 1000:.1f}us "
+        f"({'within' if p99 < TARGET_P99_MS else 'over'} the {TARGET_P99_MS:g}ms p99 target)"
+    )
+
+    outlines = _outlines(collection)
+    sample = points[:VERIFY_SAMPLE]
+    mismatches = sum(index.locate(lat, lon) != _brute_force(outlines, lat, lon) for lat, lon in sample)
+    print(f"verified={len(sample)} mismatches={mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compare per-call httpx clients with the shared ingestion transport.
+
+Starts a local stub server that counts accepted TCP connections (each one is
+a full handshake, and a TLS handshake against the real upstreams), then runs
+the same number of JSON fetches through both strategies. Both call the client
+directly: retries, the per-host rate limiter and the raw archive that
+``fetch_json`` adds on top are left out, so only the transport is compared
+and nothing is written to the archive directory.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_http_transport --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+import httpx
+
+from app.services.data_ingestion.transport import close_http_client, get_http_client
+
+PAYLOAD = json.dumps({"objects": [{"name": "Example", "url": "/politicians/example/"}] * 10}).encode("utf-8")
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):  # noqa: A002 - silence request logging
+        return
+
+
+def _per_call_fetch(url: str):
+    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+
+def _shared_fetch(url: str):
+    response = get_http_client().get(url)
+    response.raise_for_status()
+    return response.json()
+
+
+def _run(label: str, server: _CountingServer, fetch: Callable[[str], object], requests: int) -> None:
+    url = f"http://127.0.0.1:{server.server_address[1]}/politicians/"
+    server.connections = 0
+    started = time.perf_counter()
+    for index in range(requests):
+        fetch(f"{url}?offset={index}")
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<12} requests={requests:<6} connections={server.connections:<6} "
+        f"wall={elapsed:.3f}s per_request={elapsed / requests * 1000:.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = _CountingServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        _run("per-call", server, _per_call_fetch, args.requests)
+        _run("shared", server, _shared_fetch, args.requests)
+    finally:
+        close_http_client()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
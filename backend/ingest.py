@@ -1,35 +1,217 @@
 """Command-line entrypoint for data ingestion pipelines."""
 
+import argparse
 import logging
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
 
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.services.data_ingestion.archive import close_archive, start_replay, stop_replay
+from app.services.data_ingestion.ballots import ingest_ballots
+from app.services.data_ingestion.bulk import UpsertResult
+from app.services.data_ingestion.cache import close_response_cache
+from app.services.data_ingestion.dump import load_dump
 from app.services.data_ingestion.motions import ingest_motions
 from app.services.data_ingestion.mps import ingest_mps
+from app.services.data_ingestion.scheduler import (
+    OK,
+    Stage,
+    StageOutcome,
+    check_cancelled,
+    critical_path,
+    format_summary,
+    run_stages,
+    select_stages,
+    wait_for_abandoned,
+)
 from app.services.data_ingestion.spending import ingest_spending
+from app.services.data_ingestion.state import IngestMode
+from app.services.data_ingestion.telemetry import (
+    StageMetrics,
+    build_report,
+    instrument,
+    prometheus_text,
+    write_json_report,
+)
 from app.services.data_ingestion.transparency import ingest_transparency
+from app.services.data_ingestion.transport import close_http_client
+from app.services.dataset_version import bump_dataset_version
 from app.utils.logging import configure_logging
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
-    session = SessionLocal()
+STAGE_NAMES = ("mps", "motions", "ballots", "spending", "transparency")
+
+
+def _stage_list(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _changed(result: Any) -> bool:
+    if isinstance(result, dict):
+        return any(_changed(value) for value in result.values())
+    if isinstance(result, UpsertResult):
+        return bool(result.inserted or result.updated)
+    # Stages that do not report row counts are assumed to have changed something.
+    return True
+
+
+def bump_version_after(run: Callable[[Session], Any]) -> Callable[[Session], Any]:
+    """Bump the dataset version once a stage has committed changes, so API caches drop stale entries."""
+
+    def versioned(session: Session) -> Any:
+        result = run(session)
+        # A stage abandoned after its timeout must not announce data it did not keep.
+        check_cancelled(session)
+        if _changed(result):
+            bump_dataset_version(session)
+            session.commit()
+        return result
+
+    return versioned
+
+
+def build_stages(mode: IngestMode, backfill_spending: bool = False) -> List[Stage]:
+    # Everything keys off MP rows; ballots additionally need the motions' division URLs.
+    return [
+        Stage("mps", lambda session: ingest_mps(session, mode)),
+        Stage("motions", lambda session: ingest_motions(session, mode), depends_on=("mps",)),
+        Stage("ballots", lambda session: ingest_ballots(session, mode), depends_on=("motions",)),
+        Stage(
+            "spending",
+            lambda session: ingest_spending(session, mode, backfill=backfill_spending),
+            depends_on=("mps",),
+        ),
+        Stage("transparency", lambda session: ingest_transparency(session, mode), depends_on=("mps",)),
+    ]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ingest parliamentary data into the RateMyMP database.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch records that are new or changed since the stored checkpoints.",
+    )
+    mode.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore checkpoints and rebuild from every available record.",
+    )
+    parser.add_argument(
+        "--backfill-spending",
+        action="store_true",
+        help="Load every published spending quarter instead of only the most recent ones.",
+    )
+    parser.add_argument(
+        "--stages",
+        type=_stage_list,
+        help=f"Comma-separated stages to run (default: all of {', '.join(STAGE_NAMES)}).",
+    )
+    parser.add_argument("--skip", type=_stage_list, help="Comma-separated stages to leave out.")
+    parser.add_argument(
+        "--stage-timeout",
+        type=float,
+        help="Seconds each stage may run before it is abandoned (default: INGEST_STAGE_TIMEOUT).",
+    )
+    parser.add_argument(
+        "--from-dump",
+        metavar="PATH",
+        help="Load MPs, bills, votes and ballots from an OpenParliament CSV export directory instead of the API.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARCHIVE",
+        help="Re-run normalization and loading offline from a raw document archive directory.",
+    )
+    parser.add_argument("--report", metavar="PATH", help="Write a JSON run report with per-stage metrics.")
+    parser.add_argument("--prometheus", metavar="PATH", help="Write the run metrics in Prometheus text format.")
+    parser.add_argument("--profile", metavar="DIR", help="Dump cProfile stats for each stage to DIR/<stage>.prof.")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record each stage's tracemalloc peak; stages then run one at a time so peaks are attributable.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    mode = IngestMode.DEFAULT
+    if args.incremental:
+        mode = IngestMode.INCREMENTAL
+    elif args.full:
+        mode = IngestMode.FULL
+
+    if args.from_dump:
+        # The export replaces the API-backed MP, motion and ballot stages and needs no network.
+        stages = [Stage("dump", lambda session: load_dump(session, args.from_dump))]
+    else:
+        try:
+            stages = select_stages(build_stages(mode, args.backfill_spending), args.stages, args.skip)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+
+    metrics = {stage.name: StageMetrics(stage.name) for stage in stages}
+    stages = [
+        Stage(
+            stage.name,
+            instrument(metrics[stage.name], bump_version_after(stage.run), args.profile, args.trace_memory),
+            stage.depends_on,
+            stage.timeout,
+        )
+        for stage in stages
+    ]
+
+    if args.replay:
+        try:
+            start_replay(args.replay)
+        except FileNotFoundError as exc:
+            raise SystemExit(str(exc)) from exc
+
+    started_at = datetime.now(timezone.utc)
+    outcomes: Dict[str, StageOutcome] = {}
+    if args.trace_memory:
+        tracemalloc.start()
     try:
-        logger.info("Starting data ingestion run")
-        mp_count = ingest_mps(session)
-        motion_count = ingest_motions(session)
-        spending_count = ingest_spending(session)
-        transparency_count = ingest_transparency(session)
-        logger.info(
-            "Ingestion complete | MPs=%s Motions=%s Spending=%s Transparency=%s",
-            mp_count,
-            motion_count,
-            spending_count,
-            transparency_count,
+        logger.info("Starting %s data ingestion run: %s", mode.value, ", ".join(stage.name for stage in stages))
+        outcomes = run_stages(
+            stages, SessionLocal, args.stage_timeout, max_parallel=1 if args.trace_memory else None
         )
+        logger.info("Ingestion complete\n%s", format_summary(outcomes))
     finally:
-        session.close()
+        if args.trace_memory:
+            tracemalloc.stop()
+        still_running = wait_for_abandoned(outcomes, settings.INGEST_ABANDONED_STAGE_GRACE)
+        if still_running:
+            # Their threads still use the shared client, cache and archive; the process exit ends them.
+            logger.warning(
+                "Timed-out stage(s) still running: %s; leaving shared HTTP client, cache and archive open",
+                ", ".join(still_running),
+            )
+        else:
+            close_http_client()
+            close_response_cache()
+            close_archive()
+            stop_replay()
+
+    if args.report or args.prometheus:
+        report = build_report(outcomes, metrics, mode.value, started_at, critical_path(outcomes)[0])
+        if args.report:
+            write_json_report(report, args.report)
+        if args.prometheus:
+            with open(args.prometheus, "w", encoding="utf-8") as handle:
+                handle.write(prometheus_text(report))
+    if any(outcome.status != OK for outcome in outcomes.values()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
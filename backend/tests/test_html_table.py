@@ -0,0 +1,54 @@
+"""Streaming table row extraction."""
+
+from __future__ import annotations
+
+from typing import List
+
+from app.services.data_ingestion.html_table import TableRowParser, iter_table_rows
+
+PAGE = """
+<html><body>
+<p>Intro <td>not a cell</td></p>
+<table>
+  <tr><th>Name</th><th>Amount</th></tr>
+  <tr><td> Jane <b>Doe</b> </td><td>1,200 &amp; up</td></tr>
+  <tr><td>Inner<table><tr><td>nested</td></tr></table></td><td>2</td>
+  <tr><td>Unclosed<td>cells
+</table>
+<table><tr><td>second table</td></tr></table>
+</body></html>
+"""
+
+# A nested table's text stays part of the enclosing cell, as with BeautifulSoup's get_text.
+ROWS = [["JaneDoe", "1,200 & up"], ["Innernested", "2"], ["Unclosed", "cells"]]
+
+
+def _chunks(text: str, size: int) -> List[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_rows_of_the_first_table_only() -> None:
+    assert list(iter_table_rows([PAGE])) == ROWS
+
+
+def test_rows_do_not_depend_on_chunk_boundaries() -> None:
+    for size in (1, 2, 3, 7, 64):
+        assert list(iter_table_rows(_chunks(PAGE, size))) == ROWS, size
+
+
+def test_reading_stops_once_the_table_closes() -> None:
+    fed: List[str] = []
+
+    def chunks():
+        for chunk in _chunks(PAGE, 16):
+            fed.append(chunk)
+            yield chunk
+
+    assert list(iter_table_rows(chunks())) == ROWS
+    assert "".join(fed) != PAGE
+
+
+def test_page_without_a_table() -> None:
+    parser = TableRowParser()
+    assert list(iter_table_rows(["<p>No records</p>"], parser)) == []
+    assert not parser.found_table
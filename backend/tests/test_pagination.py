@@ -0,0 +1,49 @@
+"""Keyset cursor encoding and page trimming."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.pagination import decode_cursor, encode_cursor, optional_date, page_size, paginate
+
+
+def test_cursor_round_trip() -> None:
+    token = encode_cursor([date(2024, 3, 1), 42])
+    assert "=" not in token
+    assert decode_cursor(token, optional_date, int) == [date(2024, 3, 1), 42]
+
+
+def test_cursor_keeps_nulls_and_unicode() -> None:
+    token = encode_cursor([None, "Bélanger, Mauril", 7])
+    assert decode_cursor(token, optional_date, str, int) == [None, "Bélanger, Mauril", 7]
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not base64!", encode_cursor([1]), encode_cursor(["not a date", 1]), encode_cursor({"a": 1}), "", "%%%%"],
+)
+def test_malformed_cursor_is_a_400(token: str) -> None:
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(token, optional_date, int)
+    assert error.value.status_code == 400
+
+
+def test_page_size_defaults_and_caps() -> None:
+    assert page_size(None) == settings.API_PAGE_SIZE
+    assert page_size(10) == 10
+    assert page_size(settings.API_MAX_PAGE_SIZE + 1) == settings.API_MAX_PAGE_SIZE
+
+
+def test_paginate_trims_the_lookahead_row() -> None:
+    rows = [(3, "c"), (2, "b"), (1, "a")]
+    page = paginate(rows, 2, lambda row: row)
+    assert page.items == rows[:2]
+    assert decode_cursor(page.next_cursor, int, str) == [2, "b"]
+
+    last = paginate(rows, 3, lambda row: row)
+    assert last.items == rows
+    assert last.next_cursor is None
@@ -0,0 +1,68 @@
+"""Memory-mapped postal code -> riding index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.services.postal_index import PostalCodeIndex, build_index, normalize_postal_code, province_for
+
+SOURCE = """postal_code,riding
+K1A 0A6,Ottawa Centre
+K1A0B1,Ottawa Centre
+k1a-0c2,Ottawa—Vanier
+M5V 3L9,Spadina—Fort York
+X0A 0H0,Nunavut
+H2X,Laurier—Sainte-Marie
+H2X 1Y4,Ville-Marie
+BAD,Nowhere
+A1A 1A1,
+"""
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    source = tmp_path / "postal_codes.csv"
+    source.write_text(SOURCE, encoding="utf-8")
+    destination = tmp_path / "data" / "postal_ridings.idx"
+    assert build_index(source, destination) == (6, 4, 6)
+    assert not destination.with_suffix(".idx.tmp").exists()
+    index = PostalCodeIndex(destination)
+    yield index
+    index.close()
+
+
+def test_exact_postal_codes(index: PostalCodeIndex) -> None:
+    assert index.lookup("K1A0A6") == ("Ottawa Centre", "postal_code")
+    assert index.lookup("K1A0C2") == ("Ottawa—Vanier", "postal_code")
+    assert index.lookup("X0A0H0") == ("Nunavut", "postal_code")
+
+
+def test_unknown_code_falls_back_to_the_fsa_majority(index: PostalCodeIndex) -> None:
+    assert index.lookup("K1A9Z9") == ("Ottawa Centre", "fsa")
+    assert index.lookup("K1A") == ("Ottawa Centre", "fsa")
+
+
+def test_explicit_fsa_row_wins_over_the_majority(index: PostalCodeIndex) -> None:
+    assert index.lookup("H2X1Y4") == ("Ville-Marie", "postal_code")
+    assert index.lookup("H2X2A1") == ("Laurier—Sainte-Marie", "fsa")
+
+
+def test_unknown_fsa(index: PostalCodeIndex) -> None:
+    assert index.lookup("A1A1A1") == (None, None)
+    assert index.lookup("Z9Z9Z9") == (None, None)
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "not_an_index"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        PostalCodeIndex(path)
+
+
+def test_normalize_and_province() -> None:
+    assert normalize_postal_code(" k1a-0b1 ") == "K1A0B1"
+    assert province_for("K1A0B1") == "ON"
+    assert province_for("X0A0H0") == "NU"
+    assert province_for("X1A0A1") == "NT"
@@ -0,0 +1,183 @@
+"""Fail when a service query's plan regresses to a sequential scan.
+
+Builds the schema with ``alembic upgrade head`` in a scratch PostgreSQL schema,
+seeds a scaled synthetic dataset, runs ``ANALYZE``, then asks the planner for
+each hot statement built by the MP, motion and search services
+(``EXPLAIN (FORMAT JSON)``, nothing is executed). Everything happens in one
+transaction that is rolled back, so the database is left as it was; it still
+needs the ``pg_trgm`` extension to be installable.
+
+Skipped unless ``TEST_DATABASE_URL`` points at PostgreSQL::
+
+    TEST_DATABASE_URL=postgresql+psycopg2://... python -m pytest tests/test_query_plans.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Select, create_engine, select, text
+from sqlalchemy.engine import Connection, make_url
+
+from app.models import MP
+from app.services import motion_service, mp_service, search_service
+from app.services.pagination import encode_cursor
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+BASE_DIR = pathlib.Path(__file__).resolve().parents[1]
+SCHEMA = "query_plan_checks"
+PAGE = 50
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL or make_url(DATABASE_URL).get_backend_name() != "postgresql",
+    reason="TEST_DATABASE_URL is not a PostgreSQL URL",
+)
+
+# Row counts at QUERY_PLAN_SCALE=1. The MP count is bounded by the size of
+# Parliament; everything hanging off it grows with the scale.
+SCALE = float(os.environ.get("QUERY_PLAN_SCALE", "1"))
+FIXED_ROWS = ("mps", "votes_per_motion")
+BASE_ROWS = {"mps": 1000, "motions": 10000, "votes_per_motion": 100, "speeches": 100000, "spending": 40000, "filings": 20000}
+
+SEED = (
+    """
+    INSERT INTO mps (id, name, riding, party, is_current)
+    SELECT i, 'Member ' || md5(i::text), 'Riding ' || md5((i * 7)::text), (ARRAY['LPC', 'CPC', 'NDP', 'BQ', 'GPC'])[1 + i % 5], true
+    FROM generate_series(1, :mps) AS i
+    """,
+    """
+    INSERT INTO motions (id, title, description, introduced_by_mp_id, passed, categories, classification, date)
+    SELECT i, 'Motion ' || i, repeat(md5(i::text) || ' ', 3), 1 + i % :mps, i % 2 = 0,
+           CASE WHEN i % 500 = 0 THEN ARRAY['rare'] ELSE ARRAY[(ARRAY['healthcare', 'economy', 'housing', 'environment'])[1 + i % 4]] END::varchar[],
+           'substantive'::motionclassification, CASE WHEN i % 97 = 0 THEN NULL ELSE DATE '2000-01-01' + i % 9000 END
+    FROM generate_series(1, :motions) AS i
+    """,
+    """
+    INSERT INTO vote_records (id, motion_id, mp_id, vote)
+    SELECT (m - 1) * :votes_per_motion + k + 1, m, 1 + (m * 31 + k) % :mps, (ARRAY['yea', 'nay', 'abstain'])[1 + (m + k) % 3]::votechoice
+    FROM generate_series(1, :motions) AS m, generate_series(0, :votes_per_motion - 1) AS k
+    """,
+    """
+    INSERT INTO speeches (id, mp_id, title, content, date)
+    SELECT i, 1 + i % :mps, 'Speech ' || i, repeat(md5((i + 1000000)::text) || ' ', 5), DATE '2000-01-01' + i % 9000
+    FROM generate_series(1, :speeches) AS i
+    """,
+    """
+    INSERT INTO spending_entries (id, mp_id, category, amount, fiscal_year)
+    SELECT i, 1 + i % :mps, 'Travel', (i % 5000)::float, (2000 + i % 25)::text
+    FROM generate_series(1, :spending) AS i
+    """,
+    """
+    INSERT INTO transparency_entries (id, mp_id, registry_type, details, filed_date)
+    SELECT i, 1 + i % :mps, 'Gift', md5(i::text), CASE WHEN i % 11 = 0 THEN NULL ELSE DATE '2000-01-01' + i % 9000 END
+    FROM generate_series(1, :filings) AS i
+    """,
+)
+
+# Few enough rows (a page or two on disk) that the planner may fairly prefer reading them all.
+SMALL_TABLES = ("mps",)
+
+ROWS = {name: count if name in FIXED_ROWS else max(1, int(count * SCALE)) for name, count in BASE_ROWS.items()}
+
+
+def _md5(value: int) -> str:
+    return hashlib.md5(str(value).encode("ascii")).hexdigest()
+
+
+def _checks(rows: Dict[str, int]) -> Iterator[Tuple[str, Callable[[], Select]]]:
+    mp_id = rows["mps"] // 2
+    motion_id = rows["motions"] // 2
+    yield "mps: first page", lambda: mp_service._list_statement(None, None, PAGE)
+    yield "mps: cursor page", lambda: mp_service._list_statement(None, encode_cursor(["Member 8", 0]), PAGE)
+    yield "mps: search", lambda: mp_service._list_statement(_md5(mp_id)[:8], None, PAGE)
+    yield "mps: by id", lambda: select(MP).where(MP.id == mp_id)
+    yield "mps: voting record page", lambda: mp_service._voting_record_statement(mp_id, None, PAGE)
+    yield "mps: profile with activity", lambda: mp_service._profile_statement(mp_id, mp_service.PROFILE_SECTIONS)
+    yield "mps: spending", lambda: mp_service._spending_statement(mp_id)
+    yield "mps: transparency", lambda: mp_service._transparency_statement(mp_id)
+    yield "mps: speeches", lambda: mp_service._speeches_statement(mp_id)
+    yield "motions: first page", lambda: motion_service._list_statement(None, None, PAGE)
+    yield "motions: cursor page", lambda: motion_service._list_statement(
+        None, encode_cursor(["2010-01-01", motion_id]), PAGE
+    )
+    yield "motions: common category", lambda: motion_service._list_statement("economy", None, PAGE)
+    yield "motions: rare category", lambda: motion_service._list_statement("rare", None, PAGE)
+    yield "motions: ballot lookup", lambda: motion_service._vote_statement(motion_id, 1 + (motion_id * 31) % rows["mps"])
+    yield "search: all kinds", lambda: search_service._search_statement(
+        _md5(motion_id), "en", search_service.SEARCH_KINDS, None, PAGE
+    )
+
+
+CHECKS = list(_checks(ROWS))
+
+
+@pytest.fixture(scope="module")
+def connection() -> Iterator[Connection]:
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            # Unqualified names, alembic_version included, now resolve to the scratch schema first;
+            # an already installed pg_trgm stays reachable through public.
+            connection.execute(text(f"SET LOCAL search_path TO {SCHEMA}, public"))
+            config = Config(str(BASE_DIR / "alembic.ini"))
+            config.set_main_option("script_location", str(BASE_DIR / "alembic"))
+            config.attributes["connection"] = connection
+            command.upgrade(config, "head")
+            for statement in SEED:
+                connection.execute(text(statement), ROWS)
+            connection.execute(text("ANALYZE"))
+            yield connection
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+
+def _explain(connection: Connection, statement: Select) -> dict:
+    compiled = statement.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _scans(plan: dict) -> Iterator[dict]:
+    if "Relation Name" in plan or "Index Name" in plan:
+        yield plan
+    for child in plan.get("Plans", ()):
+        yield from _scans(child)
+
+
+def _describe(node: dict) -> str:
+    target = node.get("Index Name") or node.get("Relation Name")
+    return f"{node['Node Type']} on {target}"
+
+
+def _sequential(connection: Connection, statement: Select) -> Tuple[List[dict], str]:
+    scans = list(_scans(_explain(connection, statement)))
+    return [node for node in scans if node["Node Type"] == "Seq Scan"], ", ".join(_describe(node) for node in scans)
+
+
+@pytest.mark.parametrize("build", [build for _, build in CHECKS], ids=[name for name, _ in CHECKS])
+def test_plan_uses_indexes(connection: Connection, build: Callable[[], Select]) -> None:
+    sequential, plan = _sequential(connection, build())
+    assert all(node["Relation Name"] in SMALL_TABLES for node in sequential), plan
+    if sequential:
+        # Reading a small table whole can be the cheapest plan; the index must still be usable.
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        try:
+            sequential, plan = _sequential(connection, build())
+        finally:
+            connection.execute(text("RESET enable_seqscan"))
+        assert not sequential, plan
@@ -0,0 +1,151 @@
+"""Token bucket, AIMD limiter and circuit breaker from the ingestion host policy."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from app.services.data_ingestion import resilience
+from app.services.data_ingestion.resilience import AdaptiveLimiter, CircuitBreaker, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _fake_time(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(resilience.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_token_bucket_allows_a_burst_then_paces_at_the_rate(monkeypatch) -> None:
+    clock = _fake_time(monkeypatch)
+    # A power-of-two rate keeps the fake clock's arithmetic exact.
+    bucket = TokenBucket(rate=4, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == 1000.0
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.now == 1001.25
+
+
+def test_token_bucket_pause_holds_requests(monkeypatch) -> None:
+    clock = _fake_time(monkeypatch)
+    bucket = TokenBucket(rate=4, burst=5)
+    bucket.pause(2.0)
+    bucket.acquire()
+    assert clock.now >= 1002.0
+
+
+def test_token_bucket_without_rate_never_waits(monkeypatch) -> None:
+    clock = _fake_time(monkeypatch)
+    bucket = TokenBucket(rate=0, burst=1)
+    for _ in range(100):
+        bucket.acquire()
+    assert clock.now == 1000.0
+
+
+def test_limiter_grows_after_a_window_of_successes() -> None:
+    limiter = AdaptiveLimiter(initial=2, maximum=3)
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+
+
+def test_limiter_halves_once_per_congestion_burst(monkeypatch) -> None:
+    clock = _fake_time(monkeypatch)
+    limiter = AdaptiveLimiter(initial=8, maximum=16)
+    for _ in range(3):
+        limiter.acquire()
+    for _ in range(3):
+        limiter.release(congested=True)
+    assert limiter.limit == 4
+    clock.now += 2
+    limiter.acquire()
+    limiter.release(congested=True)
+    assert limiter.limit == 2
+    clock.now += 2
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(congested=True)
+        clock.now += 2
+    assert limiter.limit == 1
+
+
+def test_limiter_blocks_beyond_its_limit() -> None:
+    limiter = AdaptiveLimiter(initial=1, maximum=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second() -> None:
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release()
+    assert acquired.wait(1)
+    limiter.release()
+    thread.join(1)
+
+
+def test_breaker_opens_after_the_threshold() -> None:
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    assert not breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_breaker_lets_one_probe_through_after_the_cooldown() -> None:
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    assert breaker.record_failure()
+    started = time.monotonic()
+    breaker.wait_until_allowed()
+    assert time.monotonic() - started >= 0.04
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    waiting = threading.Event()
+    allowed = threading.Event()
+
+    def second_caller() -> None:
+        waiting.set()
+        breaker.wait_until_allowed()
+        allowed.set()
+
+    thread = threading.Thread(target=second_caller, daemon=True)
+    thread.start()
+    waiting.wait(1)
+    assert not allowed.wait(0.05)
+    breaker.record_success()
+    assert allowed.wait(1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    thread.join(1)
+
+
+def test_failed_probe_reopens_the_breaker() -> None:
+    breaker = CircuitBreaker(threshold=5, cooldown=0)
+    for _ in range(5):
+        breaker.record_failure()
+    breaker.wait_until_allowed()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,79 @@
+"""In-process API response cache."""
+
+from __future__ import annotations
+
+from app.core import response_cache
+from app.core.response_cache import CachedResponse, ResponseCache
+
+
+def _entry(body: bytes = b"x", version: int = 1, stored_at: float = 0.0) -> CachedResponse:
+    return CachedResponse(200, [(b"content-type", b"application/json")], body, version, stored_at)
+
+
+def test_key_normalizes_query_order() -> None:
+    assert ResponseCache.key("/api/mps", "b=2&a=1") == ResponseCache.key("/api/mps", "a=1&b=2") == "/api/mps?a=1&b=2"
+    assert ResponseCache.key("/api/mps", "") == "/api/mps"
+
+
+def test_hit_and_miss_counts() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60)
+    assert cache.get("a", 1) is None
+    cache.put("a", _entry(stored_at=response_cache.time.monotonic()))
+    assert cache.get("a", 1).body == b"x"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_older_version_is_never_served() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60)
+    cache.put("a", _entry(version=1, stored_at=response_cache.time.monotonic()))
+    assert cache.get("a", 2) is None
+    assert cache.stale_drops == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_expired_entries_are_dropped(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=5)
+    cache.put("a", _entry(stored_at=now[0]))
+    now[0] += 6
+    assert cache.get("a", 1) is None
+    assert cache.expirations == 1
+
+
+def test_evicts_least_recently_used_by_count_and_bytes() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=10_000, ttl=60)
+    stored_at = response_cache.time.monotonic()
+    cache.put("a", _entry(stored_at=stored_at))
+    cache.put("b", _entry(stored_at=stored_at))
+    cache.get("a", 1)
+    cache.put("c", _entry(stored_at=stored_at))
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) is not None
+    assert cache.evictions == 1
+
+    small = ResponseCache(max_entries=100, max_bytes=800, ttl=60)
+    body = b"y" * 60
+    for key in "abcdefghij":
+        small.put(key, _entry(body, stored_at=stored_at))
+    assert small.stats()["bytes"] <= 800
+    assert small.get("a", 1) is None
+    assert small.get("j", 1) is not None
+
+
+def test_oversized_responses_are_not_stored() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=800, ttl=60)
+    cache.put("a", _entry(b"z" * 200, stored_at=response_cache.time.monotonic()))
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidate_drops_everything_and_rejects_older_puts() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60)
+    stored_at = response_cache.time.monotonic()
+    cache.put("a", _entry(stored_at=stored_at))
+    cache.invalidate(2)
+    assert cache.stats()["entries"] == 0
+    cache.put("b", _entry(version=1, stored_at=stored_at))
+    assert cache.get("b", 1) is None
+    cache.put("b", _entry(version=2, stored_at=stored_at))
+    assert cache.get("b", 2) is not None
@@ -0,0 +1,143 @@
+"""Ingestion stage scheduler: ordering, failure propagation, timeouts and cancellation."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import List
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.data_ingestion.scheduler import (
+    FAILED,
+    OK,
+    SKIPPED,
+    TIMED_OUT,
+    Stage,
+    StageCancelled,
+    critical_path,
+    run_stages,
+    select_stages,
+    wait_for_abandoned,
+)
+
+
+def _recording(log: List[str], name: str, result: object = None):
+    def run(session: Session) -> object:
+        log.append(name)
+        return result
+
+    return run
+
+
+def test_dependencies_run_first_and_results_are_kept() -> None:
+    log: List[str] = []
+    stages = [
+        Stage("c", _recording(log, "c", 3), depends_on=("a", "b")),
+        Stage("a", _recording(log, "a", 1)),
+        Stage("b", _recording(log, "b", 2), depends_on=("a",)),
+    ]
+    outcomes = run_stages(stages, Session, default_timeout=5)
+    assert log == ["a", "b", "c"]
+    assert list(outcomes) == ["c", "a", "b"]
+    assert {name: (outcome.status, outcome.result) for name, outcome in outcomes.items()} == {
+        "a": (OK, 1),
+        "b": (OK, 2),
+        "c": (OK, 3),
+    }
+
+
+def test_failure_skips_only_dependents() -> None:
+    def broken(session: Session) -> None:
+        raise RuntimeError("boom")
+
+    log: List[str] = []
+    stages = [
+        Stage("a", broken),
+        Stage("b", _recording(log, "b"), depends_on=("a",)),
+        Stage("c", _recording(log, "c")),
+    ]
+    outcomes = run_stages(stages, Session, default_timeout=5)
+    assert outcomes["a"].status == FAILED
+    assert str(outcomes["a"].error) == "boom"
+    assert outcomes["b"].status == SKIPPED
+    assert outcomes["c"].status == OK
+    assert log == ["c"]
+
+
+def test_max_parallel_one_runs_stages_one_at_a_time() -> None:
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run(session: Session) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    run_stages([Stage(name, run) for name in "abc"], Session, default_timeout=5, max_parallel=1)
+    assert peak == 1
+
+
+def test_timed_out_stage_is_cancelled_before_it_commits() -> None:
+    release = threading.Event()
+    committed = threading.Event()
+    raised: List[BaseException] = []
+
+    def slow(session: Session) -> None:
+        release.wait(5)
+        try:
+            session.commit()
+        except StageCancelled as exc:
+            raised.append(exc)
+            raise
+        committed.set()
+
+    outcomes = run_stages([Stage("slow", slow, timeout=0.05)], Session)
+    assert outcomes["slow"].status == TIMED_OUT
+    release.set()
+    assert wait_for_abandoned(outcomes, 5) == []
+    assert not committed.is_set()
+    assert len(raised) == 1
+
+
+def test_unknown_dependency_and_cycle_are_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown"):
+        run_stages([Stage("a", _recording([], "a"), depends_on=("missing",))], Session)
+    with pytest.raises(ValueError, match="cycle"):
+        run_stages(
+            [Stage("a", _recording([], "a"), depends_on=("b",)), Stage("b", _recording([], "b"), depends_on=("a",))],
+            Session,
+        )
+
+
+def test_select_stages_drops_dependencies_left_out() -> None:
+    stages = [Stage("a", _recording([], "a")), Stage("b", _recording([], "b"), depends_on=("a",))]
+    chosen = select_stages(stages, only=["b"])
+    assert [(stage.name, stage.depends_on) for stage in chosen] == [("b", ())]
+    with pytest.raises(ValueError, match="Unknown stage"):
+        select_stages(stages, skip=["z"])
+
+
+def test_critical_path_follows_the_longest_chain() -> None:
+    log: List[str] = []
+
+    def sleeper(seconds: float):
+        def run(session: Session) -> None:
+            time.sleep(seconds)
+
+        return run
+
+    stages = [
+        Stage("a", sleeper(0.05)),
+        Stage("b", sleeper(0.05), depends_on=("a",)),
+        Stage("c", _recording(log, "c")),
+    ]
+    path, total = critical_path(run_stages(stages, Session, default_timeout=5))
+    assert path == ["a", "b"]
+    assert total >= 0.1
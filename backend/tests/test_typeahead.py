@@ -0,0 +1,63 @@
+"""Typeahead prefix trie and trigram fallback."""
+
+from __future__ import annotations
+
+from app.services.typeahead import Suggestion, TypeaheadIndex, fold, name_keys, trigrams
+
+ENTRIES = [
+    Suggestion(1, "Poilievre, Pierre", "Carleton", "CPC"),
+    Suggestion(2, "Blanchet, Yves-François", "Beloeil—Chambly", "BQ"),
+    Suggestion(3, "Singh, Jagmeet", "Burnaby South", "NDP"),
+    Suggestion(4, "May, Elizabeth", "Saanich—Gulf Islands", "GPC"),
+    Suggestion(5, "Pierre, Paul", "Carleton Place", "LPC"),
+]
+
+
+def _ids(results) -> list:
+    return [suggestion.id for suggestion in results]
+
+
+def test_fold_strips_accents_case_and_punctuation() -> None:
+    assert fold("  Yves-François  BLANCHET ") == "yves francois blanchet"
+
+
+def test_name_keys_cover_both_orders_and_word_starts() -> None:
+    assert name_keys("Poilievre, Pierre") == ["pierre poilievre", "poilievre", "poilievre pierre"]
+
+
+def test_trigrams_are_padded_like_pg_trgm() -> None:
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+def test_prefix_matches_every_name_order() -> None:
+    index = TypeaheadIndex(ENTRIES)
+    for query in ("poi", "Pierre Poi", "poilievre, pierre"):
+        assert _ids(index.suggest(query))[:1] == [1], query
+
+
+def test_name_matches_rank_before_riding_matches() -> None:
+    results = TypeaheadIndex(ENTRIES).suggest("carleton")
+    assert [(s.id, s.match) for s in results] == [(1, "riding"), (5, "riding")]
+    results = TypeaheadIndex(ENTRIES).suggest("pierre")
+    assert [(s.id, s.match) for s in results] == [(1, "name"), (5, "name")]
+
+
+def test_accent_and_dash_insensitive() -> None:
+    assert _ids(TypeaheadIndex(ENTRIES).suggest("yves francois")) == [2]
+
+
+def test_fuzzy_fallback_for_typos() -> None:
+    results = TypeaheadIndex(ENTRIES).suggest("blanchett")
+    assert [(s.id, s.match) for s in results] == [(2, "fuzzy")]
+
+
+def test_limit_and_max_results() -> None:
+    index = TypeaheadIndex(ENTRIES, max_results=1)
+    assert len(index.suggest("p", limit=8)) == 1
+    assert TypeaheadIndex(ENTRIES).suggest("") == []
+
+
+def test_nodes_keep_the_best_ranked_entries() -> None:
+    entries = [Suggestion(i, f"Smith, Person{i}", f"Riding {i}", "LPC") for i in range(50)]
+    index = TypeaheadIndex(entries, max_results=5)
+    assert _ids(index.suggest("smith", limit=5)) == [0, 1, 2, 3, 4]
@@ -27,6 +27,22 @@ async function handleResponse<T>(response: Response): Promise<T> {
   return response.json();
 }
 
+// List routes return one page at a time; follow X-Next-Cursor to collect every row.
+const MAX_PAGE_SIZE = 500;
+
+async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const separator = url.includes('?') ? '&' : '?';
+    const pageUrl = `${url}${separator}limit=${MAX_PAGE_SIZE}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`;
+    const response = await fetch(pageUrl);
+    items.push(...(await handleResponse<T[]>(response)));
+    cursor = response.headers.get('X-Next-Cursor');
+  } while (cursor);
+  return items;
+}
+
 // Mock data for development
 export const mockMotions: Motion[] = [
   {
@@ -158,9 +174,7 @@ export async function voteOnMotion(motionId: string, vote: 'up' | 'down'): Promi
 
 // MPs API
 export async function getMPs(): Promise<MP[]> {
-  const response = await fetch(`${API_BASE}/mps`);
-  if (!response.ok) throw new Error('Failed to fetch MPs');
-  const data = await response.json();
+  const data = await fetchAllPages<any>(endpoints.mps);
 
   return data.map((mp: any) => ({
     id: mp.id.toString(),
@@ -179,9 +193,7 @@ export async function getMPs(): Promise<MP[]> {
 export async function searchMPs(query: string): Promise<MP[]> {
   const params = new URLSearchParams({ search: query });
   const url = `${endpoints.mps}${query ? `?${params}` : ''}`;
-  const response = await fetch(url);
-  if (!response.ok) throw new Error('Failed to search MPs');
-  const data = await response.json();
+  const data = await fetchAllPages<any>(url);
 
 
   return data.map((mp: any) => ({